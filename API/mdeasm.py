@@ -18,6 +18,7 @@ import logging
 import math
 import os
 import pathlib
+import random
 import re
 import sys
 import time
@@ -127,6 +128,43 @@ def _parse_retry_after_seconds(value, *, now=None):
     return int(math.ceil(delay_s))
 
 
+def _parse_backoff_jitter(value) -> float:
+    """
+    Parse a backoff jitter fraction, clamped to [0.0, 1.0]; missing/invalid values mean 0.0.
+    """
+    try:
+        jitter = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if not math.isfinite(jitter):
+        return 0.0
+    return min(max(jitter, 0.0), 1.0)
+
+
+def _parse_http_pool_maxsize(value) -> int:
+    """
+    Parse a per-host connection pool size; missing/invalid values mean 0 (keep the requests default).
+    """
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return 0
+    return max(size, 0)
+
+
+def _poll_backoff_s(attempt: int, cap: float, jitter: float = 0.0) -> float:
+    """
+    Capped exponential backoff for polling loops, with an optional jitter fraction.
+
+    `jitter` randomizes that fraction of the delay downward (`delay * (1 - jitter * U[0,1))`),
+    so clients throttled together spread out while the sleep never exceeds `cap`.
+    """
+    delay = min(2 ** (attempt - 1), cap)
+    if jitter > 0 and delay > 0:
+        delay -= delay * jitter * random.random()
+    return delay
+
+
 def _extract_last_status_code(exc) -> int | None:
     """
     Best-effort parse of `last_status` codes from helper exception text.
@@ -472,6 +510,14 @@ class Workspaces:
         self._default_retry = kwargs.pop("retry", True)
         self._default_max_retry = kwargs.pop("max_retry", 5)
         self._backoff_max_s = kwargs.pop("backoff_max_s", 30)
+        backoff_jitter = kwargs.pop("backoff_jitter", None)
+        if backoff_jitter is None:
+            backoff_jitter = os.getenv("EASM_BACKOFF_JITTER")
+        self._backoff_jitter = _parse_backoff_jitter(backoff_jitter)
+        http_pool_maxsize = kwargs.pop("http_pool_maxsize", None)
+        if http_pool_maxsize is None:
+            http_pool_maxsize = os.getenv("EASM_HTTP_POOL_MAXSIZE")
+        self._http_pool_maxsize = _parse_http_pool_maxsize(http_pool_maxsize)
         if not (tenant_id and subscription_id and client_id and client_secret):
             missing = []
             if not tenant_id:
@@ -495,6 +541,16 @@ class Workspaces:
         self._default_workspace_name = workspace_name
         # Reuse connections across requests (particularly helpful for paginated exports).
         self._session = requests.Session()
+        if self._http_pool_maxsize > requests.adapters.DEFAULT_POOLSIZE:
+            # Concurrent callers (batch task commands) would otherwise overflow the default
+            # 10-connection pool and drop keep-alive connections instead of reusing them.
+            self._session.mount(
+                "https://",
+                requests.adapters.HTTPAdapter(
+                    pool_connections=requests.adapters.DEFAULT_POOLSIZE,
+                    pool_maxsize=self._http_pool_maxsize,
+                ),
+            )
         self._cp_token = self.__bearer_token__()
         # Some workflows are control-plane only (for example listing workspaces). Allow opting out
         # of data-plane token retrieval so callers don't require unnecessary permissions/scopes.
@@ -1104,9 +1160,11 @@ class Workspaces:
                     token = self._cp_token
                     helper_headers = {"Authorization": f"Bearer {token}"}
 
-            # Backoff before next retry (respect Retry-After when present).
+            # Backoff before next retry (respect Retry-After when present). Full jitter keeps
+            # concurrent clients that were throttled together from retrying in lockstep.
             if attempt < attempts:
-                sleep_s = min(2 ** (attempt - 1), getattr(self, "_backoff_max_s", 30))
+                cap = min(2 ** (attempt - 1), getattr(self, "_backoff_max_s", 30))
+                sleep_s = random.random() * cap
                 try:
                     if r is not None:
                         retry_after_s = _parse_retry_after_seconds(
@@ -1498,7 +1556,9 @@ class Workspaces:
                 retryable = status is None or status in _DISCOVERY_GROUP_RETRYABLE_STATUSES
                 if not retryable or attempt >= attempts:
                     raise
-                sleep_s = min(2 ** (attempt - 1), backoff_cap)
+                sleep_s = _poll_backoff_s(
+                    attempt, backoff_cap, getattr(self, "_backoff_jitter", 0.0)
+                )
                 if sleep_s > 0:
                     time.sleep(sleep_s)
 
@@ -1721,7 +1781,9 @@ class Workspaces:
                     if not retryable:
                         raise
                 if attempt < verify_attempts:
-                    sleep_s = min(2 ** (attempt - 1), verify_backoff_max_s)
+                    sleep_s = _poll_backoff_s(
+                        attempt, verify_backoff_max_s, getattr(self, "_backoff_jitter", 0.0)
+                    )
                     if sleep_s > 0:
                         time.sleep(sleep_s)
             out["verifiedDeleted"] = deleted
@@ -3621,14 +3683,16 @@ class AssetList:
     def __add_asset__(self, cls):
         self.assets.append(cls)
 
-    def as_dicts(self):
-        out = []
+    def iter_dicts(self):
+        # Lazy form of as_dicts(): writers can stream rows without a second full copy in memory.
         for asset in self.assets:
             if hasattr(asset, "as_dict"):
-                out.append(asset.as_dict())
+                yield asset.as_dict()
             else:
-                out.append(dict(vars(asset)))
-        return out
+                yield dict(vars(asset))
+
+    def as_dicts(self):
+        return list(self.iter_dicts())
 
 
 class FacetFilter:
@@ -1,26 +1,27 @@
 #!/usr/bin/python3
 import argparse
-import csv
+import atexit
+import functools
 import hashlib
 import json
 import math
+import operator
 import os
 import random
 import re
+import shutil
 import sys
 import tempfile
+import threading
 import time
-import urllib.parse
+from collections import deque
 from datetime import datetime, timezone
-from email.utils import parsedate_to_datetime
-from importlib.metadata import PackageNotFoundError, version as pkg_version
 from pathlib import Path
 
-import requests
-
 _TASK_TERMINAL_STATES = {"complete", "completed", "failed", "incomplete", "cancelled", "canceled"}
 _TASK_SUCCESS_TERMINAL_STATES = {"complete", "completed"}
 _TASK_FAILURE_TERMINAL_STATES = _TASK_TERMINAL_STATES.difference(_TASK_SUCCESS_TERMINAL_STATES)
+_TASK_ERROR_MAX_DEPTH = 64
 _DOWNLOAD_URL_PRIORITY_KEYS = (
     "downloadurl",
     "downloaduri",
@@ -32,11 +33,58 @@ _DOWNLOAD_URL_PRIORITY_KEYS = (
     "href",
     "link",
 )
-_DEFAULT_RETRY_ON_STATUSES = (408, 425, 429, 500, 502, 503, 504)
-_SHA256_HEX_RE = re.compile(r"^[0-9a-f]{64}$")
-_LAST_STATUS_RE = re.compile(r"\blast_status:\s*([0-9]{3})\b", flags=re.IGNORECASE)
-_LAST_TEXT_RE = re.compile(r"\blast_text:\s*(.+)$", flags=re.IGNORECASE | re.DOTALL)
+_DOWNLOAD_URL_PRIORITY_RANK = {key: rank for rank, key in enumerate(_DOWNLOAD_URL_PRIORITY_KEYS)}
+_DEFAULT_RETRY_ON_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# Artifact downloads are written/hashed in ~1 MiB blocks so per-chunk Python overhead does not
+# dominate SHA-256 throughput when the transport yields small chunks.
+_DOWNLOAD_CHUNK_SIZE_DEFAULT = 1024 * 1024
+_DOWNLOAD_BACKOFF_BASE_S = 0.5
+_ERROR_BODY_SNIPPET_BYTES = 500
+_TASK_POLL_BACKOFF_FACTOR = 1.5
+_TASK_POLL_MAX_INTERVAL_S = 60.0
+# Each sleep is scaled by U[1 - j, 1 + j] so many waiters started together don't poll in lockstep.
+_TASK_POLL_JITTER = 0.2
+# `tasks` subcommands that are one `Workspaces` call on a task id, printed as the raw JSON response.
+_TASK_ACTION_METHODS = {"cancel": "cancel_task", "run": "run_task", "download": "download_task"}
+_ATOMIC_WRITE_BUFFER_BYTES = 1024 * 1024
+# Downloads at least this large reserve their extents up front (see _preallocate).
+_PREALLOCATE_MIN_BYTES = 8 * 1024 * 1024
+# Per-process `Workspaces` clients, only used when `MDEASM_CLI_REUSE_WS` is set.
+_WS_CACHE: dict[tuple, object] = {}
+_WS_CACHE_LOCK = threading.Lock()
+_TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes", "on"})
+# Recent `download_task` responses live on the reused client itself (see `_remember_download_task`),
+# so in-process download -> fetch flows skip a control-plane round-trip while the presigned
+# artifact URL is still fresh, and the entries go away with the client.
+_DL_TASK_CACHE_ATTR = "_cli_download_task_cache"
+_DL_TASK_CACHE_LOCK = threading.Lock()
+_DL_TASK_CACHE_TTL_S = 30.0
+# Outputs awaiting the end-of-run sync in `MDEASM_ATOMIC_FSYNC=batch` mode.
+_BATCHED_FSYNC_PATHS: list[Path] = []
+_NDJSON_WRITE_BATCH_ROWS = 1024
+_HTTP_POOL_SIZE = 32
+# Task ids are used as artifact file names in `tasks fetch-many`; keep them path-safe.
+_ARTIFACT_NAME_UNSAFE_RE = re.compile(r"[^A-Za-z0-9._-]")
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+# Length-preserving ASCII lowercasing for marker lookups (str.lower() can change the length of
+# some non-ASCII text, which would misalign indices into the original message).
+_ASCII_LOWER_TABLE = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+_DOCTOR_REQUIRED_ENV = ("TENANT_ID", "SUBSCRIPTION_ID", "CLIENT_ID", "CLIENT_SECRET")
+_DOCTOR_RECOMMENDED_ENV = ("WORKSPACE_NAME",)
+_DOCTOR_OPTIONAL_ENV = ("EASM_API_VERSION", "EASM_CP_API_VERSION", "EASM_DP_API_VERSION")
+_DOCTOR_ENV_KEYS = _DOCTOR_REQUIRED_ENV + _DOCTOR_RECOMMENDED_ENV + _DOCTOR_OPTIONAL_ENV
+# Everything `Workspaces.__init__` reads from the environment; a change means a fresh client.
+_WS_CACHE_ENV_KEYS = _DOCTOR_ENV_KEYS + (
+    "EASM_BACKOFF_JITTER",
+    "EASM_HTTP_POOL_MAXSIZE",
+    "EASM_REGION",
+    "RESOURCE_GROUP_NAME",
+)
+# Reported as set/unset only; doctor output never echoes these values.
+_DOCTOR_SECRET_ENV = frozenset({"CLIENT_SECRET"})
 _DOCTOR_PROBE_TARGETS = ("workspaces", "assets", "tasks", "data-connections")
+_DEFAULT_DOCTOR_TARGETS = ("workspaces",)
 _DOCTOR_PROBE_TARGET_ALIASES = {
     "workspaces": "workspaces",
     "workspace": "workspaces",
@@ -52,17 +100,90 @@ _DOCTOR_PROBE_TARGET_ALIASES = {
 }
 
 
+# Per-type serialization strategy for `_json_default`, so common fallbacks (datetime, set, ...)
+# don't pay for a raised AttributeError/TypeError on every value.
+_JSON_DEFAULT_KINDS: dict[type, str] = {}
+
+
+def _json_default_kind(cls: type) -> str:
+    kind = _JSON_DEFAULT_KINDS.get(cls)
+    if kind is None:
+        if callable(getattr(cls, "as_dict", None)):
+            kind = "as_dict"
+        elif getattr(cls, "__dictoffset__", 0):
+            # Instances carry a __dict__ (which may still hold a per-instance `as_dict`).
+            kind = "vars"
+        else:
+            kind = "str"
+        _JSON_DEFAULT_KINDS[cls] = kind
+    return kind
+
+
 def _json_default(obj):
     # Best-effort serialization for nested structures returned by the API.
-    try:
-        return obj.as_dict()
-    except Exception:
+    kind = _json_default_kind(type(obj))
+    if kind == "as_dict" or (kind == "vars" and callable(getattr(obj, "as_dict", None))):
+        try:
+            return obj.as_dict()
+        except Exception:
+            pass
+    if kind != "str":
         try:
             return dict(vars(obj))
         except Exception:
-            return str(obj)
+            pass
+    return str(obj)
+
+
+_HTTP_TIMEOUT_HELP = "HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)"
+_WORKSPACE_NAME_HELP = "Workspace name override (default: env WORKSPACE_NAME / helper default)"
+# Top-level command name -> one-line help. Shared by the registrars and the summary-only parser
+# used for top-level help/usage errors, which never needs the subtrees.
+_SUBCOMMAND_HELP = {
+    "doctor": "Environment/auth sanity checks (non-destructive)",
+    "completions": "Generate shell completion scripts for mdeasm",
+    "workspaces": "Workspace operations",
+    "discovery-groups": "Discovery group operations (data plane)",
+    "resource-tags": "Workspace Azure resource tags operations (control plane)",
+    "saved-filters": "Saved filter operations (data plane)",
+    "data-connections": "Data connection operations (Log Analytics / Azure Data Explorer)",
+    "tasks": "Data-plane task operations",
+    "assets": "Asset inventory operations",
+}
+# Shared (immutable) argparse choices; one tuple per value set instead of a list per subparser.
+_FORMAT_JSON_LINES = ("json", "lines")
+_FORMAT_JSON_NDJSON_LINES = ("json", "ndjson", "lines")
+_FORMAT_JSON_LINES_TEXT = ("json", "lines", "text")
+_FORMAT_JSON_TEXT = ("json", "text")
+_EXPORT_FORMATS = ("json", "ndjson", "csv")
+_EXPORT_MODES = ("client", "server")
+_DATA_CONNECTION_KINDS = ("logAnalytics", "azureDataExplorer")
+_DATA_CONNECTION_CONTENTS = ("assets", "attackSurfaceInsights")
+_DATA_CONNECTION_FREQUENCIES = ("daily", "weekly", "monthly")
+# Column order for `--format lines` output; shared by commands that print the same row shape.
+_WORKSPACE_LINE_FIELDS = ("name", "dataPlane", "controlPlane")
+_DISCOVERY_GROUP_LINE_FIELDS = ("name", "tier", "state", "seedCount")
+_DISCOVERY_RUN_LINE_FIELDS = (
+    "name",
+    "state",
+    "submittedDate",
+    "completedDate",
+    "totalAssetsFoundCount",
+)
+_RESOURCE_TAG_LINE_FIELDS = ("workspaceName", "name", "value")
+_SAVED_FILTER_LINE_FIELDS = ("name", "displayName", "filter")
+_DATA_CONNECTION_LINE_FIELDS = (
+    "name",
+    "kind",
+    "content",
+    "frequency",
+    "frequencyOffset",
+    "provisioningState",
+)
+_TASK_LINE_FIELDS = ("id", "state", "startedAt", "completedAt")
 
 
+@functools.lru_cache(maxsize=32)
 def _parse_http_timeout(value: str) -> tuple[float, float]:
     """
     Parse `--http-timeout` as either:
@@ -90,22 +211,58 @@ def _parse_http_timeout(value: str) -> tuple[float, float]:
     return (connect_s, read_s)
 
 
-def _parse_retry_on_statuses(value: str) -> set[int]:
+def _parse_backoff_jitter(value: str) -> float:
+    try:
+        jitter = float((value or "").strip())
+    except ValueError:
+        jitter = math.nan
+    if not math.isfinite(jitter) or not 0.0 <= jitter <= 1.0:
+        raise argparse.ArgumentTypeError("jitter must be between 0.0 and 1.0")
+    return jitter
+
+
+def _parse_poll_backoff_factor(value: str) -> float:
+    try:
+        factor = float((value or "").strip())
+    except ValueError:
+        factor = math.nan
+    if not math.isfinite(factor) or factor < 1.0:
+        raise argparse.ArgumentTypeError("poll backoff factor must be a finite number >= 1.0")
+    return factor
+
+
+def _parse_poll_max_interval_s(value: str) -> float:
+    try:
+        interval_s = float((value or "").strip())
+    except ValueError:
+        interval_s = math.nan
+    if not math.isfinite(interval_s) or interval_s <= 0:
+        raise argparse.ArgumentTypeError("poll max interval must be a finite number > 0")
+    return interval_s
+
+
+def _parse_retry_on_statuses(value: str) -> frozenset[int]:
+    # Used as the argparse `type=`: the override is parsed once, and the unset default is the
+    # shared frozenset itself (argparse only runs `type` on string defaults). Errors are
+    # ArgumentTypeError because argparse only shows the message for that exception type.
     raw = (value or "").strip()
     if not raw:
-        return set(_DEFAULT_RETRY_ON_STATUSES)
+        return _DEFAULT_RETRY_ON_STATUSES
     out: set[int] = set()
     for part in raw.split(","):
         token = part.strip()
         if not token:
             continue
-        code = int(token)
+        try:
+            code = int(token)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid HTTP status code: {token!r}") from None
         if code < 100 or code > 599:
-            raise ValueError(f"invalid HTTP status code: {code}")
+            raise argparse.ArgumentTypeError(f"invalid HTTP status code: {code}")
         out.add(code)
     if not out:
-        raise ValueError("empty retry-on status list")
-    return out
+        raise argparse.ArgumentTypeError("empty retry-on status list")
+    return frozenset(out)
 
 
 def _parse_retry_after_seconds(value, *, now: datetime | None = None) -> int | None:
@@ -115,6 +272,8 @@ def _parse_retry_after_seconds(value, *, now: datetime | None = None) -> int | N
     if raw.isdigit():
         return max(int(raw), 0)
 
+    from email.utils import parsedate_to_datetime  # deferred: HTTP-date Retry-After is rare
+
     try:
         when = parsedate_to_datetime(raw)
     except Exception:
@@ -131,10 +290,16 @@ def _parse_retry_after_seconds(value, *, now: datetime | None = None) -> int | N
     return int(math.ceil(delay_s))
 
 
-def _parse_doctor_probe_targets(value: str) -> list[str]:
+def _parse_doctor_probe_targets(value: str) -> tuple[str, ...]:
     raw = (value or "").strip().lower()
+    # Common inputs return shared read-only tuples without building intermediate state.
     if not raw:
-        return ["workspaces"]
+        return _DEFAULT_DOCTOR_TARGETS
+    if raw == "all":
+        return _DOCTOR_PROBE_TARGETS
+    normalized = _DOCTOR_PROBE_TARGET_ALIASES.get(raw)
+    if normalized == "workspaces":
+        return _DEFAULT_DOCTOR_TARGETS
     targets: list[str] = []
     seen: set[str] = set()
     for part in raw.split(","):
@@ -157,7 +322,7 @@ def _parse_doctor_probe_targets(value: str) -> list[str]:
             targets.append(normalized)
     if not targets:
         raise ValueError("empty probe target list")
-    return targets
+    return tuple(targets)
 
 
 def _payload_items(payload) -> list:
@@ -169,13 +334,45 @@ def _payload_items(payload) -> list:
     return rows if isinstance(rows, list) else []
 
 
+def _iter_paged_items(fetch_page, *, skip: int, max_page_size: int, get_all: bool):
+    """
+    Yield items from a skip/maxpagesize list endpoint one page at a time.
+
+    `fetch_page(skip)` returns a single raw page payload. Only the first page is read unless
+    `get_all`; otherwise paging stops at `totalElements`, an empty page, or a short page.
+    """
+    page = max(int(skip or 0), 0)
+    while True:
+        resp = fetch_page(page)
+        batch = _payload_items(resp)
+        yield from batch
+        if not get_all:
+            return
+        total = resp.get("totalElements") if isinstance(resp, dict) else None
+        try:
+            if total is not None and (page + len(batch)) >= int(total):
+                return
+        except Exception:
+            pass
+        if not batch or len(batch) < max_page_size:
+            return
+        page += len(batch)
+
+
 def _normalize_sha256_hex(value: str) -> str:
     raw = (value or "").strip().lower()
     if not raw:
         return ""
     if raw.startswith("sha256:"):
         raw = raw.split(":", 1)[1].strip()
-    if not _SHA256_HEX_RE.fullmatch(raw):
+    if len(raw) != 64:
+        raise ValueError("sha256 must be a 64-character hex string")
+    try:
+        # fromhex tolerates embedded whitespace, so also require exactly 32 decoded bytes.
+        valid = len(bytes.fromhex(raw)) == 32
+    except ValueError:
+        valid = False
+    if not valid:
         raise ValueError("sha256 must be a 64-character hex string")
     return raw
 
@@ -187,7 +384,9 @@ def _find_dotenv_path(start: Path | None = None) -> Path | None:
     This mirrors `python-dotenv`'s common "search parents" behavior and is useful for
     producing actionable diagnostics in `mdeasm doctor`.
     """
-    cur = (start or Path.cwd()).resolve()
+    # getcwd() already returns a canonical absolute path; only an explicit start needs
+    # resolve(), which lstat()s every path component.
+    cur = start.resolve() if start is not None else Path.cwd()
     for p in [cur, *cur.parents]:
         cand = p / ".env"
         if cand.is_file():
@@ -195,9 +394,13 @@ def _find_dotenv_path(start: Path | None = None) -> Path | None:
     return None
 
 
+@functools.cache
 def _cli_version() -> str:
     # Prefer the installed distribution version (CI installs `-e .`), but fall back to the
-    # upstream helper's `_VERSION` when running directly from a checkout.
+    # upstream helper's `_VERSION` when running directly from a checkout. Cached because the
+    # metadata lookup hits disk; only `--version` asks for it.
+    from importlib.metadata import PackageNotFoundError, version as pkg_version
+
     try:
         return pkg_version("mdeasm")
     except PackageNotFoundError:
@@ -212,12 +415,127 @@ def _cli_version() -> str:
         return "unknown"
 
 
-def _atomic_write_text(path: Path, data: str, *, encoding: str = "utf-8") -> None:
+class _LazyVersionAction(argparse.Action):
+    """
+    `--version` that resolves the version string only when the flag is actually passed.
+    """
+
+    def __init__(
+        self,
+        option_strings,
+        dest=argparse.SUPPRESS,
+        default=argparse.SUPPRESS,
+        help="show program's version number and exit",
+    ):
+        super().__init__(
+            option_strings=option_strings, dest=dest, default=default, nargs=0, help=help
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        formatter = parser._get_formatter()
+        formatter.add_text(f"%(prog)s {_cli_version()}")
+        parser._print_message(formatter.format_help(), sys.stdout)
+        parser.exit()
+
+
+def _resolve_durable_mode(durable: bool | None) -> str:
+    """
+    Map the `durable` argument to a sync mode: "per-file", "batch", or "off".
+
+    Explicit `durable=True/False` wins; otherwise `MDEASM_ATOMIC_FSYNC` selects the mode
+    (`1`/`per-file` syncs each output before its replace, `batch` defers to one pass at exit).
+    """
+    if durable is not None:
+        return "per-file" if durable else "off"
+    # fsync before replace is opt-in for bulk output; it dominates the cost of many small writes.
+    env = (os.getenv("MDEASM_ATOMIC_FSYNC") or "").strip().lower()
+    if env in ("1", "per-file"):
+        return "per-file"
+    if env == "batch":
+        return "batch"
+    return "off"
+
+
+def _fdatasync(fd: int) -> None:
+    # fdatasync skips the inode metadata flush (mtime etc.) when the platform offers it.
+    sync = getattr(os, "fdatasync", None) or os.fsync
+    sync(fd)
+
+
+def _flush_tmp_file(tmp_fh, *, durable: bool | None = None) -> None:
+    tmp_fh.flush()
+    if _resolve_durable_mode(durable) != "per-file":
+        return
+    try:
+        _fdatasync(tmp_fh.fileno())
+    except OSError:
+        # Some filesystems (for example SMB/NFS mounts) may not support fsync; atomic replace
+        # still helps.
+        pass
+
+
+def _fsync_dir(path: Path) -> None:
+    # Persist directory entries (the rename) in addition to the file data.
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _atomic_replace(tmp_path: Path, path: Path, *, durable: bool | None = None) -> None:
+    os.replace(tmp_path, path)
+    mode = _resolve_durable_mode(durable)
+    if mode == "per-file":
+        # The data was synced before the rename; the rename itself is only durable once the
+        # parent directory is.
+        _fsync_dir(path.parent)
+    elif mode == "batch":
+        _BATCHED_FSYNC_PATHS.append(path)
+        if len(_BATCHED_FSYNC_PATHS) == 1:
+            atexit.register(_commit_batched_fsync)
+
+
+def _commit_batched_fsync() -> None:
+    """
+    Sync every output written in `MDEASM_ATOMIC_FSYNC=batch` mode, then each parent directory
+    once so the renames are durable too.
+    """
+    paths = list(dict.fromkeys(_BATCHED_FSYNC_PATHS))
+    _BATCHED_FSYNC_PATHS.clear()
+    parents: dict[Path, None] = {}
+    for path in paths:
+        parents[path.parent] = None
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            _fdatasync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    for parent in parents:
+        _fsync_dir(parent)
+
+
+def _atomic_write_text(
+    path: Path, data: str, *, encoding: str = "utf-8", durable: bool | None = None
+) -> None:
     """
     Best-effort atomic file write.
 
     Write to a temp file in the destination directory, then replace the final path. This avoids
     leaving partially-written output files if the process is interrupted mid-write.
+
+    `durable=True` syncs the temp file before the replace; the default (`None`) follows
+    `MDEASM_ATOMIC_FSYNC` (see `_resolve_durable_mode`).
     """
     tmp_fh = tempfile.NamedTemporaryFile(
         mode="w",
@@ -232,13 +550,8 @@ def _atomic_write_text(path: Path, data: str, *, encoding: str = "utf-8") -> Non
     try:
         with tmp_fh:
             tmp_fh.write(data)
-            tmp_fh.flush()
-            try:
-                os.fsync(tmp_fh.fileno())
-            except OSError:
-                # Some filesystems may not support fsync; atomic replace still helps.
-                pass
-        os.replace(tmp_path, path)
+            _flush_tmp_file(tmp_fh, durable=durable)
+        _atomic_replace(tmp_path, path, durable=durable)
     except Exception:
         try:
             tmp_path.unlink(missing_ok=True)
@@ -247,12 +560,15 @@ def _atomic_write_text(path: Path, data: str, *, encoding: str = "utf-8") -> Non
         raise
 
 
-def _atomic_open_text(path: Path, *, encoding: str = "utf-8", newline: str | None = None):
+def _atomic_open_text(
+    path: Path, *, encoding: str = "utf-8", newline: str | None = None, buffering: int = -1
+):
     """
     Open a temp file handle for atomic writes. Caller must write/close, then we replace `path`.
     """
     tmp_fh = tempfile.NamedTemporaryFile(
         mode="w",
+        buffering=buffering,
         encoding=encoding,
         newline=newline,
         delete=False,
@@ -263,7 +579,8 @@ def _atomic_open_text(path: Path, *, encoding: str = "utf-8", newline: str | Non
     return tmp_fh, Path(tmp_fh.name)
 
 
-def _atomic_open_binary(path: Path):
+def _atomic_open_binary(path: Path, *, size_hint: int = 0):
+    # mkstemp already opens with O_EXCL|O_NOFOLLOW, mode 0600, and a non-inheritable fd.
     tmp_fh = tempfile.NamedTemporaryFile(
         mode="wb",
         delete=False,
@@ -271,38 +588,72 @@ def _atomic_open_binary(path: Path):
         prefix=f".{path.name}.",
         suffix=".tmp",
     )
+    if size_hint:
+        _preallocate(tmp_fh.fileno(), size_hint)
     return tmp_fh, Path(tmp_fh.name)
 
 
+def _preallocate(fd: int, size: int) -> bool:
+    """
+    Reserve `size` bytes of contiguous extents for a large temp file (best-effort).
+
+    posix_fallocate extends the file length, so callers must truncate to the bytes actually
+    written before the rename.
+    """
+    fallocate = getattr(os, "posix_fallocate", None)
+    if fallocate is None or size < _PREALLOCATE_MIN_BYTES:
+        return False
+    try:
+        fallocate(fd, 0, size)
+    except OSError:
+        # Unsupported filesystem (EOPNOTSUPP/EINVAL) or no room: plain appends still work.
+        return False
+    return True
+
+
+def _download_size_hint(resp) -> int:
+    # Content-Length only matches the bytes on disk when the body is not content-encoded.
+    headers = getattr(resp, "headers", None) or {}
+    if str(headers.get("Content-Encoding") or "identity").strip().lower() != "identity":
+        return 0
+    try:
+        return max(int(headers.get("Content-Length") or 0), 0)
+    except (TypeError, ValueError):
+        return 0
+
+
 def _extract_download_url(payload) -> str:
     """
     Best-effort URL extraction from `tasks/{id}:download` response shapes.
     """
-    candidates: list[tuple[str, str]] = []
-
-    def _walk(node, key_hint: str = "") -> None:
+    unranked = len(_DOWNLOAD_URL_PRIORITY_KEYS)
+    best_rank = unranked
+    best_url = ""
+
+    # Iterative pre-order walk (children pushed in reverse) so candidate order matches document
+    # order without recursion.
+    stack: list[tuple[object, str]] = [(payload, "")]
+    while stack:
+        node, key_hint = stack.pop()
         if isinstance(node, dict):
-            for k, v in node.items():
-                _walk(v, key_hint=str(k).strip().lower())
-            return
-        if isinstance(node, list):
-            for item in node:
-                _walk(item, key_hint=key_hint)
-            return
-        if isinstance(node, str):
+            for k, v in reversed(list(node.items())):
+                stack.append((v, str(k).strip().lower()))
+        elif isinstance(node, list):
+            for item in reversed(node):
+                stack.append((item, key_hint))
+        elif isinstance(node, str):
             url = node.strip()
             if url.startswith(("https://", "http://")):
-                candidates.append((key_hint, url))
-
-    _walk(payload)
-    if not candidates:
-        return ""
+                rank = _DOWNLOAD_URL_PRIORITY_RANK.get(key_hint, unranked)
+                if rank == 0:
+                    # Nothing can outrank the first match under the top-priority key.
+                    return url
+                # Strict comparison keeps the first URL seen for each rank (and overall).
+                if rank < best_rank or not best_url:
+                    best_rank = rank
+                    best_url = url
 
-    for preferred_key in _DOWNLOAD_URL_PRIORITY_KEYS:
-        for key, value in candidates:
-            if key == preferred_key:
-                return value
-    return candidates[0][1]
+    return best_url
 
 
 def _redact_text(mdeasm_module, value: str) -> str:
@@ -370,46 +721,90 @@ def _extract_task_terminal_error(payload) -> tuple[str, str]:
     if not isinstance(payload, dict):
         return ("", "")
 
-    queue: list[dict] = [payload]
-    seen: set[int] = set()
+    # Decoded JSON payloads are trees, so a depth cap is enough to bound the walk.
+    queue: deque[tuple[dict, int]] = deque([(payload, 0)])
 
     while queue:
-        node = queue.pop(0)
-        node_id = id(node)
-        if node_id in seen:
-            continue
-        seen.add(node_id)
+        node, depth = queue.popleft()
 
         code, message = _extract_error_code_message(node)
         if code or message:
             return (code, message)
+        if depth >= _TASK_ERROR_MAX_DEPTH:
+            continue
 
         for value in node.values():
             if isinstance(value, dict):
-                queue.append(value)
+                queue.append((value, depth + 1))
             elif isinstance(value, list):
                 for item in value:
                     if isinstance(item, dict):
-                        queue.append(item)
+                        queue.append((item, depth + 1))
 
     return ("", "")
 
 
+def _is_word_char(text: str, index: int) -> bool:
+    if index < 0 or index >= len(text):
+        return False
+    ch = text[index]
+    return ch.isalnum() or ch == "_"
+
+
+def _iter_marker_ends(lower: str, marker: str):
+    """
+    Yield the index just past each occurrence of `marker` that starts on a word boundary.
+    """
+    pos = lower.find(marker)
+    while pos >= 0:
+        if not _is_word_char(lower, pos - 1):
+            yield pos + len(marker)
+        pos = lower.find(marker, pos + 1)
+
+
 def _extract_api_error_details(message: str) -> tuple[int | None, str, str]:
     status = None
     msg = str(message or "")
 
-    status_match = _LAST_STATUS_RE.search(msg)
-    if status_match:
+    # Fast path: the whole message is a JSON error body, so skip the regex scans.
+    stripped = msg.strip()
+    if stripped.startswith("{"):
         try:
-            status = int(status_match.group(1))
-        except Exception:
-            status = None
+            parsed = json.loads(stripped)
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, dict):
+            code, detail = _extract_error_code_message(parsed)
+            if code or detail:
+                raw_status = parsed.get("status", parsed.get("statusCode"))
+                try:
+                    status = int(raw_status) if raw_status is not None else None
+                except (TypeError, ValueError):
+                    status = None
+                return (status, code, detail)
+
+    # Plain substring scans for the `last_status: NNN -- last_text: ...` shape emitted by the
+    # helper; cheaper than running the regex engine over large error bodies.
+    lower = msg.lower() if msg.isascii() else msg.translate(_ASCII_LOWER_TABLE)
+    for pos in _iter_marker_ends(lower, "last_status:"):
+        while pos < len(msg) and msg[pos].isspace():
+            pos += 1
+        digits = msg[pos : pos + 3]
+        if (
+            len(digits) == 3
+            and digits.isascii()
+            and digits.isdigit()
+            and not _is_word_char(msg, pos + 3)
+        ):
+            status = int(digits)
+            break
 
     parse_candidates: list[str] = []
-    text_match = _LAST_TEXT_RE.search(msg)
-    if text_match:
-        parse_candidates.append(text_match.group(1).strip())
+    for pos in _iter_marker_ends(lower, "last_text:"):
+        text = msg[pos:].strip()
+        if text:
+            parse_candidates.append(text)
+        break
     parse_candidates.append(msg)
 
     code = ""
@@ -425,6 +820,10 @@ def _extract_api_error_details(message: str) -> tuple[int | None, str, str]:
     return (status, code, detail)
 
 
+# Same separators as str.split(); sub() collapses them in one pass without a token list.
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+
+
 def _format_cli_error(action: str, exc: Exception, *, mdeasm_module=None) -> str:
     redacted = _redact_text(mdeasm_module, str(exc))
     status, code, detail = _extract_api_error_details(redacted)
@@ -436,7 +835,7 @@ def _format_cli_error(action: str, exc: Exception, *, mdeasm_module=None) -> str
     if detail:
         parts.append(f"message={detail}")
     else:
-        compact = " ".join(redacted.split())
+        compact = _WHITESPACE_RUN_RE.sub(" ", redacted).strip()
         if compact:
             if len(compact) > 500:
                 compact = compact[:497] + "..."
@@ -449,6 +848,61 @@ def _emit_cli_error(action: str, exc: Exception, *, mdeasm_module=None, exit_cod
     return int(exit_code)
 
 
+def _shared_http_session():
+    """
+    Process-wide `requests.Session` used when callers do not provide one.
+
+    Keeps TCP/TLS connections alive across retries and across multiple artifact downloads.
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        with _HTTP_SESSION_LOCK:
+            if _HTTP_SESSION is None:
+                # Deferred: requests (+urllib3/certifi) is most of the CLI's import time, and only
+                # artifact downloads reach this path; --help and parse errors never pay for it.
+                import requests
+
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+def _response_body_snippet(resp, limit: int = _ERROR_BODY_SNIPPET_BYTES) -> str:
+    """
+    Return at most `limit` bytes of an error response body for diagnostics.
+
+    Streamed responses are read through `resp.raw` so a large HTML error page is never pulled
+    fully into memory; `resp.text` is only used when no raw stream is available.
+    """
+    try:
+        raw = getattr(resp, "raw", None)
+        if callable(getattr(raw, "read", None)):
+            raw.decode_content = True
+            return (raw.read(limit) or b"").decode("utf-8", "replace")
+        return str(getattr(resp, "text", "") or "")[:limit]
+    except Exception:
+        return ""
+
+
+class _HashingWriter:
+    """Write-through file wrapper that feeds every block to a hashlib digest."""
+
+    __slots__ = ("_fh", "_update")
+
+    def __init__(self, fh, digest) -> None:
+        self._fh = fh
+        self._update = digest.update
+
+    def write(self, data) -> int:
+        self._update(data)
+        return self._fh.write(data)
+
+
 def _download_url_to_file(
     *,
     url: str,
@@ -457,7 +911,7 @@ def _download_url_to_file(
     retry: bool,
     max_retry: int,
     backoff_max_s: float,
-    retry_on_statuses: set[int] | None,
+    retry_on_statuses: set[int] | frozenset[int] | None,
     chunk_size: int,
     overwrite: bool,
     session=None,
@@ -470,13 +924,15 @@ def _download_url_to_file(
 
     get_fn = getattr(session, "get", None) if session is not None else None
     if not callable(get_fn):
-        get_fn = requests.get
+        get_fn = _shared_http_session().get
 
     attempts = max(int(max_retry or 1), 1) if retry else 1
-    chunk_size = max(int(chunk_size or 65536), 1024)
-    retry_on_statuses = set(retry_on_statuses or _DEFAULT_RETRY_ON_STATUSES)
+    chunk_size = max(int(chunk_size or _DOWNLOAD_CHUNK_SIZE_DEFAULT), 1024)
+    # Only used for membership checks, so avoid copying caller-provided sets.
+    retry_on_statuses = retry_on_statuses or _DEFAULT_RETRY_ON_STATUSES
     last_error = ""
     last_status = None
+    prev_sleep_s = _DOWNLOAD_BACKOFF_BASE_S
 
     for attempt in range(1, attempts + 1):
         should_retry_attempt = False
@@ -498,23 +954,36 @@ def _download_url_to_file(
                 last_status = int(getattr(resp, "status_code", 0) or 0)
 
                 if last_status == 200:
-                    tmp_fh, tmp_path = _atomic_open_binary(out_path)
-                    bytes_written = 0
+                    size_hint = _download_size_hint(resp)
+                    tmp_fh, tmp_path = _atomic_open_binary(out_path, size_hint=size_hint)
                     sha256_digest = hashlib.sha256() if expected_sha256 else None
+                    # With a digest, every block is hashed on its way to disk.
+                    sink = (
+                        tmp_fh if sha256_digest is None else _HashingWriter(tmp_fh, sha256_digest)
+                    )
+
+                    # Let copyfileobj move the raw (content-decoded) stream in `chunk_size` blocks so
+                    # the per-chunk loop stays in C. iter_content is only the fallback for odd
+                    # transports; both write through the same sink.
+                    raw = getattr(resp, "raw", None)
+                    if not callable(getattr(raw, "read", None)):
+                        raw = None
+
                     try:
                         with tmp_fh:
-                            for chunk in resp.iter_content(chunk_size=chunk_size):
-                                if not chunk:
-                                    continue
-                                tmp_fh.write(chunk)
-                                bytes_written += len(chunk)
-                                if sha256_digest is not None:
-                                    sha256_digest.update(chunk)
-                            tmp_fh.flush()
-                            try:
-                                os.fsync(tmp_fh.fileno())
-                            except OSError:
-                                pass
+                            if raw is not None:
+                                raw.decode_content = True
+                                shutil.copyfileobj(raw, sink, chunk_size)
+                            else:
+                                for chunk in resp.iter_content(chunk_size=chunk_size):
+                                    if chunk:
+                                        sink.write(chunk)
+                            bytes_written = tmp_fh.tell()
+                            if size_hint:
+                                # Drop any preallocated tail if the body was shorter than advertised.
+                                tmp_fh.truncate()
+                            # Single-shot artifacts are worth the fsync; a torn download is costly.
+                            _flush_tmp_file(tmp_fh, durable=True)
                         digest_hex = (
                             sha256_digest.hexdigest() if sha256_digest is not None else ""
                         )
@@ -523,7 +992,7 @@ def _download_url_to_file(
                                 "artifact sha256 mismatch "
                                 f"(expected={expected_sha256}, actual={digest_hex})"
                             )
-                        os.replace(tmp_path, out_path)
+                        _atomic_replace(tmp_path, out_path, durable=True)
                     except Exception:
                         try:
                             tmp_path.unlink(missing_ok=True)
@@ -539,11 +1008,7 @@ def _download_url_to_file(
                         "sha256_verified": bool(expected_sha256),
                     }
 
-                body_snippet = ""
-                try:
-                    body_snippet = str(getattr(resp, "text", "") or "")[:500]
-                except Exception:
-                    body_snippet = ""
+                body_snippet = _response_body_snippet(resp)
                 last_error = f"http {last_status}: {body_snippet}"
                 should_retry_attempt = bool(last_status in retry_on_statuses)
                 retry_after_s = _parse_retry_after_seconds(
@@ -565,11 +1030,16 @@ def _download_url_to_file(
                         pass
 
         if attempt < attempts and should_retry_attempt:
+            # Decorrelated jitter: spreads retries from concurrent clients hitting the same
+            # throttled endpoint instead of having them wake up in lockstep.
+            sleep_s = min(
+                float(backoff_max_s or 30),
+                random.uniform(_DOWNLOAD_BACKOFF_BASE_S, prev_sleep_s * 3),
+            )
+            prev_sleep_s = sleep_s
             if retry_after_s is not None:
-                sleep_s = min(float(retry_after_s), 60.0)
-            else:
-                sleep_s = min(2 ** (attempt - 1), float(backoff_max_s or 30))
-                sleep_s += random.uniform(0, min(0.25, sleep_s / 4 if sleep_s else 0.0))
+                # Retry-After is a floor, not a replacement for the jittered delay.
+                sleep_s = max(sleep_s, min(float(retry_after_s), 60.0))
             time.sleep(sleep_s)
             continue
         if not should_retry_attempt:
@@ -580,67 +1050,99 @@ def _download_url_to_file(
     )
 
 
-def _write_json(path: Path | None, payload, *, pretty: bool) -> None:
-    if pretty:
-        data = json.dumps(payload, indent=2, default=_json_default, sort_keys=True)
-    else:
-        # Compact JSON is friendlier for pipes and large payloads.
-        data = json.dumps(payload, default=_json_default, sort_keys=True, separators=(",", ":"))
+def _write_json(path: Path | None, payload, *, pretty: bool, durable: bool | None = None) -> None:
+    def write_payload(out_fh) -> None:
+        if pretty:
+            # Indented output always takes the pure-Python encoder; `json.dump` at least streams
+            # its chunks instead of building the whole document as one string.
+            json.dump(payload, out_fh, default=_json_default, sort_keys=True, indent=2)
+        else:
+            # Compact JSON is friendlier for pipes and large payloads. `json.dump` never uses the
+            # C encoder (only one-shot `encode` does), so encode in one call: ~3x faster.
+            out_fh.write(
+                json.JSONEncoder(
+                    default=_json_default, sort_keys=True, separators=(",", ":")
+                ).encode(payload)
+            )
+        out_fh.write("\n")
+
     if path is None:
-        sys.stdout.write(data + "\n")
-    else:
-        _atomic_write_text(path, data + "\n", encoding="utf-8")
+        write_payload(sys.stdout)
+        return
+
+    tmp_fh, tmp_path = _atomic_open_text(
+        path, encoding="utf-8", newline="\n", buffering=_ATOMIC_WRITE_BUFFER_BYTES
+    )
+    try:
+        with tmp_fh:
+            write_payload(tmp_fh)
+            _flush_tmp_file(tmp_fh, durable=durable)
+        _atomic_replace(tmp_path, path, durable=durable)
+    except Exception:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except Exception:
+            pass
+        raise
 
 
-def _write_json_array_stream(path: Path | None, rows, *, pretty: bool) -> None:
-    def _row_text(row) -> str:
-        if pretty:
-            return json.dumps(row, indent=2, default=_json_default, sort_keys=True)
-        return json.dumps(row, default=_json_default, sort_keys=True, separators=(",", ":"))
+def _write_json_array_stream(
+    path: Path | None,
+    rows,
+    *,
+    pretty: bool,
+    durable: bool | None = None,
+    buffer_stdout: bool = False,
+) -> None:
+    """
+    Write `rows` as a JSON array without holding the encoded document in memory.
 
-    if path is None:
-        out_fh = sys.stdout
-        out_fh.write("[\n" if pretty else "[")
+    Files are written atomically. On stdout, a lazy `rows` iterator that fails midway leaves a
+    truncated array behind; `buffer_stdout=True` collects the rows first so stdout stays
+    all-or-nothing (list commands, whose pages are fetched as they are written).
+    """
+    # One encoder for the whole stream; `json.dumps` with custom options builds a new one per call.
+    if pretty:
+        encoder = json.JSONEncoder(indent=2, default=_json_default, sort_keys=True)
+    else:
+        encoder = json.JSONEncoder(default=_json_default, sort_keys=True, separators=(",", ":"))
+
+    def write_rows(out_fh) -> None:
         first = True
         for row in rows:
-            if not first:
+            if first:
+                out_fh.write("[\n" if pretty else "[")
+                first = False
+            else:
                 out_fh.write(",\n" if pretty else ",")
-            first = False
-            row_text = _row_text(row)
+            row_text = encoder.encode(row)
             if pretty:
-                out_fh.write("\n".join(f"  {line}" for line in row_text.splitlines()))
+                # Newlines only occur between tokens (string contents are escaped), so a single
+                # replace re-indents the row under the array.
+                out_fh.write("  " + row_text.replace("\n", "\n  "))
             else:
                 out_fh.write(row_text)
-        if pretty:
-            out_fh.write("\n]\n")
+        if first:
+            # Match json.dumps for an empty list.
+            out_fh.write("[]\n")
         else:
-            out_fh.write("]\n")
+            out_fh.write("\n]\n" if pretty else "]\n")
+
+    if path is None:
+        if buffer_stdout:
+            rows = list(rows)
+        write_rows(sys.stdout)
         return
 
-    tmp_fh, tmp_path = _atomic_open_text(path, encoding="utf-8", newline="\n")
+    # Two short writes per row (separator + row); a 1 MiB buffer coalesces them like the CSV path.
+    tmp_fh, tmp_path = _atomic_open_text(
+        path, encoding="utf-8", newline="\n", buffering=_ATOMIC_WRITE_BUFFER_BYTES
+    )
     try:
         with tmp_fh:
-            tmp_fh.write("[\n" if pretty else "[")
-            first = True
-            for row in rows:
-                if not first:
-                    tmp_fh.write(",\n" if pretty else ",")
-                first = False
-                row_text = _row_text(row)
-                if pretty:
-                    tmp_fh.write("\n".join(f"  {line}" for line in row_text.splitlines()))
-                else:
-                    tmp_fh.write(row_text)
-            if pretty:
-                tmp_fh.write("\n]\n")
-            else:
-                tmp_fh.write("]\n")
-            tmp_fh.flush()
-            try:
-                os.fsync(tmp_fh.fileno())
-            except OSError:
-                pass
-        os.replace(tmp_path, path)
+            write_rows(tmp_fh)
+            _flush_tmp_file(tmp_fh, durable=durable)
+        _atomic_replace(tmp_path, path, durable=durable)
     except Exception:
         try:
             tmp_path.unlink(missing_ok=True)
@@ -649,29 +1151,39 @@ def _write_json_array_stream(path: Path | None, rows, *, pretty: bool) -> None:
         raise
 
 
-def _write_ndjson(path: Path | None, rows) -> None:
+def _write_ndjson(path: Path | None, rows, *, durable: bool | None = None) -> None:
+    encoder = json.JSONEncoder(default=_json_default, sort_keys=True, separators=(",", ":"))
+
+    def write_rows(out_fh) -> None:
+        # Temp-file path only: batch rows into one write to cut per-row write/concat overhead on
+        # large exports (the file only becomes visible at the atomic rename anyway).
+        batch: list[str] = []
+        for row in rows:
+            batch.append(encoder.encode(row))
+            if len(batch) >= _NDJSON_WRITE_BATCH_ROWS:
+                batch.append("")
+                out_fh.write("\n".join(batch))
+                batch.clear()
+        if batch:
+            batch.append("")
+            out_fh.write("\n".join(batch))
+
     if path is None:
-        out_fh = sys.stdout
+        # Row at a time: pipelines (`| head`, `| jq`) see rows as pages arrive, and rows already
+        # encoded are never held back if a later page fails.
+        write = sys.stdout.write
         for row in rows:
-            out_fh.write(
-                json.dumps(row, default=_json_default, sort_keys=True, separators=(",", ":")) + "\n"
-            )
+            write(encoder.encode(row) + "\n")
         return
 
-    tmp_fh, tmp_path = _atomic_open_text(path, encoding="utf-8", newline="\n")
+    tmp_fh, tmp_path = _atomic_open_text(
+        path, encoding="utf-8", newline="\n", buffering=_ATOMIC_WRITE_BUFFER_BYTES
+    )
     try:
         with tmp_fh:
-            for row in rows:
-                tmp_fh.write(
-                    json.dumps(row, default=_json_default, sort_keys=True, separators=(",", ":"))
-                    + "\n"
-                )
-            tmp_fh.flush()
-            try:
-                os.fsync(tmp_fh.fileno())
-            except OSError:
-                pass
-        os.replace(tmp_path, path)
+            write_rows(tmp_fh)
+            _flush_tmp_file(tmp_fh, durable=durable)
+        _atomic_replace(tmp_path, path, durable=durable)
     except Exception:
         try:
             tmp_path.unlink(missing_ok=True)
@@ -681,12 +1193,13 @@ def _write_ndjson(path: Path | None, rows) -> None:
 
 
 def _write_lines(path: Path | None, lines: list[str]) -> None:
+    if not isinstance(lines, (list, tuple)):
+        lines = list(lines)
+    # One C-level join and a single write instead of per-line formatting/writes.
+    data = "\n".join(map(str, lines)) + "\n" if lines else ""
     if path is None:
-        out_fh = sys.stdout
-        for line in lines:
-            out_fh.write(str(line) + "\n")
+        sys.stdout.write(data)
         return
-    data = "".join(f"{line}\n" for line in lines)
     _atomic_write_text(path, data, encoding="utf-8")
 
 
@@ -802,7 +1315,8 @@ def _render_completion_script(parser: argparse.ArgumentParser, *, shell: str) ->
     return "\n".join(lines)
 
 
-def _read_columns_file(path: Path) -> list[str]:
+def _read_lines_file(path: Path) -> list[str]:
+    """Non-empty lines of a UTF-8 text file, stripped, skipping `#` comment lines."""
     cols: list[str] = []
     for raw in path.read_text(encoding="utf-8").splitlines():
         line = raw.strip()
@@ -834,7 +1348,7 @@ def _read_schema_baseline(path: Path) -> list[str]:
         except json.JSONDecodeError as e:
             raise ValueError(f"invalid baseline json: {e}") from e
     else:
-        as_list = _read_columns_file(path)
+        as_list = _read_lines_file(path)
 
     # Dedup while preserving input order.
     return _parse_columns_arg(as_list)
@@ -909,21 +1423,12 @@ def _parse_columns_arg(values: list[str] | None) -> list[str]:
     """
     if not values:
         return []
-    out: list[str] = []
-    for v in values:
-        for part in (v or "").split(","):
-            col = part.strip()
-            if col:
-                out.append(col)
-    # Dedup while preserving order.
-    seen: set[str] = set()
-    deduped: list[str] = []
-    for c in out:
-        if c in seen:
-            continue
-        seen.add(c)
-        deduped.append(c)
-    return deduped
+    # dict.fromkeys dedups while preserving first-seen order in a single pass.
+    return list(
+        dict.fromkeys(
+            col for v in values for part in (v or "").split(",") if (col := part.strip())
+        )
+    )
 
 
 def _parse_resume_from(value: str) -> dict:
@@ -977,6 +1482,16 @@ def _parse_resume_from(value: str) -> dict:
         return {"mark": raw}
 
 
+def _str_attr(obj, name: str, *, strip: bool = True) -> str:
+    """`str(getattr(obj, name, "") or "")`, optionally stripped; skips `str()` for str values."""
+    value = getattr(obj, name, None)
+    if not value:
+        return ""
+    if type(value) is not str:
+        value = str(value)
+    return value.strip() if strip else value
+
+
 def _build_ws_kwargs(args) -> dict:
     ws_kwargs = {}
     if getattr(args, "workspace_name", ""):
@@ -989,17 +1504,19 @@ def _build_ws_kwargs(args) -> dict:
         ws_kwargs["cp_api_version"] = args.cp_api_version
     if getattr(args, "http_timeout", None) is not None:
         ws_kwargs["http_timeout"] = args.http_timeout
-    if getattr(args, "no_retry", False):
+    if not getattr(args, "retry", True):
         ws_kwargs["retry"] = False
     if getattr(args, "max_retry", None) is not None:
         ws_kwargs["max_retry"] = args.max_retry
     if getattr(args, "backoff_max_s", None) is not None:
         ws_kwargs["backoff_max_s"] = args.backoff_max_s
+    if getattr(args, "backoff_jitter", None) is not None:
+        ws_kwargs["backoff_jitter"] = args.backoff_jitter
     return ws_kwargs
 
 
 def _resolve_cli_log_level(args) -> str | None:
-    level = str(getattr(args, "log_level", "") or "").strip()
+    level = _str_attr(args, "log_level")
     if level:
         return level
     verbose = int(getattr(args, "verbose", 0) or 0)
@@ -1016,6 +1533,60 @@ def _configure_cli_logging(mdeasm_module, args) -> None:
         mdeasm_module.configure_logging(level)
 
 
+def _load_mdeasm(args):
+    # Imported per command so `--help` and `doctor` work without requiring env/config.
+    import mdeasm
+
+    _configure_cli_logging(mdeasm, args)
+    return mdeasm
+
+
+def _ws_reuse_enabled() -> bool:
+    return (os.getenv("MDEASM_CLI_REUSE_WS") or "").strip().lower() in _TRUTHY_ENV_VALUES
+
+
+def _new_workspaces(mdeasm_module, args, **overrides):
+    """
+    Build a `Workspaces` client from the shared API flags plus per-command overrides.
+
+    With `MDEASM_CLI_REUSE_WS=1`, clients are cached per process so repeated `main()` calls
+    (wrappers, embedding) skip the token fetch and session setup; the key covers the kwargs and
+    the credential env vars the helper reads, so a changed config still gets a fresh client.
+    """
+    ws_kwargs = _build_ws_kwargs(args)
+    ws_kwargs.update(overrides)
+    if not _ws_reuse_enabled():
+        return mdeasm_module.Workspaces(**ws_kwargs)
+
+    workspaces_cls = mdeasm_module.Workspaces
+    key = (
+        workspaces_cls,
+        tuple(sorted((k, repr(v)) for k, v in ws_kwargs.items())),
+        tuple(os.getenv(k) for k in _WS_CACHE_ENV_KEYS),
+    )
+    with _WS_CACHE_LOCK:
+        ws = _WS_CACHE.get(key)
+        if ws is None:
+            ws = _WS_CACHE[key] = workspaces_cls(**ws_kwargs)
+            return ws
+    _reset_asset_lists(ws, getattr(mdeasm_module, "AssetList", None))
+    return ws
+
+
+def _reset_asset_lists(ws, asset_list_cls) -> None:
+    """
+    Drop the asset lists a previous command left on a reused client.
+
+    `get_workspace_assets` appends to an existing `AssetList` attribute instead of replacing
+    it, so without this every export/schema/doctor run on a cached client would accumulate rows.
+    """
+    if not isinstance(asset_list_cls, type):
+        return
+    for name, value in list(getattr(ws, "__dict__", {}).items()):
+        if isinstance(value, asset_list_cls):
+            delattr(ws, name)
+
+
 def _resolve_out_path(value: str) -> Path | None:
     raw = str(value or "").strip()
     if not raw or raw == "-":
@@ -1023,23 +1594,44 @@ def _resolve_out_path(value: str) -> Path | None:
     return Path(raw)
 
 
+_LINE_CELL_WHITESPACE_RE = re.compile(r"[\t\r\n]+")
+
+
 def _normalize_line_cell(value) -> str:
     text = "" if value is None else str(value)
     if not text:
         return ""
     # Keep tab-delimited output parseable even when fields contain control whitespace.
-    return re.sub(r"[\t\r\n]+", " ", text).strip()
+    return _LINE_CELL_WHITESPACE_RE.sub(" ", text).strip()
+
+
+@functools.lru_cache(maxsize=64)
+def _tab_line_formatter(fields: tuple[str, ...]):
+    """Build a row -> tab-joined line function for a fixed field tuple.
+
+    The field list, the ``""`` default and the join are bound once, so each row costs one
+    ``map`` over ``dict.get`` instead of a generator frame per cell. Cached per field tuple.
+    """
+    defaults = ("",) * len(fields)
+    join = "\t".join
+    normalize = _normalize_line_cell
+
+    def format_row(row: dict) -> str:
+        return join(map(normalize, map(row.get, fields, defaults)))
+
+    return format_row
 
 
-def _rows_to_tab_lines(rows: list[dict], fields: list[str]) -> list[str]:
-    return ["\t".join(_normalize_line_cell(row.get(field, "")) for field in fields) for row in rows]
+def _rows_to_tab_lines(rows: list[dict], fields: tuple[str, ...] | list[str]) -> list[str]:
+    # tuple() is a no-op for the module-level *_LINE_FIELDS constants.
+    return list(map(_tab_line_formatter(tuple(fields)), rows))
 
 
 def _build_data_connection_properties(args) -> dict:
-    kind = str(getattr(args, "kind", "") or "")
+    kind = _str_attr(args, "kind", strip=False)
     if kind == "logAnalytics":
-        workspace_id = str(getattr(args, "workspace_id", "") or "").strip()
-        api_key = str(getattr(args, "api_key", "") or "").strip()
+        workspace_id = _str_attr(args, "workspace_id")
+        api_key = _str_attr(args, "api_key")
         if not workspace_id:
             raise ValueError("logAnalytics requires --workspace-id")
         if not api_key:
@@ -1047,9 +1639,9 @@ def _build_data_connection_properties(args) -> dict:
         return {"workspaceId": workspace_id, "apiKey": api_key}
 
     if kind == "azureDataExplorer":
-        cluster_name = str(getattr(args, "cluster_name", "") or "").strip()
-        database_name = str(getattr(args, "database_name", "") or "").strip()
-        region = str(getattr(args, "region", "") or "").strip()
+        cluster_name = _str_attr(args, "cluster_name")
+        database_name = _str_attr(args, "database_name")
+        region = _str_attr(args, "region")
         if not cluster_name:
             raise ValueError("azureDataExplorer requires --cluster-name")
         if not database_name:
@@ -1066,8 +1658,8 @@ def _build_data_connection_properties(args) -> dict:
 
 
 def _build_discovery_custom_payload(args) -> dict:
-    inline_payload = str(getattr(args, "custom_json", "") or "").strip()
-    payload_path = str(getattr(args, "custom_json_file", "") or "").strip()
+    inline_payload = _str_attr(args, "custom_json")
+    payload_path = _str_attr(args, "custom_json_file")
     if inline_payload and payload_path:
         raise ValueError("use only one of --custom-json or --custom-json-file")
     if not inline_payload and not payload_path:
@@ -1121,99 +1713,404 @@ def _discovery_runs_to_rows(payload) -> list[dict]:
     return rows
 
 
-def _wait_for_task_state(
-    ws,
-    *,
-    task_id: str,
-    workspace_name: str,
-    poll_interval_s: float,
-    timeout_s: float,
-):
-    started = time.monotonic()
-    last = ws.get_task(task_id, workspace_name=workspace_name, noprint=True)
-    while True:
-        state = str((last or {}).get("state", "")).strip().lower()
-        if state in _TASK_TERMINAL_STATES:
-            return last
-        if timeout_s > 0 and (time.monotonic() - started) >= timeout_s:
-            raise TimeoutError(
-                f"timed out waiting for task {task_id} after {timeout_s}s (last state={state or 'unknown'})"
-            )
-        time.sleep(max(poll_interval_s, 0.1))
-        last = ws.get_task(task_id, workspace_name=workspace_name, noprint=True)
-
+def _elapsed_ms(start_ns: int) -> int:
+    """Whole milliseconds since a ``time.monotonic_ns()`` reading (integer math, never negative)."""
+    return (time.monotonic_ns() - start_ns) // 1_000_000
 
-def _write_csv(path: Path | None, rows: list[dict], *, columns: list[str] | None = None) -> None:
-    # Union-of-keys header to avoid silently dropping columns, unless columns are explicit.
-    fieldnames: list[str] = columns or sorted({k for r in rows for k in r.keys()})
 
-    def write_rows(out_fh) -> None:
-        writer = csv.DictWriter(out_fh, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        for row in rows:
-            cooked = {}
-            for k in fieldnames:
-                v = row.get(k)
-                if isinstance(v, (dict, list)):
-                    cooked[k] = json.dumps(v, default=_json_default, sort_keys=True)
-                else:
-                    cooked[k] = v
-            writer.writerow(cooked)
+def _task_state(task) -> str:
+    # Fast path for the usual payload shape; anything else keeps the defensive str() coercion.
+    if type(task) is dict:
+        state = task.get("state", "")
+        if type(state) is str:
+            return state.strip().lower()
+    return str((task or {}).get("state", "")).strip().lower()
 
-    if path is None:
-        write_rows(sys.stdout)
-        return
 
-    tmp_fh, tmp_path = _atomic_open_text(path, encoding="utf-8", newline="")
-    try:
-        with tmp_fh:
-            write_rows(tmp_fh)
-            tmp_fh.flush()
-            try:
-                os.fsync(tmp_fh.fileno())
-            except OSError:
-                pass
-        os.replace(tmp_path, path)
-    except Exception:
-        try:
-            tmp_path.unlink(missing_ok=True)
-        except Exception:
-            pass
-        raise
+class _CheckpointWriter:
+    """
+    `assets export --checkpoint-out` progress callback with debounced writes.
 
+    Each write is an atomic temp-file + rename, so per-page writes dominate fast exports. States
+    arriving within `min_interval_s` of the last write are held and only the newest is kept; the
+    final (`last`) state is written immediately and `flush()` persists anything still pending.
+    """
 
-def _write_csv_stream(path: Path | None, rows, *, columns: list[str]) -> None:
-    # Streaming CSV requires explicit columns because the header cannot be inferred without
-    # buffering all rows.
-    fieldnames: list[str] = list(columns)
+    __slots__ = ("_path", "_min_interval_s", "_last_write", "_written", "_pending")
 
-    def write_rows(out_fh) -> None:
-        writer = csv.DictWriter(out_fh, fieldnames=fieldnames, extrasaction="ignore")
-        writer.writeheader()
-        for row in rows:
-            cooked = {}
-            for k in fieldnames:
-                v = row.get(k) if isinstance(row, dict) else None
-                if isinstance(v, (dict, list)):
-                    cooked[k] = json.dumps(v, default=_json_default, sort_keys=True)
-                else:
-                    cooked[k] = v
-            writer.writerow(cooked)
+    def __init__(self, path: Path, *, min_interval_s: float) -> None:
+        self._path = path
+        self._min_interval_s = min_interval_s
+        self._last_write = -math.inf
+        self._written = None
+        self._pending = None
 
-    if path is None:
-        write_rows(sys.stdout)
-        return
+    def __call__(self, state) -> None:
+        payload = {
+            "next_page": state.get("next_page"),
+            "next_mark": state.get("next_mark"),
+            "pages_completed": state.get("pages_completed"),
+            "assets_emitted": state.get("assets_emitted"),
+            "total_elements": state.get("total_elements"),
+            "last": bool(state.get("last")),
+        }
+        if payload == self._written:
+            self._pending = None
+            return
+        self._pending = payload
+        if payload["last"] or time.monotonic() - self._last_write >= self._min_interval_s:
+            self.flush()
 
-    tmp_fh, tmp_path = _atomic_open_text(path, encoding="utf-8", newline="")
+    def flush(self) -> None:
+        payload = self._pending
+        if payload is None:
+            return
+        _atomic_write_text(
+            self._path,
+            json.dumps(payload, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        self._written = payload
+        self._pending = None
+        self._last_write = time.monotonic()
+
+
+def _collect_task_ids(args) -> list[str]:
+    # Positional id first, then --task-ids, then the file; duplicates keep their first position.
+    raw = [getattr(args, "task_id", "") or "", *str(args.task_ids or "").split(",")]
+    if args.task_ids_from:
+        raw.extend(_read_lines_file(Path(args.task_ids_from)))
+    return list(dict.fromkeys(tid for tid in map(str.strip, raw) if tid))
+
+
+def _remember_download_task(ws, task_id: str, workspace_name: str, payload) -> None:
+    # A fresh per-command client can never be asked again, so only reused clients keep entries.
+    if not _ws_reuse_enabled():
+        return
+    with _DL_TASK_CACHE_LOCK:
+        cache = getattr(ws, _DL_TASK_CACHE_ATTR, None)
+        if cache is None:
+            cache = {}
+            try:
+                setattr(ws, _DL_TASK_CACHE_ATTR, cache)
+            except (AttributeError, TypeError):
+                return
+        cache[(workspace_name, task_id)] = (time.monotonic(), payload)
+
+
+def _dl_task_cache_ttl_s() -> float:
+    try:
+        ttl_s = float(os.getenv("MDEASM_CLI_DL_CACHE_TTL_S") or _DL_TASK_CACHE_TTL_S)
+    except ValueError:
+        return _DL_TASK_CACHE_TTL_S
+    return ttl_s if math.isfinite(ttl_s) else _DL_TASK_CACHE_TTL_S
+
+
+def _download_task_cached(ws, task_id: str, workspace_name: str, *, ttl_s: float | None = None):
+    """
+    `ws.download_task(...)`, reusing this client's response for the task if under `ttl_s` old.
+
+    Only reused clients (`MDEASM_CLI_REUSE_WS`) cache. `ttl_s` defaults to
+    `MDEASM_CLI_DL_CACHE_TTL_S` (30s); `ttl_s <= 0` always calls through.
+    """
+    if ttl_s is None:
+        ttl_s = _dl_task_cache_ttl_s()
+    if ttl_s > 0 and _ws_reuse_enabled():
+        now = time.monotonic()
+        with _DL_TASK_CACHE_LOCK:
+            cache = getattr(ws, _DL_TASK_CACHE_ATTR, None) or {}
+            for k in [k for k, entry in cache.items() if now - entry[0] >= ttl_s]:
+                del cache[k]
+            entry = cache.get((workspace_name, task_id))
+        if entry is not None:
+            return entry[1]
+    payload = ws.download_task(task_id, workspace_name=workspace_name, noprint=True)
+    _remember_download_task(ws, task_id, workspace_name, payload)
+    return payload
+
+
+def _artifact_download_kwargs(ws, args) -> dict:
+    """`_download_url_to_file` transport settings from CLI flags, else the helper defaults."""
+    return {
+        "timeout": args.http_timeout or getattr(ws, "_http_timeout", (10.0, 60.0)),
+        "retry": bool(args.retry),
+        "max_retry": (
+            int(args.max_retry)
+            if args.max_retry is not None
+            else int(getattr(ws, "_default_max_retry", 5))
+        ),
+        "backoff_max_s": (
+            float(args.backoff_max_s)
+            if args.backoff_max_s is not None
+            else float(getattr(ws, "_backoff_max_s", 30))
+        ),
+        "retry_on_statuses": args.retry_on_statuses,
+        "chunk_size": args.chunk_size,
+        "overwrite": bool(args.overwrite),
+        "session": getattr(ws, "_session", None),
+        "auth_token": _str_attr(ws, "_dp_token", strip=False),
+    }
+
+
+def _artifact_fetch_summary(
+    task_id: str,
+    artifact_path: Path,
+    artifact_url: str,
+    result: dict,
+    *,
+    expected_sha256: str = "",
+    mdeasm_module=None,
+) -> dict:
+    import urllib.parse
+
+    parsed = urllib.parse.urlparse(artifact_url)
+    redacted_url = artifact_url
+    redactor = getattr(mdeasm_module, "redact_sensitive_text", None)
+    if callable(redactor):
+        redacted_url = redactor(artifact_url)
+    summary = {
+        "task_id": task_id,
+        "artifact_out": str(artifact_path),
+        "bytes_written": int(result.get("bytes_written", 0)),
+        "status_code": int(result.get("status_code", 0)),
+        "used_bearer_auth": bool(result.get("used_bearer_auth", False)),
+        "download_host": parsed.netloc,
+        "download_url": redacted_url,
+    }
+    if expected_sha256:
+        summary["sha256"] = str(result.get("sha256", ""))
+        summary["sha256_verified"] = bool(result.get("sha256_verified", False))
+    return summary
+
+
+def _run_task_batch(fn, task_ids: list[str], concurrency) -> list[tuple[object, Exception | None]]:
+    """
+    Call `fn(task_id)` for every id, up to `concurrency` at a time; `(result, error)` per id.
+
+    Outcomes keep input order, and one failing id never stops the rest of the batch.
+    """
+
+    def run(task_id: str):
+        try:
+            return fn(task_id), None
+        except Exception as e:
+            return None, e
+
+    workers = min(max(int(concurrency or 1), 1), len(task_ids))
+    if workers <= 1:
+        return list(map(run, task_ids))
+    # Each id is an independent network round-trip (plus disk for downloads) that releases the
+    # GIL, so threads bound the wall time by the slowest batch rather than the sum.
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run, task_ids))
+
+
+def _artifact_stems(task_ids: list[str]) -> dict[str, str]:
+    """
+    Map task ids to distinct, path-safe artifact file stems.
+
+    Unsafe characters become `_`. Ids whose stems would collide (also case-insensitively, for
+    case-folding filesystems) or reduce to dots only get a short hash of the raw id appended,
+    so no two downloads in a batch can target the same file.
+    """
+    stems = {task_id: _ARTIFACT_NAME_UNSAFE_RE.sub("_", task_id) for task_id in task_ids}
+    counts: dict[str, int] = {}
+    for stem in stems.values():
+        counts[stem.casefold()] = counts.get(stem.casefold(), 0) + 1
+    for task_id, stem in stems.items():
+        if counts[stem.casefold()] > 1 or not stem.strip("."):
+            digest = hashlib.sha256(task_id.encode("utf-8")).hexdigest()[:12]
+            stems[task_id] = f"{stem}-{digest}" if stem.strip(".") else f"task-{digest}"
+    return stems
+
+
+def _fetch_task_artifacts(ws, task_ids: list[str], args, *, mdeasm_module=None) -> int:
+    """Download several task artifacts into `--artifact-dir` concurrently; write one summary array.
+
+    Each artifact is named after its task id (see `_artifact_stems`) plus the extension of the
+    artifact URL path. Failed tasks are reported on stderr and leave the rest of the batch running.
+    """
+    import urllib.parse
+
+    artifact_dir = Path(args.artifact_dir)
+    download_kwargs = _artifact_download_kwargs(ws, args)
+    # Names are fixed for the whole batch before any download starts.
+    stems = _artifact_stems(task_ids)
+
+    def fetch(task_id: str):
+        payload = _download_task_cached(ws, task_id, args.workspace_name)
+        artifact_url = _extract_download_url(payload)
+        if not artifact_url:
+            raise RuntimeError("task download response did not contain a usable artifact URL")
+        suffix = Path(urllib.parse.urlparse(artifact_url).path).suffix
+        artifact_path = artifact_dir / f"{stems[task_id]}{suffix}"
+        result = _download_url_to_file(url=artifact_url, out_path=artifact_path, **download_kwargs)
+        return _artifact_fetch_summary(
+            task_id, artifact_path, artifact_url, result, mdeasm_module=mdeasm_module
+        )
+
+    summaries = []
+    failed = 0
+    outcomes = _run_task_batch(fetch, task_ids, args.concurrency)
+    for task_id, (summary, err) in zip(task_ids, outcomes):
+        if err is not None:
+            failed += 1
+            _emit_cli_error(f"tasks fetch-many {task_id}", err, mdeasm_module=mdeasm_module)
+        else:
+            summaries.append(summary)
+    _write_json(_resolve_out_path(args.out), summaries, pretty=True)
+    return 1 if failed else 0
+
+
+def _write_task_batch(ws, task_ids: list[str], args, out_path, *, mdeasm_module=None) -> int:
+    """Fetch several tasks concurrently and write the successes as one JSON array (input order)."""
+
+    def fetch(task_id: str):
+        return ws.get_task(task_id, workspace_name=args.workspace_name, noprint=True)
+
+    payloads = []
+    failed = 0
+    outcomes = _run_task_batch(fetch, task_ids, args.concurrency)
+    for task_id, (payload, err) in zip(task_ids, outcomes):
+        if err is not None:
+            failed += 1
+            _emit_cli_error(f"tasks get {task_id}", err, mdeasm_module=mdeasm_module)
+        else:
+            payloads.append(payload)
+    _write_json(out_path, payloads, pretty=True)
+    return 1 if failed else 0
+
+
+def _wait_for_task_state(
+    ws,
+    *,
+    task_id: str,
+    workspace_name: str,
+    poll_interval_s: float,
+    timeout_s: float,
+    backoff_factor: float = _TASK_POLL_BACKOFF_FACTOR,
+    max_interval_s: float = _TASK_POLL_MAX_INTERVAL_S,
+    jitter: float = _TASK_POLL_JITTER,
+):
+    # A deadline of +inf makes "no timeout" fall out of the same comparison as a real one.
+    deadline = time.monotonic() + timeout_s if timeout_s > 0 else math.inf
+    # Most tasks finish within the first few polls; long-running ones back off geometrically so a
+    # multi-minute wait issues O(log n) requests instead of one every `poll_interval_s`.
+    base_delay_s = max(poll_interval_s, 0.1)
+    delay_s = base_delay_s
+    # Non-finite knobs (only reachable from direct callers; the CLI parsers reject them) would
+    # otherwise grow the delay to inf and turn a no-timeout wait into time.sleep(inf).
+    if not math.isfinite(max_interval_s):
+        max_interval_s = _TASK_POLL_MAX_INTERVAL_S
+    max_delay_s = max(base_delay_s, max_interval_s)
+    factor = backoff_factor if math.isfinite(backoff_factor) and backoff_factor > 1.0 else 1.0
+    last = ws.get_task(task_id, workspace_name=workspace_name, noprint=True)
+    last_state = None
+    while True:
+        state = _task_state(last)
+        if state in _TASK_TERMINAL_STATES:
+            return last
+        if state != last_state:
+            # The task moved (e.g. queued -> running): it is making progress, so look again soon.
+            delay_s = base_delay_s
+            last_state = state
+        remaining_s = deadline - time.monotonic()
+        if remaining_s <= 0:
+            raise TimeoutError(
+                f"timed out waiting for task {task_id} after {timeout_s}s (last state={state or 'unknown'})"
+            )
+        sleep_s = delay_s * random.uniform(1.0 - jitter, 1.0 + jitter) if jitter > 0 else delay_s
+        # Jitter spreads waiters out but never past the configured cap.
+        sleep_s = min(sleep_s, max_delay_s)
+        # Don't oversleep the deadline just because the interval has grown.
+        time.sleep(sleep_s if sleep_s < remaining_s else remaining_s)
+        delay_s = min(delay_s * factor, max_delay_s)
+        last = ws.get_task(task_id, workspace_name=workspace_name, noprint=True)
+
+
+def _row_key_union(rows) -> list[str]:
+    # set.update consumes each dict's keys in C; avoids the per-key bytecode of a nested set
+    # comprehension on wide/large result sets. Accepts any iterable, so rows can be streamed.
+    keys: set[str] = set()
+    update = keys.update
+    for r in rows:
+        update(r)
+    return sorted(keys)
+
+
+def _csv_row_extractor(fieldnames: list[str]):
+    """Build a row -> cell list function for a fixed CSV header.
+
+    Rows carrying every column take an itemgetter fast path (one C call, no per-key
+    ``dict.get``); rows missing a column fall back to ``dict.get`` so they yield empty
+    cells. Non-dict rows become an all-empty row.
+    """
+    # One encoder for every nested cell; json.dumps(default=...) builds a new one per call.
+    # Default separators/ensure_ascii keep the cell text identical to json.dumps output.
+    # Scalar cells are handed to csv.writer as-is: its QUOTE_MINIMAL scan runs in C and beats
+    # any Python-level bypass, and QUOTE_NONNUMERIC would change the output bytes.
+    encode = json.JSONEncoder(default=_json_default, sort_keys=True).encode
+    nested = (dict, list)
+    empty_row = [None] * len(fieldnames)
+    if not fieldnames:
+        return lambda row: []
+    getter = operator.itemgetter(*fieldnames)
+    single = len(fieldnames) == 1
+
+    def extract(row) -> list:
+        # Exact dicts only: itemgetter on a defaultdict would insert missing keys.
+        if type(row) is dict:
+            try:
+                values = getter(row)
+            except KeyError:
+                values = map(row.get, fieldnames)
+            else:
+                if single:
+                    values = (values,)
+        elif isinstance(row, dict):
+            values = map(row.get, fieldnames)
+        else:
+            return empty_row
+        return [encode(v) if isinstance(v, nested) else v for v in values]
+
+    return extract
+
+
+def _write_csv(
+    path: Path | None,
+    rows: list[dict],
+    *,
+    columns: list[str] | None = None,
+    durable: bool | None = None,
+) -> None:
+    # Union-of-keys header to avoid silently dropping columns, unless columns are explicit.
+    import csv  # deferred: only CSV exports need it, keep CLI startup lean
+
+    fieldnames: list[str] = columns or _row_key_union(rows)
+
+    def write_rows(out_fh) -> None:
+        # Plain csv.writer with one list per row: same bytes as DictWriter(extrasaction="ignore")
+        # without building an intermediate dict per row.
+        writer = csv.writer(out_fh)
+        writer.writerow(fieldnames)
+        # writerows drives map() from C; the extractor is compiled once for the header.
+        writer.writerows(map(_csv_row_extractor(fieldnames), rows))
+
+    if path is None:
+        write_rows(sys.stdout)
+        return
+
+    # csv.writer issues one short write per row; a 1 MiB buffer coalesces them into few syscalls.
+    tmp_fh, tmp_path = _atomic_open_text(
+        path, encoding="utf-8", newline="", buffering=_ATOMIC_WRITE_BUFFER_BYTES
+    )
     try:
         with tmp_fh:
             write_rows(tmp_fh)
-            tmp_fh.flush()
-            try:
-                os.fsync(tmp_fh.fileno())
-            except OSError:
-                pass
-        os.replace(tmp_path, path)
+            _flush_tmp_file(tmp_fh, durable=durable)
+        _atomic_replace(tmp_path, path, durable=durable)
     except Exception:
         try:
             tmp_path.unlink(missing_ok=True)
@@ -1222,17 +2119,166 @@ def _write_csv_stream(path: Path | None, rows, *, columns: list[str]) -> None:
         raise
 
 
-def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(
-        description="Small CLI for MDEASM helper workflows (exports/automation).",
+def _write_csv_stream(
+    path: Path | None, rows, *, columns: list[str], durable: bool | None = None
+) -> None:
+    # Streaming CSV requires explicit columns because the header cannot be inferred without
+    # buffering all rows.
+    import csv  # deferred: only CSV exports need it, keep CLI startup lean
+
+    fieldnames: list[str] = list(columns)
+
+    def write_rows(out_fh) -> None:
+        writer = csv.writer(out_fh)
+        writer.writerow(fieldnames)
+        # writerows drives map() from C; the extractor is compiled once for the header.
+        writer.writerows(map(_csv_row_extractor(fieldnames), rows))
+
+    if path is None:
+        write_rows(sys.stdout)
+        return
+
+    # csv.writer issues one short write per row; a 1 MiB buffer coalesces them into few syscalls.
+    tmp_fh, tmp_path = _atomic_open_text(
+        path, encoding="utf-8", newline="", buffering=_ATOMIC_WRITE_BUFFER_BYTES
     )
-    p.add_argument("--version", action="version", version=f"%(prog)s {_cli_version()}")
-    sub = p.add_subparsers(dest="cmd", required=True)
+    try:
+        with tmp_fh:
+            write_rows(tmp_fh)
+            _flush_tmp_file(tmp_fh, durable=durable)
+        _atomic_replace(tmp_path, path, durable=durable)
+    except Exception:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except Exception:
+            pass
+        raise
+
+
+# (flags, add_argument kwargs) for blocks that several subparsers declare verbatim.
+_TASK_POLL_ARGS = (
+    (
+        ("--poll-backoff-factor",),
+        {
+            "type": _parse_poll_backoff_factor,
+            "default": _TASK_POLL_BACKOFF_FACTOR,
+            "help": "Polling interval growth factor per unchanged poll (default: 1.5)",
+        },
+    ),
+    (
+        ("--poll-max-interval-s",),
+        {
+            "type": _parse_poll_max_interval_s,
+            "default": _TASK_POLL_MAX_INTERVAL_S,
+            "help": "Cap on the polling interval seconds (default: 60)",
+        },
+    ),
+)
+_LIST_PAGING_ARGS = (
+    (("--get-all",), {"action": "store_true", "help": "Fetch all pages"}),
+    (("--page",), {"type": int, "default": 0, "help": "Starting page (skip)"}),
+    (("--max-page-size",), {"type": int, "default": 25, "help": "Max page size (1-100)"}),
+)
+
+
+def _add_arg_specs(p: argparse.ArgumentParser, specs) -> None:
+    for flags, kwargs in specs:
+        p.add_argument(*flags, **kwargs)
+
+
+def _add_logging_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="Increase log verbosity (repeatable; maps to INFO/DEBUG)",
+    )
+    p.add_argument(
+        "--log-level",
+        default="",
+        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
+    )
+
+
+def _add_api_args(p: argparse.ArgumentParser, *, data_plane: bool) -> None:
+    """
+    Add the api-version and HTTP reliability flags shared by every networked command.
+
+    `data_plane=False` omits `--dp-api-version` for control-plane-only commands.
+    """
+    p.add_argument(
+        "--api-version",
+        default=None,
+        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
+    )
+    if data_plane:
+        p.add_argument(
+            "--dp-api-version",
+            default=None,
+            help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
+        )
+    p.add_argument(
+        "--cp-api-version",
+        default=None,
+        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
+    )
+    p.add_argument(
+        "--http-timeout",
+        type=_parse_http_timeout,
+        default=None,
+        help=_HTTP_TIMEOUT_HELP,
+    )
+    p.add_argument(
+        "--retry",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Retry transient HTTP failures with backoff; --no-retry disables it",
+    )
+    p.add_argument(
+        "--max-retry",
+        type=int,
+        default=None,
+        help="Max retry attempts when retry is enabled (default: helper default)",
+    )
+    p.add_argument(
+        "--backoff-max-s",
+        type=float,
+        default=None,
+        help="Max backoff sleep seconds between retries (default: helper default)",
+    )
+    p.add_argument(
+        "--backoff-jitter",
+        type=_parse_backoff_jitter,
+        default=None,
+        help=(
+            "Fraction (0.0-1.0) of each run-poll/verify backoff delay to randomize "
+            "(default: env EASM_BACKOFF_JITTER or 0)"
+        ),
+    )
+
+
+@functools.cache
+def _common_parent(*, data_plane: bool) -> argparse.ArgumentParser:
+    # Built once and shared via `parents=[...]`: argparse attaches these same Action objects to
+    # every subparser instead of re-running add_argument's option/kwarg processing. Caching is
+    # only safe because nothing mutates the shared actions after construction (no per-command
+    # set_defaults/help edits on them); a subparser needing different options must add its own.
+    p = argparse.ArgumentParser(add_help=False)
+    _add_logging_args(p)
+    _add_api_args(p, data_plane=data_plane)
+    return p
 
-    doctor = sub.add_parser("doctor", help="Environment/auth sanity checks (non-destructive)")
+
+def _register_doctor(sub) -> None:
+    doctor = sub.add_parser(
+        "doctor",
+        help=_SUBCOMMAND_HELP["doctor"],
+        parents=[_common_parent(data_plane=False)],
+    )
     doctor.add_argument(
         "--format",
-        choices=["json", "text"],
+        choices=_FORMAT_JSON_TEXT,
         default="json",
         help="Output format (default: json)",
     )
@@ -1267,250 +2313,94 @@ def build_parser() -> argparse.ArgumentParser:
             "(default: env WORKSPACE_NAME / helper default)"
         ),
     )
-    doctor.add_argument(
-        "-v",
-        "--verbose",
-        action="count",
-        default=0,
-        help="Increase log verbosity (repeatable; maps to INFO/DEBUG)",
-    )
-    doctor.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    doctor.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    doctor.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    doctor.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    doctor.add_argument(
-        "--no-retry",
-        action="store_true",
-        help="Disable HTTP retry/backoff (default: enabled)",
-    )
-    doctor.add_argument(
-        "--max-retry",
-        type=int,
-        default=None,
-        help="Max retry attempts when retry is enabled (default: helper default)",
-    )
-    doctor.add_argument(
-        "--backoff-max-s",
-        type=float,
-        default=None,
-        help="Max backoff sleep seconds between retries (default: helper default)",
-    )
 
+
+def _register_completions(sub) -> None:
     completions = sub.add_parser(
         "completions",
-        help="Generate shell completion scripts for mdeasm",
+        help=_SUBCOMMAND_HELP["completions"],
     )
     completions.add_argument(
         "shell",
-        choices=["bash", "zsh"],
+        choices=("bash", "zsh"),
         help="Target shell completion format",
     )
     completions.add_argument("--out", default="", help="Output path (default: stdout)")
 
-    workspaces = sub.add_parser("workspaces", help="Workspace operations")
+
+def _register_workspaces(sub) -> None:
+    workspaces = sub.add_parser("workspaces", help=_SUBCOMMAND_HELP["workspaces"])
     workspaces_sub = workspaces.add_subparsers(dest="workspaces_cmd", required=True)
 
     ws_list = workspaces_sub.add_parser(
-        "list", help="List available workspaces (stdout-safe structured output)"
+        "list",
+        help="List available workspaces (stdout-safe structured output)",
+        parents=[_common_parent(data_plane=False)],
     )
     ws_list.add_argument(
         "--format",
-        choices=["json", "lines"],
+        choices=_FORMAT_JSON_LINES,
         default="json",
         help="Output format (default: json)",
     )
-    ws_list.add_argument(
-        "-v",
-        "--verbose",
-        action="count",
-        default=0,
-        help="Increase log verbosity (repeatable; maps to INFO/DEBUG)",
+    ws_list.add_argument("--out", default="", help="Output path (default: stdout)")
+
+    ws_delete = workspaces_sub.add_parser(
+        "delete",
+        help="Delete a workspace (control-plane operation)",
+        parents=[_common_parent(data_plane=False)],
     )
-    ws_list.add_argument(
-        "--log-level",
+    ws_delete.add_argument("name", help="Workspace name")
+    ws_delete.add_argument(
+        "--resource-group-name",
         default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
+        help="Optional resource group name override",
     )
-    ws_list.add_argument("--out", default="", help="Output path (default: stdout)")
-    ws_list.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
+    ws_delete.add_argument(
+        "--yes",
+        action="store_true",
+        help="Skip interactive confirmation prompt",
     )
-    ws_list.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    ws_list.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    ws_list.add_argument(
-        "--no-retry",
-        action="store_true",
-        help="Disable HTTP retry/backoff (default: enabled)",
-    )
-    ws_list.add_argument(
-        "--max-retry",
-        type=int,
-        default=None,
-        help="Max retry attempts when retry is enabled (default: helper default)",
-    )
-    ws_list.add_argument(
-        "--backoff-max-s",
-        type=float,
-        default=None,
-        help="Max backoff sleep seconds between retries (default: helper default)",
-    )
-
-    ws_delete = workspaces_sub.add_parser(
-        "delete", help="Delete a workspace (control-plane operation)"
-    )
-    ws_delete.add_argument("name", help="Workspace name")
-    ws_delete.add_argument(
-        "--resource-group-name",
-        default="",
-        help="Optional resource group name override",
-    )
-    ws_delete.add_argument(
-        "--yes",
-        action="store_true",
-        help="Skip interactive confirmation prompt",
-    )
-    ws_delete.add_argument(
-        "--format",
-        choices=["json", "lines"],
-        default="json",
-        help="Output format (default: json)",
-    )
-    ws_delete.add_argument(
-        "-v",
-        "--verbose",
-        action="count",
-        default=0,
-        help="Increase log verbosity (repeatable; maps to INFO/DEBUG)",
-    )
-    ws_delete.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
+    ws_delete.add_argument(
+        "--format",
+        choices=_FORMAT_JSON_LINES,
+        default="json",
+        help="Output format (default: json)",
     )
     ws_delete.add_argument("--out", default="", help="Output path (default: stdout)")
-    ws_delete.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    ws_delete.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    ws_delete.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    ws_delete.add_argument(
-        "--no-retry",
-        action="store_true",
-        help="Disable HTTP retry/backoff (default: enabled)",
-    )
-    ws_delete.add_argument(
-        "--max-retry",
-        type=int,
-        default=None,
-        help="Max retry attempts when retry is enabled (default: helper default)",
-    )
-    ws_delete.add_argument(
-        "--backoff-max-s",
-        type=float,
-        default=None,
-        help="Max backoff sleep seconds between retries (default: helper default)",
-    )
 
+
+def _register_discovery_groups(sub) -> None:
     discovery_groups = sub.add_parser(
         "discovery-groups",
-        help="Discovery group operations (data plane)",
+        help=_SUBCOMMAND_HELP["discovery-groups"],
     )
     dg_sub = discovery_groups.add_subparsers(dest="discovery_groups_cmd", required=True)
 
-    dg_list = dg_sub.add_parser("list", help="List discovery groups")
+    dg_list = dg_sub.add_parser(
+        "list",
+        help="List discovery groups",
+        parents=[_common_parent(data_plane=True)],
+    )
     dg_list.add_argument(
         "--format",
-        choices=["json", "lines"],
+        choices=_FORMAT_JSON_LINES,
         default="json",
         help="Output format (default: json)",
     )
-    dg_list.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    dg_list.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
     dg_list.add_argument("--out", default="", help="Output path (default: stdout)")
-    dg_list.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
+    dg_list.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
     dg_list.add_argument(
         "--filter",
         default="",
         help="Optional server-side filter expression for listing",
     )
-    dg_list.add_argument("--get-all", action="store_true", help="Fetch all pages")
-    dg_list.add_argument("--page", type=int, default=0, help="Starting page (skip)")
-    dg_list.add_argument("--max-page-size", type=int, default=25, help="Max page size (1-100)")
-    dg_list.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    dg_list.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    dg_list.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    dg_list.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    dg_list.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    dg_list.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    dg_list.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
+    _add_arg_specs(dg_list, _LIST_PAGING_ARGS)
 
     dg_create = dg_sub.add_parser(
         "create",
         help="Create (or replace) a discovery group and start a run",
+        parents=[_common_parent(data_plane=True)],
     )
     dg_create_source = dg_create.add_mutually_exclusive_group(required=True)
     dg_create_source.add_argument(
@@ -1530,22 +2420,12 @@ def build_parser() -> argparse.ArgumentParser:
     )
     dg_create.add_argument(
         "--format",
-        choices=["json", "lines"],
+        choices=_FORMAT_JSON_LINES,
         default="json",
         help="Output format (default: json)",
     )
-    dg_create.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    dg_create.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
     dg_create.add_argument("--out", default="", help="Output path (default: stdout)")
-    dg_create.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
+    dg_create.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
     dg_create.add_argument(
         "--disco-runs-max-retry",
         type=int,
@@ -1558,51 +2438,21 @@ def build_parser() -> argparse.ArgumentParser:
         default=5.0,
         help="Max backoff seconds while polling run status (default: 5)",
     )
-    dg_create.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    dg_create.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    dg_create.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    dg_create.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    dg_create.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    dg_create.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    dg_create.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
 
-    dg_run = dg_sub.add_parser("run", help="Run an existing discovery group by name")
+    dg_run = dg_sub.add_parser(
+        "run",
+        help="Run an existing discovery group by name",
+        parents=[_common_parent(data_plane=True)],
+    )
     dg_run.add_argument("name", help="Discovery group name")
     dg_run.add_argument(
         "--format",
-        choices=["json", "lines"],
+        choices=_FORMAT_JSON_LINES,
         default="json",
         help="Output format (default: json)",
     )
-    dg_run.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    dg_run.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
     dg_run.add_argument("--out", default="", help="Output path (default: stdout)")
-    dg_run.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
+    dg_run.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
     dg_run.add_argument(
         "--disco-runs-max-retry",
         type=int,
@@ -1615,57 +2465,21 @@ def build_parser() -> argparse.ArgumentParser:
         default=5.0,
         help="Max backoff seconds while polling run status (default: 5)",
     )
-    dg_run.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    dg_run.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    dg_run.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    dg_run.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    dg_run.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    dg_run.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    dg_run.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
 
-    dg_delete = dg_sub.add_parser("delete", help="Delete a discovery group by name")
+    dg_delete = dg_sub.add_parser(
+        "delete",
+        help="Delete a discovery group by name",
+        parents=[_common_parent(data_plane=True)],
+    )
     dg_delete.add_argument("name", help="Discovery group name")
     dg_delete.add_argument(
         "--format",
-        choices=["json", "lines"],
+        choices=_FORMAT_JSON_LINES,
         default="json",
         help="Output format (default: json)",
     )
     dg_delete.add_argument("--out", default="", help="Output path (default: stdout)")
-    dg_delete.add_argument(
-        "-v",
-        "--verbose",
-        action="count",
-        default=0,
-        help="Increase log verbosity (repeatable; maps to INFO/DEBUG)",
-    )
-    dg_delete.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    dg_delete.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
+    dg_delete.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
     dg_delete.add_argument(
         "--verify-delete",
         action=argparse.BooleanOptionalAction,
@@ -1684,304 +2498,114 @@ def build_parser() -> argparse.ArgumentParser:
         default=5.0,
         help="Max verification backoff sleep seconds (default: 5)",
     )
-    dg_delete.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    dg_delete.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    dg_delete.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    dg_delete.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    dg_delete.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    dg_delete.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    dg_delete.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
 
+
+def _register_resource_tags(sub) -> None:
     resource_tags = sub.add_parser(
         "resource-tags",
-        help="Workspace Azure resource tags operations (control plane)",
+        help=_SUBCOMMAND_HELP["resource-tags"],
     )
     rt_sub = resource_tags.add_subparsers(dest="resource_tags_cmd", required=True)
 
-    rt_list = rt_sub.add_parser("list", help="List resource tags for a workspace")
+    rt_list = rt_sub.add_parser(
+        "list",
+        help="List resource tags for a workspace",
+        parents=[_common_parent(data_plane=False)],
+    )
     rt_list.add_argument(
         "--format",
-        choices=["json", "lines"],
+        choices=_FORMAT_JSON_LINES,
         default="json",
         help="Output format (default: json)",
     )
     rt_list.add_argument("--out", default="", help="Output path (default: stdout)")
-    rt_list.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    rt_list.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    rt_list.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    rt_list.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    rt_list.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    rt_list.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    rt_list.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    rt_list.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    rt_list.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
+    rt_list.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
 
-    rt_get = rt_sub.add_parser("get", help="Get a single resource tag value by name")
+    rt_get = rt_sub.add_parser(
+        "get",
+        help="Get a single resource tag value by name",
+        parents=[_common_parent(data_plane=False)],
+    )
     rt_get.add_argument("name", help="Resource tag name")
     rt_get.add_argument(
         "--format",
-        choices=["json", "lines"],
+        choices=_FORMAT_JSON_LINES,
         default="json",
         help="Output format (default: json)",
     )
     rt_get.add_argument("--out", default="", help="Output path (default: stdout)")
-    rt_get.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    rt_get.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    rt_get.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    rt_get.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    rt_get.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    rt_get.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    rt_get.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    rt_get.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    rt_get.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
+    rt_get.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
 
-    rt_put = rt_sub.add_parser("put", help="Create or update a resource tag value")
+    rt_put = rt_sub.add_parser(
+        "put",
+        help="Create or update a resource tag value",
+        parents=[_common_parent(data_plane=False)],
+    )
     rt_put.add_argument("name", help="Resource tag name")
     rt_put.add_argument("--value", required=True, help="Resource tag value")
     rt_put.add_argument(
         "--format",
-        choices=["json", "lines"],
+        choices=_FORMAT_JSON_LINES,
         default="json",
         help="Output format (default: json)",
     )
     rt_put.add_argument("--out", default="", help="Output path (default: stdout)")
-    rt_put.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    rt_put.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
+    rt_put.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
+
+    rt_delete = rt_sub.add_parser(
+        "delete",
+        help="Delete a resource tag by name",
+        parents=[_common_parent(data_plane=False)],
     )
-    rt_put.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    rt_put.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    rt_put.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    rt_put.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    rt_put.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    rt_put.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    rt_put.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
-
-    rt_delete = rt_sub.add_parser("delete", help="Delete a resource tag by name")
     rt_delete.add_argument("name", help="Resource tag name")
     rt_delete.add_argument(
         "--format",
-        choices=["json", "lines"],
+        choices=_FORMAT_JSON_LINES,
         default="json",
         help="Output format (default: json)",
     )
     rt_delete.add_argument("--out", default="", help="Output path (default: stdout)")
-    rt_delete.add_argument(
-        "-v", "--verbose", action="count", default=0, help="Increase verbosity"
-    )
-    rt_delete.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    rt_delete.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    rt_delete.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    rt_delete.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    rt_delete.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    rt_delete.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    rt_delete.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    rt_delete.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
+    rt_delete.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
+
 
-    saved_filters = sub.add_parser("saved-filters", help="Saved filter operations (data plane)")
+def _register_saved_filters(sub) -> None:
+    saved_filters = sub.add_parser("saved-filters", help=_SUBCOMMAND_HELP["saved-filters"])
     sf_sub = saved_filters.add_subparsers(dest="saved_filters_cmd", required=True)
 
-    sf_list = sf_sub.add_parser("list", help="List saved filters")
+    sf_list = sf_sub.add_parser(
+        "list",
+        help="List saved filters",
+        parents=[_common_parent(data_plane=True)],
+    )
     sf_list.add_argument(
         "--format",
-        choices=["json", "lines"],
+        choices=_FORMAT_JSON_NDJSON_LINES,
         default="json",
-        help="Output format (default: json)",
-    )
-    sf_list.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    sf_list.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
+        help="Output format (default: json; ndjson streams one item per line for --get-all)",
     )
     sf_list.add_argument("--out", default="", help="Output path (default: stdout)")
-    sf_list.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
+    sf_list.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
     sf_list.add_argument(
         "--filter",
         default="",
         help="Optional server-side filter expression for listing",
     )
-    sf_list.add_argument("--get-all", action="store_true", help="Fetch all pages")
-    sf_list.add_argument("--page", type=int, default=0, help="Starting page (skip)")
-    sf_list.add_argument("--max-page-size", type=int, default=25, help="Max page size (1-100)")
-    sf_list.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    sf_list.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    sf_list.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    sf_list.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    sf_list.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    sf_list.add_argument(
-        "--max-retry",
-        type=int,
-        default=None,
-        help="Max retry attempts when retry is enabled (default: helper default)",
-    )
-    sf_list.add_argument(
-        "--backoff-max-s",
-        type=float,
-        default=None,
-        help="Max backoff sleep seconds between retries (default: helper default)",
-    )
+    _add_arg_specs(sf_list, _LIST_PAGING_ARGS)
 
-    sf_get = sf_sub.add_parser("get", help="Get a saved filter by name")
+    sf_get = sf_sub.add_parser(
+        "get",
+        help="Get a saved filter by name",
+        parents=[_common_parent(data_plane=True)],
+    )
     sf_get.add_argument("name", help="Saved filter name")
     sf_get.add_argument("--out", default="", help="Output path (default: stdout)")
-    sf_get.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    sf_get.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    sf_get.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    sf_get.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    sf_get.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    sf_get.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    sf_get.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    sf_get.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    sf_get.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    sf_get.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
+    sf_get.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
 
-    sf_put = sf_sub.add_parser("put", help="Create or replace a saved filter")
+    sf_put = sf_sub.add_parser(
+        "put",
+        help="Create or replace a saved filter",
+        parents=[_common_parent(data_plane=True)],
+    )
     sf_put.add_argument("name", help="Saved filter name")
     sf_put.add_argument(
         "--filter",
@@ -1994,642 +2618,238 @@ def build_parser() -> argparse.ArgumentParser:
         help="Saved filter description",
     )
     sf_put.add_argument("--out", default="", help="Output path (default: stdout)")
-    sf_put.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    sf_put.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    sf_put.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    sf_put.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    sf_put.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    sf_put.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    sf_put.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    sf_put.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    sf_put.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    sf_put.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
+    sf_put.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
 
-    sf_delete = sf_sub.add_parser("delete", help="Delete a saved filter by name")
+    sf_delete = sf_sub.add_parser(
+        "delete",
+        help="Delete a saved filter by name",
+        parents=[_common_parent(data_plane=True)],
+    )
     sf_delete.add_argument("name", help="Saved filter name")
     sf_delete.add_argument(
         "--format",
-        choices=["json", "lines", "text"],
+        choices=_FORMAT_JSON_LINES_TEXT,
         default="json",
         help="Output format (default: json)",
     )
     sf_delete.add_argument("--out", default="", help="Output path (default: stdout)")
-    sf_delete.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    sf_delete.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    sf_delete.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    sf_delete.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    sf_delete.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    sf_delete.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    sf_delete.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    sf_delete.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    sf_delete.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    sf_delete.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
+    sf_delete.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
 
-    data_connections = sub.add_parser(
-        "data-connections", help="Data connection operations (Log Analytics / Azure Data Explorer)"
-    )
-    dc_sub = data_connections.add_subparsers(dest="data_connections_cmd", required=True)
 
-    dc_list = dc_sub.add_parser("list", help="List data connections")
-    dc_list.add_argument(
-        "--format",
-        choices=["json", "lines"],
-        default="json",
-        help="Output format (default: json)",
-    )
-    dc_list.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    dc_list.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    dc_list.add_argument("--out", default="", help="Output path (default: stdout)")
-    dc_list.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    dc_list.add_argument("--get-all", action="store_true", help="Fetch all pages")
-    dc_list.add_argument("--page", type=int, default=0, help="Starting page (skip)")
-    dc_list.add_argument("--max-page-size", type=int, default=25, help="Max page size (1-100)")
-    dc_list.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    dc_list.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    dc_list.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    dc_list.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    dc_list.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    dc_list.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    dc_list.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
-
-    dc_get = dc_sub.add_parser("get", help="Get a data connection by name")
-    dc_get.add_argument("name", help="Data connection name")
-    dc_get.add_argument("--out", default="", help="Output path (default: stdout)")
-    dc_get.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    dc_get.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    dc_get.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    dc_get.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    dc_get.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    dc_get.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    dc_get.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    dc_get.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    dc_get.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    dc_get.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
-
-    dc_put = dc_sub.add_parser("put", help="Create or replace a data connection")
-    dc_put.add_argument("name", help="Data connection name")
-    dc_put.add_argument(
+@functools.cache
+def _data_connection_payload_parent() -> argparse.ArgumentParser:
+    # `data-connections put` and `validate` take the same payload flags; declare them once.
+    p = argparse.ArgumentParser(add_help=False)
+    p.add_argument(
         "--kind",
         required=True,
-        choices=["logAnalytics", "azureDataExplorer"],
+        choices=_DATA_CONNECTION_KINDS,
         help="Data connection kind",
     )
-    dc_put.add_argument(
+    p.add_argument(
         "--content",
         default="assets",
-        choices=["assets", "attackSurfaceInsights"],
+        choices=_DATA_CONNECTION_CONTENTS,
         help="Export content scope (default: assets)",
     )
-    dc_put.add_argument(
+    p.add_argument(
         "--frequency",
         default="weekly",
-        choices=["daily", "weekly", "monthly"],
+        choices=_DATA_CONNECTION_FREQUENCIES,
         help="Export frequency (default: weekly)",
     )
-    dc_put.add_argument(
+    p.add_argument(
         "--frequency-offset",
         type=int,
         default=1,
         help="Offset used by schedule cadence (default: 1)",
     )
-    dc_put.add_argument("--workspace-id", default="", help="Log Analytics workspace id")
-    dc_put.add_argument("--api-key", default="", help="Log Analytics API key")
-    dc_put.add_argument("--cluster-name", default="", help="Azure Data Explorer cluster name")
-    dc_put.add_argument("--database-name", default="", help="Azure Data Explorer database name")
-    dc_put.add_argument("--region", default="", help="Azure Data Explorer region")
-    dc_put.add_argument("--out", default="", help="Output path (default: stdout)")
-    dc_put.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    dc_put.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    dc_put.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
+    p.add_argument("--workspace-id", default="", help="Log Analytics workspace id")
+    p.add_argument("--api-key", default="", help="Log Analytics API key")
+    p.add_argument("--cluster-name", default="", help="Azure Data Explorer cluster name")
+    p.add_argument("--database-name", default="", help="Azure Data Explorer database name")
+    p.add_argument("--region", default="", help="Azure Data Explorer region")
+    return p
+
+
+def _register_data_connections(sub) -> None:
+    data_connections = sub.add_parser(
+        "data-connections",
+        help=_SUBCOMMAND_HELP["data-connections"],
     )
-    dc_put.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
+    dc_sub = data_connections.add_subparsers(dest="data_connections_cmd", required=True)
+
+    dc_list = dc_sub.add_parser(
+        "list",
+        help="List data connections",
+        parents=[_common_parent(data_plane=True)],
     )
-    dc_put.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
+    dc_list.add_argument(
+        "--format",
+        choices=_FORMAT_JSON_NDJSON_LINES,
+        default="json",
+        help="Output format (default: json; ndjson streams one item per line for --get-all)",
     )
-    dc_put.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
+    dc_list.add_argument("--out", default="", help="Output path (default: stdout)")
+    dc_list.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
+    _add_arg_specs(dc_list, _LIST_PAGING_ARGS)
+
+    dc_get = dc_sub.add_parser(
+        "get",
+        help="Get a data connection by name",
+        parents=[_common_parent(data_plane=True)],
     )
-    dc_put.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
+    dc_get.add_argument("name", help="Data connection name")
+    dc_get.add_argument("--out", default="", help="Output path (default: stdout)")
+    dc_get.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
+
+    dc_put = dc_sub.add_parser(
+        "put",
+        help="Create or replace a data connection",
+        parents=[_common_parent(data_plane=True), _data_connection_payload_parent()],
     )
-    dc_put.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    dc_put.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    dc_put.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
+    dc_put.add_argument("name", help="Data connection name")
+    dc_put.add_argument("--out", default="", help="Output path (default: stdout)")
+    dc_put.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
 
-    dc_validate = dc_sub.add_parser("validate", help="Validate a data connection payload")
+    dc_validate = dc_sub.add_parser(
+        "validate",
+        help="Validate a data connection payload",
+        parents=[_common_parent(data_plane=True), _data_connection_payload_parent()],
+    )
     dc_validate.add_argument(
         "name",
         nargs="?",
         default="",
         help="Optional data connection name included in validation payload",
     )
-    dc_validate.add_argument(
-        "--kind",
-        required=True,
-        choices=["logAnalytics", "azureDataExplorer"],
-        help="Data connection kind",
-    )
-    dc_validate.add_argument(
-        "--content",
-        default="assets",
-        choices=["assets", "attackSurfaceInsights"],
-        help="Export content scope (default: assets)",
-    )
-    dc_validate.add_argument(
-        "--frequency",
-        default="weekly",
-        choices=["daily", "weekly", "monthly"],
-        help="Export frequency (default: weekly)",
-    )
-    dc_validate.add_argument(
-        "--frequency-offset",
-        type=int,
-        default=1,
-        help="Offset used by schedule cadence (default: 1)",
-    )
-    dc_validate.add_argument("--workspace-id", default="", help="Log Analytics workspace id")
-    dc_validate.add_argument("--api-key", default="", help="Log Analytics API key")
-    dc_validate.add_argument("--cluster-name", default="", help="Azure Data Explorer cluster name")
-    dc_validate.add_argument("--database-name", default="", help="Azure Data Explorer database name")
-    dc_validate.add_argument("--region", default="", help="Azure Data Explorer region")
     dc_validate.add_argument("--out", default="", help="Output path (default: stdout)")
-    dc_validate.add_argument(
-        "-v", "--verbose", action="count", default=0, help="Increase verbosity"
-    )
-    dc_validate.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    dc_validate.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    dc_validate.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    dc_validate.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    dc_validate.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    dc_validate.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    dc_validate.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    dc_validate.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    dc_validate.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
+    dc_validate.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
 
-    dc_delete = dc_sub.add_parser("delete", help="Delete a data connection by name")
-    dc_delete.add_argument("name", help="Data connection name")
-    dc_delete.add_argument(
-        "--format",
-        choices=["json", "lines", "text"],
-        default="json",
-        help="Output format (default: json)",
-    )
-    dc_delete.add_argument("--out", default="", help="Output path (default: stdout)")
-    dc_delete.add_argument(
-        "-v", "--verbose", action="count", default=0, help="Increase verbosity"
-    )
-    dc_delete.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    dc_delete.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
+    dc_delete = dc_sub.add_parser(
+        "delete",
+        help="Delete a data connection by name",
+        parents=[_common_parent(data_plane=True)],
     )
-    dc_delete.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    dc_delete.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    dc_delete.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    dc_delete.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    dc_delete.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    dc_delete.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    dc_delete.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
-
-    tasks = sub.add_parser("tasks", help="Data-plane task operations")
-    tasks_sub = tasks.add_subparsers(dest="tasks_cmd", required=True)
-
-    tasks_list = tasks_sub.add_parser("list", help="List tasks")
-    tasks_list.add_argument(
-        "--format",
-        choices=["json", "lines"],
-        default="json",
-        help="Output format (default: json)",
-    )
-    tasks_list.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    tasks_list.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    tasks_list.add_argument("--out", default="", help="Output path (default: stdout)")
-    tasks_list.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    tasks_list.add_argument("--filter", default="", help="Optional server-side filter expression")
-    tasks_list.add_argument("--orderby", default="", help="Optional ordering expression")
-    tasks_list.add_argument("--get-all", action="store_true", help="Fetch all pages")
-    tasks_list.add_argument("--page", type=int, default=0, help="Starting page (skip)")
-    tasks_list.add_argument("--max-page-size", type=int, default=25, help="Max page size (1-100)")
-    tasks_list.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    tasks_list.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
+    dc_delete.add_argument("name", help="Data connection name")
+    dc_delete.add_argument(
+        "--format",
+        choices=_FORMAT_JSON_LINES_TEXT,
+        default="json",
+        help="Output format (default: json)",
     )
-    tasks_list.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
+    dc_delete.add_argument("--out", default="", help="Output path (default: stdout)")
+    dc_delete.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
+
+
+def _register_tasks(sub) -> None:
+    tasks = sub.add_parser("tasks", help=_SUBCOMMAND_HELP["tasks"])
+    tasks_sub = tasks.add_subparsers(dest="tasks_cmd", required=True)
+
+    tasks_list = tasks_sub.add_parser(
+        "list",
+        help="List tasks",
+        parents=[_common_parent(data_plane=True)],
     )
     tasks_list.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
+        "--format",
+        choices=_FORMAT_JSON_LINES,
+        default="json",
+        help="Output format (default: json)",
     )
-    tasks_list.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    tasks_list.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    tasks_list.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
+    tasks_list.add_argument("--out", default="", help="Output path (default: stdout)")
+    tasks_list.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
+    tasks_list.add_argument("--filter", default="", help="Optional server-side filter expression")
+    tasks_list.add_argument("--orderby", default="", help="Optional ordering expression")
+    _add_arg_specs(tasks_list, _LIST_PAGING_ARGS)
 
-    tasks_get = tasks_sub.add_parser("get", help="Get task details")
-    tasks_get.add_argument("task_id", help="Task id")
-    tasks_get.add_argument("--out", default="", help="Output path (default: stdout)")
-    tasks_get.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    tasks_get.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
+    tasks_get = tasks_sub.add_parser(
+        "get",
+        help="Get task details",
+        parents=[_common_parent(data_plane=True)],
     )
+    tasks_get.add_argument("task_id", nargs="?", default="", help="Task id")
     tasks_get.add_argument(
-        "--workspace-name",
+        "--task-ids",
         default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    tasks_get.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    tasks_get.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
+        help="Comma-separated task ids to fetch in one run; output becomes a JSON array",
     )
     tasks_get.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
+        "--task-ids-from",
+        default="",
+        help="Read task ids from a file (one per line; '#' comments allowed); implies array output",
     )
     tasks_get.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Max parallel requests when fetching several task ids (default: 4)",
     )
-    tasks_get.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    tasks_get.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    tasks_get.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
+    tasks_get.add_argument("--out", default="", help="Output path (default: stdout)")
+    tasks_get.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
 
-    tasks_wait = tasks_sub.add_parser("wait", help="Wait for a task to reach a terminal state")
+    tasks_wait = tasks_sub.add_parser(
+        "wait",
+        help="Wait for a task to reach a terminal state",
+        parents=[_common_parent(data_plane=True)],
+    )
     tasks_wait.add_argument("task_id", help="Task id")
     tasks_wait.add_argument(
         "--format",
-        choices=["json", "lines"],
+        choices=_FORMAT_JSON_LINES,
         default="json",
         help="Output format (default: json)",
     )
     tasks_wait.add_argument("--out", default="", help="Output path (default: stdout)")
-    tasks_wait.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    tasks_wait.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    tasks_wait.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
+    tasks_wait.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
     tasks_wait.add_argument(
         "--poll-interval-s",
         type=float,
         default=5.0,
-        help="Polling interval seconds (default: 5)",
+        help=(
+            "Initial polling interval seconds; grows per poll while the state is unchanged "
+            "(default: 5)"
+        ),
     )
+    _add_arg_specs(tasks_wait, _TASK_POLL_ARGS)
     tasks_wait.add_argument(
         "--timeout-s",
         type=float,
         default=900.0,
         help="Maximum wait seconds (default: 900)",
     )
-    tasks_wait.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    tasks_wait.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    tasks_wait.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    tasks_wait.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    tasks_wait.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    tasks_wait.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    tasks_wait.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
 
-    tasks_cancel = tasks_sub.add_parser("cancel", help="Cancel a task")
+    tasks_cancel = tasks_sub.add_parser(
+        "cancel",
+        help="Cancel a task",
+        parents=[_common_parent(data_plane=True)],
+    )
     tasks_cancel.add_argument("task_id", help="Task id")
     tasks_cancel.add_argument("--out", default="", help="Output path (default: stdout)")
-    tasks_cancel.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    tasks_cancel.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    tasks_cancel.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    tasks_cancel.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    tasks_cancel.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    tasks_cancel.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    tasks_cancel.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    tasks_cancel.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    tasks_cancel.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    tasks_cancel.add_argument(
-        "--backoff-max-s", type=float, default=None, help="Max backoff seconds"
-    )
+    tasks_cancel.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
 
-    tasks_run = tasks_sub.add_parser("run", help="Run a paused task")
+    tasks_run = tasks_sub.add_parser(
+        "run",
+        help="Run a paused task",
+        parents=[_common_parent(data_plane=True)],
+    )
     tasks_run.add_argument("task_id", help="Task id")
     tasks_run.add_argument("--out", default="", help="Output path (default: stdout)")
-    tasks_run.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    tasks_run.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    tasks_run.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    tasks_run.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    tasks_run.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    tasks_run.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    tasks_run.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    tasks_run.add_argument("--no-retry", action="store_true", help="Disable HTTP retry/backoff")
-    tasks_run.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    tasks_run.add_argument("--backoff-max-s", type=float, default=None, help="Max backoff seconds")
+    tasks_run.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
 
-    tasks_download = tasks_sub.add_parser("download", help="Get a task download artifact reference")
+    tasks_download = tasks_sub.add_parser(
+        "download",
+        help="Get a task download artifact reference",
+        parents=[_common_parent(data_plane=True)],
+    )
     tasks_download.add_argument("task_id", help="Task id")
     tasks_download.add_argument("--out", default="", help="Output path (default: stdout)")
-    tasks_download.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
-    tasks_download.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
-    tasks_download.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    tasks_download.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    tasks_download.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    tasks_download.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    tasks_download.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    tasks_download.add_argument(
-        "--no-retry", action="store_true", help="Disable HTTP retry/backoff"
-    )
-    tasks_download.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    tasks_download.add_argument(
-        "--backoff-max-s", type=float, default=None, help="Max backoff seconds"
-    )
+    tasks_download.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
 
     tasks_fetch = tasks_sub.add_parser(
         "fetch",
         help="Download task artifact bytes to a local file path",
+        parents=[_common_parent(data_plane=True)],
     )
     tasks_fetch.add_argument("task_id", help="Task id")
     tasks_fetch.add_argument(
@@ -2645,8 +2865,8 @@ def build_parser() -> argparse.ArgumentParser:
     tasks_fetch.add_argument(
         "--chunk-size",
         type=int,
-        default=65536,
-        help="Streaming download chunk size in bytes (default: 65536)",
+        default=_DOWNLOAD_CHUNK_SIZE_DEFAULT,
+        help="Streaming download chunk size in bytes (default: 1048576)",
     )
     tasks_fetch.add_argument(
         "--reference-out",
@@ -2658,66 +2878,84 @@ def build_parser() -> argparse.ArgumentParser:
         default="",
         help="Summary output path (default: stdout)",
     )
-    tasks_fetch.add_argument("-v", "--verbose", action="count", default=0, help="Increase verbosity")
+    tasks_fetch.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
     tasks_fetch.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
+        "--retry-on-statuses",
+        type=_parse_retry_on_statuses,
+        default=_DEFAULT_RETRY_ON_STATUSES,
+        help=(
+            "Comma-separated HTTP statuses treated as retryable for artifact download "
+            "(default: 408,425,429,500,502,503,504)"
+        ),
     )
     tasks_fetch.add_argument(
-        "--workspace-name",
+        "--sha256",
         default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
+        help=(
+            "Optional expected SHA-256 checksum (64 hex chars, optionally prefixed with 'sha256:'); "
+            "download fails if artifact digest does not match"
+        ),
     )
-    tasks_fetch.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
+
+    tasks_fetch_many = tasks_sub.add_parser(
+        "fetch-many",
+        help="Download artifacts for several tasks concurrently into a directory",
+        parents=[_common_parent(data_plane=True)],
     )
-    tasks_fetch.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
+    tasks_fetch_many.add_argument("--task-ids", default="", help="Comma-separated task ids")
+    tasks_fetch_many.add_argument(
+        "--task-ids-from",
+        default="",
+        help="Read task ids from a file (one per line; '#' comments allowed)",
     )
-    tasks_fetch.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
+    tasks_fetch_many.add_argument(
+        "--artifact-dir",
+        required=True,
+        help="Directory for artifacts, named <task_id><url extension>",
     )
-    tasks_fetch.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
+    tasks_fetch_many.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Max parallel downloads (default: 4)",
     )
-    tasks_fetch.add_argument(
-        "--no-retry", action="store_true", help="Disable HTTP retry/backoff"
+    tasks_fetch_many.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Overwrite artifacts that already exist in --artifact-dir",
     )
-    tasks_fetch.add_argument("--max-retry", type=int, default=None, help="Max retry attempts")
-    tasks_fetch.add_argument(
-        "--backoff-max-s", type=float, default=None, help="Max backoff seconds"
+    tasks_fetch_many.add_argument(
+        "--chunk-size",
+        type=int,
+        default=_DOWNLOAD_CHUNK_SIZE_DEFAULT,
+        help="Streaming download chunk size in bytes (default: 1048576)",
     )
-    tasks_fetch.add_argument(
+    tasks_fetch_many.add_argument(
+        "--out",
+        default="",
+        help="Summary array output path (default: stdout)",
+    )
+    tasks_fetch_many.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
+    tasks_fetch_many.add_argument(
         "--retry-on-statuses",
-        default="408,425,429,500,502,503,504",
+        type=_parse_retry_on_statuses,
+        default=_DEFAULT_RETRY_ON_STATUSES,
         help=(
             "Comma-separated HTTP statuses treated as retryable for artifact download "
             "(default: 408,425,429,500,502,503,504)"
         ),
     )
-    tasks_fetch.add_argument(
-        "--sha256",
-        default="",
-        help=(
-            "Optional expected SHA-256 checksum (64 hex chars, optionally prefixed with 'sha256:'); "
-            "download fails if artifact digest does not match"
-        ),
-    )
 
-    assets = sub.add_parser("assets", help="Asset inventory operations")
+
+def _register_assets(sub) -> None:
+    assets = sub.add_parser("assets", help=_SUBCOMMAND_HELP["assets"])
     assets_sub = assets.add_subparsers(dest="assets_cmd", required=True)
 
-    export = assets_sub.add_parser("export", help="Export assets matching a query filter")
+    export = assets_sub.add_parser(
+        "export",
+        help="Export assets matching a query filter",
+        parents=[_common_parent(data_plane=True)],
+    )
     export.add_argument(
         "--filter",
         required=True,
@@ -2725,28 +2963,16 @@ def build_parser() -> argparse.ArgumentParser:
     )
     export.add_argument(
         "--format",
-        choices=["json", "ndjson", "csv"],
+        choices=_EXPORT_FORMATS,
         default="json",
         help="Output format",
     )
     export.add_argument(
         "--mode",
-        choices=["client", "server"],
+        choices=_EXPORT_MODES,
         default="client",
         help="Export mode: client-side paging (default) or server-side task export",
     )
-    export.add_argument(
-        "-v",
-        "--verbose",
-        action="count",
-        default=0,
-        help="Increase log verbosity (repeatable; maps to INFO/DEBUG)",
-    )
-    export.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
     export.add_argument(
         "--pretty",
         action=argparse.BooleanOptionalAction,
@@ -2788,7 +3014,16 @@ def build_parser() -> argparse.ArgumentParser:
     export.add_argument(
         "--checkpoint-out",
         default="",
-        help="Client export mode: write checkpoint JSON after each fetched page",
+        help="Client export mode: write checkpoint JSON as pages are fetched",
+    )
+    export.add_argument(
+        "--checkpoint-min-interval-s",
+        type=float,
+        default=2.0,
+        help=(
+            "Client export mode: minimum seconds between checkpoint writes; the newest state is "
+            "always written at the end (default: 2, 0 writes every page)"
+        ),
     )
     export.add_argument(
         "--wait",
@@ -2799,74 +3034,36 @@ def build_parser() -> argparse.ArgumentParser:
         "--poll-interval-s",
         type=float,
         default=5.0,
-        help="Server export mode: polling interval seconds when --wait is set (default: 5)",
+        help=(
+            "Server export mode: initial polling interval seconds when --wait is set; "
+            "grows per poll while the state is unchanged (default: 5)"
+        ),
     )
+    _add_arg_specs(export, _TASK_POLL_ARGS)
     export.add_argument(
         "--wait-timeout-s",
         type=float,
-        default=900.0,
-        help="Server export mode: max wait seconds when --wait is set (default: 900)",
-    )
-    export.add_argument(
-        "--download-on-complete",
-        action="store_true",
-        help="Server export mode: call tasks/{id}:download after a completed task and include response in output",
-    )
-    export.add_argument(
-        "--max-assets",
-        type=int,
-        default=0,
-        help="Stop after exporting at most N assets (0=unbounded)",
-    )
-    export.add_argument(
-        "--progress-every-pages",
-        type=int,
-        default=0,
-        help="Emit progress estimate every N pages (0=default helper behavior)",
-    )
-    export.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    export.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    export.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    export.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    export.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
+        default=900.0,
+        help="Server export mode: max wait seconds when --wait is set (default: 900)",
     )
     export.add_argument(
-        "--no-retry",
+        "--download-on-complete",
         action="store_true",
-        help="Disable HTTP retry/backoff (default: enabled)",
+        help="Server export mode: call tasks/{id}:download after a completed task and include response in output",
     )
     export.add_argument(
-        "--max-retry",
+        "--max-assets",
         type=int,
-        default=None,
-        help="Max retry attempts when retry is enabled (default: helper default)",
+        default=0,
+        help="Stop after exporting at most N assets (0=unbounded)",
     )
     export.add_argument(
-        "--backoff-max-s",
-        type=float,
-        default=None,
-        help="Max backoff sleep seconds between retries (default: helper default)",
+        "--progress-every-pages",
+        type=int,
+        default=0,
+        help="Emit progress estimate every N pages (0=default helper behavior)",
     )
+    export.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
     export.add_argument(
         "--asset-list-name",
         default="assetList",
@@ -2879,9 +3076,10 @@ def build_parser() -> argparse.ArgumentParser:
     )
     export.add_argument("--get-all", action="store_true", help="Fetch all pages until exhausted")
     export.add_argument(
-        "--no-facet-filters",
-        action="store_true",
-        help="Do not auto-create facet filters (faster for exports)",
+        "--facet-filters",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Auto-create facet filters; --no-facet-filters is faster for exports",
     )
     export.add_argument(
         "--stream-json-array",
@@ -2893,12 +3091,14 @@ def build_parser() -> argparse.ArgumentParser:
     )
 
     schema = assets_sub.add_parser(
-        "schema", help="Print observed columns for a query (union-of-keys)"
+        "schema",
+        help="Print observed columns for a query (union-of-keys)",
+        parents=[_common_parent(data_plane=True)],
     )
     schema.add_argument(
         "schema_action",
         nargs="?",
-        choices=["diff"],
+        choices=("diff",),
         help="Optional action: `diff` compares observed columns against a baseline file",
     )
     schema.add_argument(
@@ -2908,18 +3108,10 @@ def build_parser() -> argparse.ArgumentParser:
     )
     schema.add_argument(
         "--format",
-        choices=["lines", "json"],
+        choices=_FORMAT_JSON_LINES,
         default="lines",
         help="Output format (default: lines suitable for --columns-from)",
     )
-    schema.add_argument(
-        "-v", "--verbose", action="count", default=0, help="Increase log verbosity (repeatable)"
-    )
-    schema.add_argument(
-        "--log-level",
-        default="",
-        help="Set log level (DEBUG/INFO/WARNING/ERROR/CRITICAL). Overrides -v/--verbose.",
-    )
     schema.add_argument("--out", default="", help="Output path (default: stdout)")
     schema.add_argument(
         "--baseline",
@@ -2937,49 +3129,7 @@ def build_parser() -> argparse.ArgumentParser:
         default=200,
         help="Sample at most N assets to infer columns (0=unbounded; default: 200)",
     )
-    schema.add_argument(
-        "--workspace-name",
-        default="",
-        help="Workspace name override (default: env WORKSPACE_NAME / helper default)",
-    )
-    schema.add_argument(
-        "--api-version",
-        default=None,
-        help="Override EASM api-version query param (default: env EASM_API_VERSION or helper default)",
-    )
-    schema.add_argument(
-        "--dp-api-version",
-        default=None,
-        help="Override data-plane api-version (default: env EASM_DP_API_VERSION or --api-version)",
-    )
-    schema.add_argument(
-        "--cp-api-version",
-        default=None,
-        help="Override control-plane api-version (default: env EASM_CP_API_VERSION or --api-version)",
-    )
-    schema.add_argument(
-        "--http-timeout",
-        type=_parse_http_timeout,
-        default=None,
-        help="HTTP timeouts in seconds: 'read' or 'connect,read' (default: helper default)",
-    )
-    schema.add_argument(
-        "--no-retry",
-        action="store_true",
-        help="Disable HTTP retry/backoff (default: enabled)",
-    )
-    schema.add_argument(
-        "--max-retry",
-        type=int,
-        default=None,
-        help="Max retry attempts when retry is enabled (default: helper default)",
-    )
-    schema.add_argument(
-        "--backoff-max-s",
-        type=float,
-        default=None,
-        help="Max backoff sleep seconds between retries (default: helper default)",
-    )
+    schema.add_argument("--workspace-name", default="", help=_WORKSPACE_NAME_HELP)
     schema.add_argument("--page", type=int, default=0, help="Starting page (skip)")
     schema.add_argument("--max-page-size", type=int, default=25, help="Max page size (1-100)")
     schema.add_argument(
@@ -2991,16 +3141,75 @@ def build_parser() -> argparse.ArgumentParser:
         help="Fetch pages until exhausted (bounded by --max-assets)",
     )
 
+
+# Top-level command name -> registrar. `build_parser(command=...)` only materializes the one
+# being dispatched; the full tree is built for top-level help, --version and completions.
+_SUBCOMMAND_REGISTRARS = {
+    "doctor": _register_doctor,
+    "completions": _register_completions,
+    "workspaces": _register_workspaces,
+    "discovery-groups": _register_discovery_groups,
+    "resource-tags": _register_resource_tags,
+    "saved-filters": _register_saved_filters,
+    "data-connections": _register_data_connections,
+    "tasks": _register_tasks,
+    "assets": _register_assets,
+}
+
+
+def build_parser(
+    command: str | None = None, *, summary_only: bool = False
+) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser.
+
+    When `command` names a known top-level command, only that subtree is registered; parsing
+    argv for a single command does not need the ~1k `add_argument` calls of the other ones.
+    With `summary_only`, every command is registered as an empty stub: enough for top-level
+    `--help`, `--version` and "missing/invalid command" errors, which render identically.
+    """
+    p = argparse.ArgumentParser(
+        description="Small CLI for MDEASM helper workflows (exports/automation).",
+    )
+    p.add_argument("--version", action=_LazyVersionAction)
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    if summary_only:
+        for name, help_text in _SUBCOMMAND_HELP.items():
+            sub.add_parser(name, help=help_text)
+        return p
+
+    registrar = _SUBCOMMAND_REGISTRARS.get(command or "")
+    if registrar is not None:
+        registrar(sub)
+        return p
+    for registrar in _SUBCOMMAND_REGISTRARS.values():
+        registrar(sub)
     return p
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_parser(
+    command: str | None = None, *, summary_only: bool = False
+) -> argparse.ArgumentParser:
+    # parse_args never mutates the parser, so repeated in-process `main()` calls (tests, wrappers)
+    # can share one tree per command. `build_parser` stays uncached: callers may customize it.
+    # Bounded by the registrar keys plus None; tests can reset via `_cached_parser.cache_clear()`.
+    return build_parser(command, summary_only=summary_only)
+
+
 def main(argv: list[str] | None = None) -> int:
-    args = build_parser().parse_args(argv)
+    # The root parser has no value-taking options, so the first token names the command.
+    raw_argv = sys.argv[1:] if argv is None else argv
+    command = raw_argv[0] if raw_argv and raw_argv[0] in _SUBCOMMAND_REGISTRARS else None
+    # No known command (empty argv, -h/--help, --version, typos) never reaches a subtree, so the
+    # stub-only parser produces the same help/usage output without building any of them.
+    args = _cached_parser(command, summary_only=command is None).parse_args(raw_argv)
 
     if args.cmd == "completions":
         try:
             out_path = _resolve_out_path(getattr(args, "out", ""))
-            script = _render_completion_script(build_parser(), shell=args.shell)
+            script = _render_completion_script(_cached_parser(), shell=args.shell)
             if out_path is None:
                 sys.stdout.write(script)
             else:
@@ -3013,21 +3222,17 @@ def main(argv: list[str] | None = None) -> int:
     if args.cmd == "doctor":
         # Avoid importing `mdeasm` unless the user asked for a network probe; this keeps
         # `mdeasm doctor` usable as a "what am I missing?" command even before install.
-        required = ["TENANT_ID", "SUBSCRIPTION_ID", "CLIENT_ID", "CLIENT_SECRET"]
-        recommended = ["WORKSPACE_NAME"]
-        optional = ["EASM_API_VERSION", "EASM_CP_API_VERSION", "EASM_DP_API_VERSION"]
-
-        env_state = {}
-        missing_required: list[str] = []
-        for k in required + recommended + optional:
-            v = os.getenv(k)
-            if k == "CLIENT_SECRET":
-                env_state[k] = {"set": bool(v)}
-            else:
-                env_state[k] = {"set": bool(v), "value": (v if v else "")}
-        for k in required:
-            if not env_state[k]["set"]:
-                missing_required.append(k)
+        required = _DOCTOR_REQUIRED_ENV
+        recommended = _DOCTOR_RECOMMENDED_ENV
+        optional = _DOCTOR_OPTIONAL_ENV
+
+        env = os.environ
+        env_values = {k: env.get(k) or "" for k in _DOCTOR_ENV_KEYS}
+        env_state = {
+            k: {"set": bool(v)} if k in _DOCTOR_SECRET_ENV else {"set": bool(v), "value": v}
+            for k, v in env_values.items()
+        }
+        missing_required = [k for k in required if not env_state[k]["set"]]
 
         dotenv_path = _find_dotenv_path()
         payload = {
@@ -3045,7 +3250,7 @@ def main(argv: list[str] | None = None) -> int:
             },
         }
 
-        probe_targets: list[str] = []
+        probe_targets: tuple[str, ...] = ()
         if args.probe:
             try:
                 probe_targets = _parse_doctor_probe_targets(args.probe_targets)
@@ -3060,44 +3265,39 @@ def main(argv: list[str] | None = None) -> int:
 
         if args.probe and not missing_required:
             try:
-                import mdeasm  # type: ignore
-
-                level = None
-                if args.log_level:
-                    level = args.log_level
-                elif args.verbose >= 2:
-                    level = "DEBUG"
-                elif args.verbose == 1:
-                    level = "INFO"
-                if level and hasattr(mdeasm, "configure_logging"):
-                    mdeasm.configure_logging(level)
-
-                ws_kwargs = _build_ws_kwargs(args)
-                ws_kwargs["emit_workspace_guidance"] = False
+                mdeasm = _load_mdeasm(args)
+                ws_overrides = {"emit_workspace_guidance": False}
                 needs_data_plane_probe = any(t != "workspaces" for t in probe_targets)
                 if not needs_data_plane_probe:
                     # Control-plane-only probe; do not require data-plane scope.
-                    ws_kwargs["workspace_name"] = ""
-                    ws_kwargs["init_data_plane_token"] = False
+                    ws_overrides["workspace_name"] = ""
+                    ws_overrides["init_data_plane_token"] = False
 
-                ws = mdeasm.Workspaces(**ws_kwargs)
-                names = sorted(list((getattr(ws, "_workspaces", {}) or {}).keys()), key=str.lower)
+                ws = _new_workspaces(mdeasm, args, **ws_overrides)
+                names = sorted(getattr(ws, "_workspaces", {}) or {}, key=str.lower)
                 probe = payload.get("checks", {}).get("probe") or {}
                 results = probe.get("results") or {}
+                # Summary totals are folded in as each target result lands, not in a second pass.
+                totals = {"sum": 0, "ok": 0, "slow_name": "", "slow_ms": -1}
+
+                def _record(target: str, target_payload: dict) -> None:
+                    results[target] = target_payload
+                    elapsed_ms = int(target_payload.get("elapsedMs") or 0)
+                    totals["sum"] += elapsed_ms
+                    totals["ok"] += bool(target_payload.get("ok"))
+                    if elapsed_ms > totals["slow_ms"]:
+                        totals.update(slow_ms=elapsed_ms, slow_name=target)
 
                 if "workspaces" in probe_targets:
-                    workspaces_probe_started = time.perf_counter()
+                    workspaces_probe_started = time.monotonic_ns()
                     workspaces_probe = {"ok": True, "count": len(names), "names": names}
-                    workspaces_probe["elapsedMs"] = max(
-                        int(round((time.perf_counter() - workspaces_probe_started) * 1000.0)),
-                        0,
-                    )
-                    results["workspaces"] = workspaces_probe
+                    workspaces_probe["elapsedMs"] = _elapsed_ms(workspaces_probe_started)
+                    _record("workspaces", workspaces_probe)
                     # Keep backwards compatibility with the previous doctor payload shape.
                     probe["workspaces"] = {"count": len(names), "names": names}
 
-                probe_workspace = str(getattr(ws, "_default_workspace_name", "") or "").strip()
-                workspace_override = str(getattr(args, "workspace_name", "") or "").strip()
+                probe_workspace = _str_attr(ws, "_default_workspace_name")
+                workspace_override = _str_attr(args, "workspace_name")
                 if workspace_override:
                     probe_workspace = workspace_override
                 if not probe_workspace and names:
@@ -3111,133 +3311,91 @@ def main(argv: list[str] | None = None) -> int:
                         "workspace": probe_workspace,
                     }
 
-                def _set_probe_result(target: str, target_payload: dict, started: float) -> None:
-                    elapsed_ms = max(int(round((time.perf_counter() - started) * 1000.0)), 0)
-                    target_payload["elapsedMs"] = elapsed_ms
-                    results[target] = target_payload
-
-                if "assets" in probe_targets:
-                    assets_started = time.perf_counter()
+                def _require_probe_workspace(target: str) -> None:
                     if not probe_workspace:
-                        _set_probe_result(
-                            "assets",
-                            _probe_error(
-                                "no workspace available for assets probe; set WORKSPACE_NAME or --workspace-name"
-                            ),
-                            assets_started,
+                        raise RuntimeError(
+                            f"no workspace available for {target} probe; "
+                            "set WORKSPACE_NAME or --workspace-name"
                         )
-                    else:
-                        try:
-                            list_name = "doctor_probe_assets"
-                            ws.get_workspace_assets(
-                                query_filter='state = "confirmed"',
-                                asset_list_name=list_name,
-                                page=0,
-                                max_page_size=page_size,
-                                max_page_count=1,
-                                get_all=False,
-                                auto_create_facet_filters=False,
-                                workspace_name=probe_workspace,
-                                status_to_stderr=True,
-                                no_track_time=True,
-                            )
-                            asset_list = getattr(ws, list_name, None)
-                            rows = getattr(asset_list, "assets", []) if asset_list else []
-                            _set_probe_result(
-                                "assets",
-                                {
-                                    "ok": True,
-                                    "workspace": probe_workspace,
-                                    "count": len(rows) if isinstance(rows, list) else 0,
-                                },
-                                assets_started,
-                            )
-                        except Exception as e:
-                            _set_probe_result("assets", _probe_error(str(e)), assets_started)
 
-                if "tasks" in probe_targets:
-                    tasks_started = time.perf_counter()
-                    if not probe_workspace:
-                        _set_probe_result(
-                            "tasks",
-                            _probe_error(
-                                "no workspace available for tasks probe; set WORKSPACE_NAME or --workspace-name"
-                            ),
-                            tasks_started,
-                        )
-                    else:
-                        try:
-                            tasks_payload = ws.list_tasks(
-                                workspace_name=probe_workspace,
-                                skip=0,
-                                max_page_size=page_size,
-                                get_all=False,
-                                noprint=True,
-                            )
-                            _set_probe_result(
-                                "tasks",
-                                {
-                                    "ok": True,
-                                    "workspace": probe_workspace,
-                                    "count": len(_payload_items(tasks_payload)),
-                                },
-                                tasks_started,
-                            )
-                        except Exception as e:
-                            _set_probe_result("tasks", _probe_error(str(e)), tasks_started)
+                def _probe_assets() -> dict:
+                    _require_probe_workspace("assets")
+                    list_name = "doctor_probe_assets"
+                    ws.get_workspace_assets(
+                        query_filter='state = "confirmed"',
+                        asset_list_name=list_name,
+                        page=0,
+                        max_page_size=page_size,
+                        max_page_count=1,
+                        get_all=False,
+                        auto_create_facet_filters=False,
+                        workspace_name=probe_workspace,
+                        # The probe reports its own count/elapsedMs; page status lines are noise.
+                        # Keep them on stderr anyway so they can never reach JSON stdout.
+                        quiet=True,
+                        status_to_stderr=True,
+                        no_track_time=True,
+                    )
+                    asset_list = getattr(ws, list_name, None)
+                    rows = getattr(asset_list, "assets", []) if asset_list else []
+                    return {"count": len(rows) if isinstance(rows, list) else 0}
+
+                def _probe_tasks() -> dict:
+                    _require_probe_workspace("tasks")
+                    tasks_payload = ws.list_tasks(
+                        workspace_name=probe_workspace,
+                        skip=0,
+                        max_page_size=page_size,
+                        get_all=False,
+                        noprint=True,
+                    )
+                    return {"count": len(_payload_items(tasks_payload))}
+
+                def _probe_data_connections() -> dict:
+                    _require_probe_workspace("data-connections")
+                    dc_payload = ws.list_data_connections(
+                        workspace_name=probe_workspace,
+                        skip=0,
+                        max_page_size=page_size,
+                        get_all=False,
+                        noprint=True,
+                    )
+                    return {"count": len(_payload_items(dc_payload))}
 
-                if "data-connections" in probe_targets:
-                    data_connections_started = time.perf_counter()
-                    if not probe_workspace:
-                        _set_probe_result(
-                            "data-connections",
-                            _probe_error(
-                                "no workspace available for data-connections probe; set WORKSPACE_NAME or --workspace-name"
-                            ),
-                            data_connections_started,
-                        )
-                    else:
-                        try:
-                            dc_payload = ws.list_data_connections(
-                                workspace_name=probe_workspace,
-                                skip=0,
-                                max_page_size=page_size,
-                                get_all=False,
-                                noprint=True,
-                            )
-                            _set_probe_result(
-                                "data-connections",
-                                {
-                                    "ok": True,
-                                    "workspace": probe_workspace,
-                                    "count": len(_payload_items(dc_payload)),
-                                },
-                                data_connections_started,
-                            )
-                        except Exception as e:
-                            _set_probe_result(
-                                "data-connections",
-                                _probe_error(str(e)),
-                                data_connections_started,
-                            )
+                def _run_probe(fn) -> dict:
+                    started = time.monotonic_ns()
+                    try:
+                        target_payload = {"ok": True, "workspace": probe_workspace, **fn()}
+                    except Exception as e:
+                        target_payload = _probe_error(str(e))
+                    target_payload["elapsedMs"] = _elapsed_ms(started)
+                    return target_payload
+
+                probe_fns = {
+                    "assets": _probe_assets,
+                    "tasks": _probe_tasks,
+                    "data-connections": _probe_data_connections,
+                }
+                active = [t for t in probe_targets if t in probe_fns]
+                wall_started = time.monotonic_ns()
+                if len(active) > 1:
+                    # Each probe is one independent network round-trip; run them side by side so
+                    # the doctor waits for the slowest target instead of the sum of all of them.
+                    from concurrent.futures import ThreadPoolExecutor
+
+                    with ThreadPoolExecutor(max_workers=len(active)) as pool:
+                        futures = {t: pool.submit(_run_probe, probe_fns[t]) for t in active}
+                        for target in active:
+                            _record(target, futures[target].result())
+                else:
+                    for target in active:
+                        _record(target, _run_probe(probe_fns[target]))
+                probe_wall_elapsed_ms = _elapsed_ms(wall_started)
 
-                probe_ok = True
-                probe_total_elapsed_ms = 0
-                probe_ok_count = 0
-                slowest_target = ""
-                slowest_elapsed_ms = -1
-                for target in probe_targets:
-                    target_payload = results.get(target)
-                    elapsed_ms = int((target_payload or {}).get("elapsedMs") or 0)
-                    probe_total_elapsed_ms += elapsed_ms
-                    if elapsed_ms > slowest_elapsed_ms:
-                        slowest_elapsed_ms = elapsed_ms
-                        slowest_target = target
-                    if not target_payload or not bool(target_payload.get("ok")):
-                        probe_ok = False
-                    else:
-                        probe_ok_count += 1
                 probe_target_count = len(probe_targets)
+                probe_total_elapsed_ms = totals["sum"]
+                probe_ok_count = totals["ok"]
+                probe_ok = probe_ok_count == probe_target_count
                 probe["results"] = results
                 probe["ok"] = probe_ok
                 probe["summary"] = {
@@ -3250,8 +3408,9 @@ def main(argv: list[str] | None = None) -> int:
                         if probe_target_count
                         else 0
                     ),
-                    "slowestTarget": slowest_target,
-                    "slowestElapsedMs": max(slowest_elapsed_ms, 0),
+                    "slowestTarget": totals["slow_name"],
+                    "slowestElapsedMs": max(totals["slow_ms"], 0),
+                    "wallElapsedMs": probe_wall_elapsed_ms,
                 }
                 payload["checks"]["probe"] = probe
                 if not probe_ok:
@@ -3260,7 +3419,7 @@ def main(argv: list[str] | None = None) -> int:
                 payload["ok"] = False
                 payload["checks"]["probe"] = {
                     "ok": False,
-                    "targets": probe_targets or ["workspaces"],
+                    "targets": probe_targets or _DEFAULT_DOCTOR_TARGETS,
                     "results": {},
                     "error": str(e),
                 }
@@ -3317,38 +3476,46 @@ def main(argv: list[str] | None = None) -> int:
         return 0 if payload["ok"] else 1
 
     if args.cmd == "workspaces":
-        import mdeasm
-
-        _configure_cli_logging(mdeasm, args)
-
-        ws_kwargs = _build_ws_kwargs(args)
-        # For listing, we want *all* workspaces regardless of WORKSPACE_NAME in the env.
-        ws_kwargs["workspace_name"] = ""
-        # This is a control-plane-only command; don't require data-plane scope.
-        ws_kwargs["init_data_plane_token"] = False
-        # Suppress default-workspace guidance; the command output is the guidance.
-        ws_kwargs["emit_workspace_guidance"] = False
-
+        mdeasm = _load_mdeasm(args)
         try:
-            ws = mdeasm.Workspaces(**ws_kwargs)
+            ws = _new_workspaces(
+                mdeasm,
+                args,
+                # For listing, we want *all* workspaces regardless of WORKSPACE_NAME in the env.
+                workspace_name="",
+                # This is a control-plane-only command; don't require data-plane scope.
+                init_data_plane_token=False,
+                # Suppress default-workspace guidance; the command output is the guidance.
+                emit_workspace_guidance=False,
+            )
         except Exception as e:
             action = args.workspaces_cmd
             sys.stderr.write(f"failed to initialize workspace client for '{action}': {e}\n")
             return 1
 
         if args.workspaces_cmd == "list":
-            items = []
-            for name, endpoints in (getattr(ws, "_workspaces", {}) or {}).items():
-                dp = endpoints[0] if isinstance(endpoints, (list, tuple)) and len(endpoints) > 0 else ""
-                cp = endpoints[1] if isinstance(endpoints, (list, tuple)) and len(endpoints) > 1 else ""
-                items.append({"name": name, "dataPlane": dp, "controlPlane": cp})
-            items.sort(key=lambda d: str(d.get("name", "")).lower())
+            def _workspace_row(name, endpoints) -> dict:
+                if not isinstance(endpoints, (list, tuple)):
+                    endpoints = ()
+                return {
+                    "name": name,
+                    "dataPlane": endpoints[0] if len(endpoints) > 0 else "",
+                    "controlPlane": endpoints[1] if len(endpoints) > 1 else "",
+                }
+
+            # sort() computes each key once per element, so sorting the (name, endpoints) pairs by
+            # the lowered name is already a decorate-sort-undecorate; no per-compare str() calls.
+            workspaces = (getattr(ws, "_workspaces", {}) or {}).items()
+            items = [
+                _workspace_row(name, endpoints)
+                for name, endpoints in sorted(workspaces, key=lambda kv: str(kv[0]).lower())
+            ]
 
             out_path = _resolve_out_path(args.out)
             if args.format == "json":
                 _write_json(out_path, items, pretty=True)
             else:
-                lines = _rows_to_tab_lines(items, ["name", "dataPlane", "controlPlane"])
+                lines = _rows_to_tab_lines(items, _WORKSPACE_LINE_FIELDS)
                 _write_lines(out_path, lines)
             return 0
 
@@ -3404,13 +3571,9 @@ def main(argv: list[str] | None = None) -> int:
         return 2
 
     if args.cmd == "discovery-groups":
-        import mdeasm
-
-        _configure_cli_logging(mdeasm, args)
-
-        ws_kwargs = _build_ws_kwargs(args)
+        mdeasm = _load_mdeasm(args)
         try:
-            ws = mdeasm.Workspaces(**ws_kwargs)
+            ws = _new_workspaces(mdeasm, args)
         except Exception as e:
             return _emit_cli_error(
                 "discovery-groups client initialization", e, mdeasm_module=mdeasm
@@ -3420,47 +3583,37 @@ def main(argv: list[str] | None = None) -> int:
 
         if args.discovery_groups_cmd == "list":
             try:
-                page = max(int(args.page or 0), 0)
                 max_page_size = max(int(args.max_page_size or 25), 1)
-                values: list[dict] = []
-                while True:
-                    payload = ws.get_discovery_groups(
+                # Pages are written as they arrive instead of being collected first.
+                values = _iter_paged_items(
+                    lambda skip: ws.get_discovery_groups(
                         workspace_name=args.workspace_name,
                         filter_expr=args.filter,
-                        skip=page,
+                        skip=skip,
                         max_page_size=max_page_size,
                         noprint=True,
-                    )
-                    batch = _payload_items(payload)
-                    values.extend(batch if args.get_all else batch[:])
-
-                    if not args.get_all:
-                        break
-                    total = payload.get("totalElements") if isinstance(payload, dict) else None
-                    try:
-                        if total is not None and (page + len(batch)) >= int(total):
-                            break
-                    except Exception:
-                        pass
-                    if not batch or len(batch) < max_page_size:
-                        break
-                    page += len(batch)
+                    ),
+                    skip=args.page,
+                    max_page_size=max_page_size,
+                    get_all=args.get_all,
+                )
 
                 if args.format == "json":
-                    _write_json(out_path, values, pretty=True)
+                    _write_json_array_stream(out_path, values, pretty=True, buffer_stdout=True)
                 else:
-                    rows = []
-                    for row in values:
-                        seeds = (row or {}).get("seeds") or []
-                        rows.append(
-                            {
-                                "name": (row or {}).get("name"),
-                                "tier": (row or {}).get("tier"),
-                                "state": (row or {}).get("state"),
-                                "seedCount": len(seeds) if isinstance(seeds, list) else 0,
-                            }
-                        )
-                    _write_lines(out_path, _rows_to_tab_lines(rows, ["name", "tier", "state", "seedCount"]))
+
+                    def _summary_row(row) -> dict:
+                        row = row or {}
+                        seeds = row.get("seeds") or []
+                        return {
+                            "name": row.get("name"),
+                            "tier": row.get("tier"),
+                            "state": row.get("state"),
+                            "seedCount": len(seeds) if isinstance(seeds, list) else 0,
+                        }
+
+                    rows = map(_summary_row, values)
+                    _write_lines(out_path, _rows_to_tab_lines(rows, _DISCOVERY_GROUP_LINE_FIELDS))
                 return 0
             except Exception as e:
                 return _emit_cli_error("discovery-groups list", e, mdeasm_module=mdeasm)
@@ -3488,13 +3641,7 @@ def main(argv: list[str] | None = None) -> int:
                         out_path,
                         _rows_to_tab_lines(
                             rows,
-                            [
-                                "name",
-                                "state",
-                                "submittedDate",
-                                "completedDate",
-                                "totalAssetsFoundCount",
-                            ],
+                            _DISCOVERY_RUN_LINE_FIELDS,
                         ),
                     )
                 return 0
@@ -3518,13 +3665,7 @@ def main(argv: list[str] | None = None) -> int:
                         out_path,
                         _rows_to_tab_lines(
                             rows,
-                            [
-                                "name",
-                                "state",
-                                "submittedDate",
-                                "completedDate",
-                                "totalAssetsFoundCount",
-                            ],
+                            _DISCOVERY_RUN_LINE_FIELDS,
                         ),
                     )
                 return 0
@@ -3559,20 +3700,15 @@ def main(argv: list[str] | None = None) -> int:
         return 2
 
     if args.cmd == "resource-tags":
-        import mdeasm
-
-        _configure_cli_logging(mdeasm, args)
-
-        ws_kwargs = _build_ws_kwargs(args)
-        # Resource tags are control-plane operations.
-        ws_kwargs["init_data_plane_token"] = False
+        mdeasm = _load_mdeasm(args)
         try:
-            ws = mdeasm.Workspaces(**ws_kwargs)
+            # Resource tags are control-plane operations.
+            ws = _new_workspaces(mdeasm, args, init_data_plane_token=False)
         except Exception as e:
             return _emit_cli_error("resource-tags client initialization", e, mdeasm_module=mdeasm)
 
         out_path = _resolve_out_path(getattr(args, "out", ""))
-        workspace_name = str(getattr(args, "workspace_name", "") or "")
+        workspace_name = _str_attr(args, "workspace_name", strip=False)
 
         if args.resource_tags_cmd == "list":
             try:
@@ -3587,7 +3723,7 @@ def main(argv: list[str] | None = None) -> int:
                             {"workspaceName": workspace, "name": name, "value": value}
                             for name, value in sorted(tags.items(), key=lambda kv: str(kv[0]).lower())
                         ],
-                        ["workspaceName", "name", "value"],
+                        _RESOURCE_TAG_LINE_FIELDS,
                     )
                     _write_lines(out_path, lines)
                 return 0
@@ -3608,7 +3744,7 @@ def main(argv: list[str] | None = None) -> int:
                         out_path,
                         _rows_to_tab_lines(
                             [payload],
-                            ["workspaceName", "name", "value"],
+                            _RESOURCE_TAG_LINE_FIELDS,
                         ),
                     )
                 return 0
@@ -3630,7 +3766,7 @@ def main(argv: list[str] | None = None) -> int:
                         out_path,
                         _rows_to_tab_lines(
                             [payload],
-                            ["workspaceName", "name", "value"],
+                            _RESOURCE_TAG_LINE_FIELDS,
                         ),
                     )
                 return 0
@@ -3662,13 +3798,9 @@ def main(argv: list[str] | None = None) -> int:
         return 2
 
     if args.cmd == "saved-filters":
-        import mdeasm
-
-        _configure_cli_logging(mdeasm, args)
-
-        ws_kwargs = _build_ws_kwargs(args)
+        mdeasm = _load_mdeasm(args)
         try:
-            ws = mdeasm.Workspaces(**ws_kwargs)
+            ws = _new_workspaces(mdeasm, args)
         except Exception as e:
             return _emit_cli_error("saved-filters client initialization", e, mdeasm_module=mdeasm)
 
@@ -3676,42 +3808,35 @@ def main(argv: list[str] | None = None) -> int:
 
         if args.saved_filters_cmd == "list":
             try:
-                page = max(int(args.page or 0), 0)
                 max_page_size = max(int(args.max_page_size or 25), 1)
-                values: list[dict] = []
-                while True:
-                    resp = ws.get_saved_filters(
+                # Pages are written as they arrive instead of being collected first.
+                values = _iter_paged_items(
+                    lambda skip: ws.get_saved_filters(
                         workspace_name=args.workspace_name,
                         filter_expr=args.filter,
-                        skip=page,
+                        skip=skip,
                         max_page_size=max_page_size,
                         noprint=True,
-                    )
-                    batch = resp.get("value") or []
-                    if isinstance(batch, list):
-                        values.extend(batch)
-                    if not args.get_all:
-                        break
-                    total = resp.get("totalElements")
-                    try:
-                        if total is not None and (page + len(batch)) >= int(total):
-                            break
-                    except Exception:
-                        pass
-                    if not batch or len(batch) < max_page_size:
-                        break
-                    page += len(batch)
+                    ),
+                    skip=args.page,
+                    max_page_size=max_page_size,
+                    get_all=args.get_all,
+                )
 
                 if args.format == "json":
-                    _write_json(out_path, values, pretty=True)
+                    _write_json_array_stream(out_path, values, pretty=True, buffer_stdout=True)
+                elif args.format == "ndjson":
+                    _write_ndjson(out_path, values)
                 else:
-                    rows = []
-                    for item in values:
-                        name = item.get("name") or item.get("id") or ""
-                        display = item.get("displayName") or ""
-                        filt = item.get("filter") or ""
-                        rows.append({"name": name, "displayName": display, "filter": filt})
-                    lines = _rows_to_tab_lines(rows, ["name", "displayName", "filter"])
+                    rows = (
+                        {
+                            "name": item.get("name") or item.get("id") or "",
+                            "displayName": item.get("displayName") or "",
+                            "filter": item.get("filter") or "",
+                        }
+                        for item in values
+                    )
+                    lines = _rows_to_tab_lines(rows, _SAVED_FILTER_LINE_FIELDS)
                     _write_lines(out_path, lines)
                 return 0
             except Exception as e:
@@ -3767,13 +3892,9 @@ def main(argv: list[str] | None = None) -> int:
         return 2
 
     if args.cmd == "data-connections":
-        import mdeasm
-
-        _configure_cli_logging(mdeasm, args)
-
-        ws_kwargs = _build_ws_kwargs(args)
+        mdeasm = _load_mdeasm(args)
         try:
-            ws = mdeasm.Workspaces(**ws_kwargs)
+            ws = _new_workspaces(mdeasm, args)
         except Exception as e:
             return _emit_cli_error(
                 "data-connections client initialization", e, mdeasm_module=mdeasm
@@ -3782,28 +3903,29 @@ def main(argv: list[str] | None = None) -> int:
 
         if args.data_connections_cmd == "list":
             try:
-                payload = ws.list_data_connections(
-                    workspace_name=args.workspace_name,
+                max_page_size = max(int(args.max_page_size or 25), 1)
+                # Page here (rather than helper get_all) so rows are written as pages arrive.
+                values = _iter_paged_items(
+                    lambda skip: ws.list_data_connections(
+                        workspace_name=args.workspace_name,
+                        skip=skip,
+                        max_page_size=max_page_size,
+                        get_all=False,
+                        noprint=True,
+                    ),
                     skip=args.page,
-                    max_page_size=args.max_page_size,
+                    max_page_size=max_page_size,
                     get_all=args.get_all,
-                    noprint=True,
                 )
-                values = _payload_items(payload)
 
                 if args.format == "json":
-                    _write_json(out_path, values, pretty=True)
+                    _write_json_array_stream(out_path, values, pretty=True, buffer_stdout=True)
+                elif args.format == "ndjson":
+                    _write_ndjson(out_path, values)
                 else:
                     lines = _rows_to_tab_lines(
                         values,
-                        [
-                            "name",
-                            "kind",
-                            "content",
-                            "frequency",
-                            "frequencyOffset",
-                            "provisioningState",
-                        ],
+                        _DATA_CONNECTION_LINE_FIELDS,
                     )
                     _write_lines(out_path, lines)
                 return 0
@@ -3820,12 +3942,14 @@ def main(argv: list[str] | None = None) -> int:
             except Exception as e:
                 return _emit_cli_error("data-connections get", e, mdeasm_module=mdeasm)
 
-        if args.data_connections_cmd == "put":
+        if args.data_connections_cmd in ("put", "validate"):
             try:
                 properties = _build_data_connection_properties(args)
             except ValueError as e:
                 sys.stderr.write(f"invalid data connection arguments: {e}\n")
                 return 2
+
+        if args.data_connections_cmd == "put":
             try:
                 payload = ws.create_or_replace_data_connection(
                     args.name,
@@ -3843,11 +3967,6 @@ def main(argv: list[str] | None = None) -> int:
                 return _emit_cli_error("data-connections put", e, mdeasm_module=mdeasm)
 
         if args.data_connections_cmd == "validate":
-            try:
-                properties = _build_data_connection_properties(args)
-            except ValueError as e:
-                sys.stderr.write(f"invalid data connection arguments: {e}\n")
-                return 2
             try:
                 payload = ws.validate_data_connection(
                     kind=args.kind,
@@ -3888,13 +4007,34 @@ def main(argv: list[str] | None = None) -> int:
         return 2
 
     if args.cmd == "tasks":
-        import mdeasm
-
-        _configure_cli_logging(mdeasm, args)
-
-        ws_kwargs = _build_ws_kwargs(args)
+        mdeasm = _load_mdeasm(args)
+        # Resolve task ids before building the client (token fetches) so bad input fails fast.
+        task_ids: list[str] = []
+        if args.tasks_cmd == "fetch-many" or (
+            args.tasks_cmd == "get" and (args.task_ids or args.task_ids_from)
+        ):
+            try:
+                task_ids = _collect_task_ids(args)
+            except Exception as e:
+                sys.stderr.write(f"invalid --task-ids-from: {e}\n")
+                return 2
+            if not task_ids:
+                sys.stderr.write("no task ids given\n")
+                return 2
+        elif args.tasks_cmd == "get" and not args.task_id:
+            sys.stderr.write("tasks get requires a task id (or --task-ids/--task-ids-from)\n")
+            return 2
+        ws_overrides = {}
+        if task_ids:
+            # At least one pooled keep-alive connection per batch worker; a larger
+            # EASM_HTTP_POOL_MAXSIZE still wins (the kwarg would otherwise shadow the env var).
+            try:
+                env_pool_size = int(os.getenv("EASM_HTTP_POOL_MAXSIZE") or 0)
+            except ValueError:
+                env_pool_size = 0
+            ws_overrides["http_pool_maxsize"] = max(int(args.concurrency or 1), 1, env_pool_size)
         try:
-            ws = mdeasm.Workspaces(**ws_kwargs)
+            ws = _new_workspaces(mdeasm, args, **ws_overrides)
         except Exception as e:
             return _emit_cli_error("tasks client initialization", e, mdeasm_module=mdeasm)
         out_path = _resolve_out_path(getattr(args, "out", ""))
@@ -3917,7 +4057,7 @@ def main(argv: list[str] | None = None) -> int:
                 else:
                     lines = _rows_to_tab_lines(
                         values,
-                        ["id", "state", "startedAt", "completedAt"],
+                        _TASK_LINE_FIELDS,
                     )
                     _write_lines(out_path, lines)
                 return 0
@@ -3925,6 +4065,8 @@ def main(argv: list[str] | None = None) -> int:
                 return _emit_cli_error("tasks list", e, mdeasm_module=mdeasm)
 
         if args.tasks_cmd == "get":
+            if task_ids:
+                return _write_task_batch(ws, task_ids, args, out_path, mdeasm_module=mdeasm)
             try:
                 payload = ws.get_task(args.task_id, workspace_name=args.workspace_name, noprint=True)
                 _write_json(out_path, payload, pretty=True)
@@ -3940,6 +4082,8 @@ def main(argv: list[str] | None = None) -> int:
                     workspace_name=args.workspace_name,
                     poll_interval_s=args.poll_interval_s,
                     timeout_s=args.timeout_s,
+                    backoff_factor=args.poll_backoff_factor,
+                    max_interval_s=args.poll_max_interval_s,
                 )
             except TimeoutError as e:
                 sys.stderr.write(f"{e}\n")
@@ -3947,7 +4091,7 @@ def main(argv: list[str] | None = None) -> int:
             except Exception as e:
                 return _emit_cli_error("tasks wait", e, mdeasm_module=mdeasm)
 
-            state = str((payload or {}).get("state", "")).strip().lower()
+            state = _task_state(payload)
             if state in _TASK_FAILURE_TERMINAL_STATES:
                 err_code, err_message = _extract_task_terminal_error(payload)
                 if err_code or err_message:
@@ -3983,33 +4127,28 @@ def main(argv: list[str] | None = None) -> int:
                 )
             return 0
 
-        if args.tasks_cmd == "cancel":
-            try:
-                payload = ws.cancel_task(args.task_id, workspace_name=args.workspace_name, noprint=True)
-                _write_json(out_path, payload, pretty=True)
-                return 0
-            except Exception as e:
-                return _emit_cli_error("tasks cancel", e, mdeasm_module=mdeasm)
-
-        if args.tasks_cmd == "run":
-            try:
-                payload = ws.run_task(args.task_id, workspace_name=args.workspace_name, noprint=True)
-                _write_json(out_path, payload, pretty=True)
-                return 0
-            except Exception as e:
-                return _emit_cli_error("tasks run", e, mdeasm_module=mdeasm)
-
-        if args.tasks_cmd == "download":
+        action_method = _TASK_ACTION_METHODS.get(args.tasks_cmd)
+        if action_method is not None:
             try:
-                payload = ws.download_task(args.task_id, workspace_name=args.workspace_name, noprint=True)
+                payload = getattr(ws, action_method)(
+                    args.task_id, workspace_name=args.workspace_name, noprint=True
+                )
+                if args.tasks_cmd == "download":
+                    _remember_download_task(ws, args.task_id, args.workspace_name, payload)
                 _write_json(out_path, payload, pretty=True)
                 return 0
             except Exception as e:
-                return _emit_cli_error("tasks download", e, mdeasm_module=mdeasm)
+                return _emit_cli_error(f"tasks {args.tasks_cmd}", e, mdeasm_module=mdeasm)
 
         if args.tasks_cmd == "fetch":
             try:
-                payload = ws.download_task(args.task_id, workspace_name=args.workspace_name, noprint=True)
+                # --reference-out records the raw response, so always ask the service for it.
+                payload = _download_task_cached(
+                    ws,
+                    args.task_id,
+                    args.workspace_name,
+                    ttl_s=0.0 if args.reference_out else None,
+                )
             except Exception as e:
                 return _emit_cli_error("tasks fetch", e, mdeasm_module=mdeasm)
             artifact_url = _extract_download_url(payload)
@@ -4026,78 +4165,41 @@ def main(argv: list[str] | None = None) -> int:
 
             summary_out = _resolve_out_path(args.out)
             artifact_path = Path(args.artifact_out)
-            timeout = args.http_timeout or getattr(ws, "_http_timeout", (10.0, 60.0))
-            retry = not bool(args.no_retry)
-            max_retry = (
-                int(args.max_retry)
-                if args.max_retry is not None
-                else int(getattr(ws, "_default_max_retry", 5))
-            )
-            backoff_max_s = (
-                float(args.backoff_max_s)
-                if args.backoff_max_s is not None
-                else float(getattr(ws, "_backoff_max_s", 30))
-            )
-            try:
-                retry_on_statuses = _parse_retry_on_statuses(args.retry_on_statuses)
-            except Exception as e:
-                sys.stderr.write(f"invalid --retry-on-statuses: {e}\n")
-                return 2
             try:
                 expected_sha256 = _normalize_sha256_hex(args.sha256)
             except Exception as e:
                 sys.stderr.write(f"invalid --sha256: {e}\n")
                 return 2
-            session = getattr(ws, "_session", None)
-            auth_token = str(getattr(ws, "_dp_token", "") or "")
 
             try:
                 result = _download_url_to_file(
                     url=artifact_url,
                     out_path=artifact_path,
-                    timeout=timeout,
-                    retry=retry,
-                    max_retry=max_retry,
-                    backoff_max_s=backoff_max_s,
-                    retry_on_statuses=retry_on_statuses,
-                    chunk_size=args.chunk_size,
-                    overwrite=bool(args.overwrite),
-                    session=session,
-                    auth_token=auth_token,
                     expected_sha256=expected_sha256,
+                    **_artifact_download_kwargs(ws, args),
                 )
             except Exception as e:
                 return _emit_cli_error("tasks fetch", e, mdeasm_module=mdeasm)
 
-            parsed = urllib.parse.urlparse(artifact_url)
-            redacted_url = artifact_url
-            redactor = getattr(mdeasm, "redact_sensitive_text", None)
-            if callable(redactor):
-                redacted_url = redactor(artifact_url)
-            summary = {
-                "task_id": args.task_id,
-                "artifact_out": str(artifact_path),
-                "bytes_written": int(result.get("bytes_written", 0)),
-                "status_code": int(result.get("status_code", 0)),
-                "used_bearer_auth": bool(result.get("used_bearer_auth", False)),
-                "download_host": parsed.netloc,
-                "download_url": redacted_url,
-            }
-            if expected_sha256:
-                summary["sha256"] = str(result.get("sha256", ""))
-                summary["sha256_verified"] = bool(result.get("sha256_verified", False))
+            summary = _artifact_fetch_summary(
+                args.task_id,
+                artifact_path,
+                artifact_url,
+                result,
+                expected_sha256=expected_sha256,
+                mdeasm_module=mdeasm,
+            )
             _write_json(summary_out, summary, pretty=True)
             return 0
 
+        if args.tasks_cmd == "fetch-many":
+            return _fetch_task_artifacts(ws, task_ids, args, mdeasm_module=mdeasm)
+
         sys.stderr.write("unknown tasks command\n")
         return 2
 
     if args.cmd == "assets" and args.assets_cmd in ("export", "schema"):
-        # Import inside the command so `--help` works without requiring env/config.
-        import mdeasm
-
-        _configure_cli_logging(mdeasm, args)
-        ws_kwargs = _build_ws_kwargs(args)
+        mdeasm = _load_mdeasm(args)
 
         try:
             query_filter = _resolve_filter_arg(args.filter)
@@ -4106,17 +4208,17 @@ def main(argv: list[str] | None = None) -> int:
             return 2
 
         try:
-            ws = mdeasm.Workspaces(**ws_kwargs)
+            ws = _new_workspaces(mdeasm, args)
         except Exception as e:
             return _emit_cli_error("assets client initialization", e, mdeasm_module=mdeasm)
         if args.assets_cmd == "export":
             out_path = _resolve_out_path(args.out)
 
-            columns: list[str] = _parse_columns_arg(args.columns)
+            # File columns first, then --columns flags; one split/strip/dedup pass over both.
+            column_args = args.columns or []
             if args.columns_from:
-                columns = _read_columns_file(Path(args.columns_from)) + columns
-                # Dedup while preserving file order first.
-                columns = _parse_columns_arg(columns)
+                column_args = [*_read_lines_file(Path(args.columns_from)), *column_args]
+            columns: list[str] = _parse_columns_arg(column_args)
 
             if args.mode == "server":
                 if args.format != "json":
@@ -4155,12 +4257,14 @@ def main(argv: list[str] | None = None) -> int:
                             workspace_name=args.workspace_name,
                             poll_interval_s=args.poll_interval_s,
                             timeout_s=args.wait_timeout_s,
+                            backoff_factor=args.poll_backoff_factor,
+                            max_interval_s=args.poll_max_interval_s,
                         )
                     except TimeoutError as e:
                         sys.stderr.write(f"{e}\n")
                         return 1
                     output_payload = final_task
-                    state = str((final_task or {}).get("state", "")).strip().lower()
+                    state = _task_state(final_task)
                     if args.download_on_complete and state in {"complete", "completed"}:
                         try:
                             dl = ws.download_task(
@@ -4170,6 +4274,7 @@ def main(argv: list[str] | None = None) -> int:
                             )
                         except Exception as e:
                             return _emit_cli_error("assets export", e, mdeasm_module=mdeasm)
+                        _remember_download_task(ws, task_id, args.workspace_name, dl)
                         output_payload = {"task": final_task, "download": dl}
 
                 _write_json(out_path, output_payload, pretty=bool(args.pretty))
@@ -4179,7 +4284,7 @@ def main(argv: list[str] | None = None) -> int:
                 if args.format != "json":
                     sys.stderr.write("--stream-json-array requires --format json\n")
                     return 2
-                if not args.no_facet_filters:
+                if args.facet_filters:
                     sys.stderr.write("--stream-json-array requires --no-facet-filters\n")
                     return 2
 
@@ -4195,39 +4300,66 @@ def main(argv: list[str] | None = None) -> int:
 
             progress_callback = None
             if args.checkpoint_out:
-                checkpoint_path = Path(args.checkpoint_out)
-
-                def _checkpoint_cb(state):
-                    payload = {
-                        "next_page": state.get("next_page"),
-                        "next_mark": state.get("next_mark"),
-                        "pages_completed": state.get("pages_completed"),
-                        "assets_emitted": state.get("assets_emitted"),
-                        "total_elements": state.get("total_elements"),
-                        "last": bool(state.get("last")),
-                    }
-                    _atomic_write_text(
-                        checkpoint_path,
-                        json.dumps(payload, indent=2, sort_keys=True) + "\n",
-                        encoding="utf-8",
-                    )
-
-                progress_callback = _checkpoint_cb
+                progress_callback = _CheckpointWriter(
+                    Path(args.checkpoint_out),
+                    min_interval_s=max(float(args.checkpoint_min_interval_s or 0), 0.0),
+                )
 
             if args.format == "csv" and not columns:
                 columns = []
 
-            if (
-                args.no_facet_filters
-                and hasattr(ws, "stream_workspace_assets")
-                and (args.format in ("ndjson", "csv") or bool(args.stream_json_array))
-            ):
-                stream_kwargs = dict(
+            try:
+                if (
+                    not args.facet_filters
+                    and hasattr(ws, "stream_workspace_assets")
+                    and (args.format in ("ndjson", "csv") or bool(args.stream_json_array))
+                ):
+                    stream_kwargs = dict(
+                        query_filter=query_filter,
+                        page=resume_page,
+                        max_page_size=args.max_page_size,
+                        max_page_count=args.max_page_count,
+                        get_all=args.get_all,
+                        workspace_name=args.workspace_name,
+                        # Keep machine-readable stdout clean; status/progress goes to stderr.
+                        status_to_stderr=True,
+                        max_assets=args.max_assets or 0,
+                        orderby=args.orderby,
+                    )
+                    if resume_mark:
+                        stream_kwargs["mark"] = resume_mark
+                    if progress_callback is not None:
+                        stream_kwargs["progress_callback"] = progress_callback
+                    if args.progress_every_pages and args.progress_every_pages > 0:
+                        stream_kwargs["track_every_N_pages"] = args.progress_every_pages
+                    else:
+                        # Only emit the initial/final status lines by default.
+                        stream_kwargs["no_track_time"] = True
+
+                    if args.format == "ndjson":
+                        _write_ndjson(out_path, ws.stream_workspace_assets(**stream_kwargs))
+                        return 0
+                    if args.format == "json" and args.stream_json_array:
+                        _write_json_array_stream(
+                            out_path,
+                            ws.stream_workspace_assets(**stream_kwargs),
+                            pretty=bool(args.pretty),
+                        )
+                        return 0
+                    if args.format == "csv" and columns:
+                        _write_csv_stream(
+                            out_path, ws.stream_workspace_assets(**stream_kwargs), columns=columns
+                        )
+                        return 0
+
+                get_kwargs = dict(
                     query_filter=query_filter,
+                    asset_list_name=args.asset_list_name,
                     page=resume_page,
                     max_page_size=args.max_page_size,
                     max_page_count=args.max_page_count,
                     get_all=args.get_all,
+                    auto_create_facet_filters=args.facet_filters,
                     workspace_name=args.workspace_name,
                     # Keep machine-readable stdout clean; status/progress goes to stderr.
                     status_to_stderr=True,
@@ -4235,69 +4367,51 @@ def main(argv: list[str] | None = None) -> int:
                     orderby=args.orderby,
                 )
                 if resume_mark:
-                    stream_kwargs["mark"] = resume_mark
+                    get_kwargs["mark"] = resume_mark
                 if progress_callback is not None:
-                    stream_kwargs["progress_callback"] = progress_callback
+                    get_kwargs["progress_callback"] = progress_callback
                 if args.progress_every_pages and args.progress_every_pages > 0:
-                    stream_kwargs["track_every_N_pages"] = args.progress_every_pages
+                    get_kwargs["track_every_N_pages"] = args.progress_every_pages
                 else:
                     # Only emit the initial/final status lines by default.
-                    stream_kwargs["no_track_time"] = True
-
-                if args.format == "ndjson":
-                    _write_ndjson(out_path, ws.stream_workspace_assets(**stream_kwargs))
-                    return 0
-                if args.format == "json" and args.stream_json_array:
-                    _write_json_array_stream(
-                        out_path,
-                        ws.stream_workspace_assets(**stream_kwargs),
-                        pretty=bool(args.pretty),
-                    )
-                    return 0
-                if args.format == "csv" and columns:
-                    _write_csv_stream(
-                        out_path, ws.stream_workspace_assets(**stream_kwargs), columns=columns
-                    )
-                    return 0
-
-            get_kwargs = dict(
-                query_filter=query_filter,
-                asset_list_name=args.asset_list_name,
-                page=resume_page,
-                max_page_size=args.max_page_size,
-                max_page_count=args.max_page_count,
-                get_all=args.get_all,
-                auto_create_facet_filters=not args.no_facet_filters,
-                workspace_name=args.workspace_name,
-                # Keep machine-readable stdout clean; status/progress goes to stderr.
-                status_to_stderr=True,
-                max_assets=args.max_assets or 0,
-                orderby=args.orderby,
-            )
-            if resume_mark:
-                get_kwargs["mark"] = resume_mark
-            if progress_callback is not None:
-                get_kwargs["progress_callback"] = progress_callback
-            if args.progress_every_pages and args.progress_every_pages > 0:
-                get_kwargs["track_every_N_pages"] = args.progress_every_pages
-            else:
-                # Only emit the initial/final status lines by default.
-                get_kwargs["no_track_time"] = True
+                    get_kwargs["no_track_time"] = True
 
-            try:
-                ws.get_workspace_assets(**get_kwargs)
-            except Exception as e:
-                return _emit_cli_error("assets export", e, mdeasm_module=mdeasm)
+                try:
+                    ws.get_workspace_assets(**get_kwargs)
+                except Exception as e:
+                    return _emit_cli_error("assets export", e, mdeasm_module=mdeasm)
 
-            asset_list = getattr(ws, args.asset_list_name)
-            rows = asset_list.as_dicts() if hasattr(asset_list, "as_dicts") else []
-            if args.format == "json":
-                _write_json(out_path, rows, pretty=bool(args.pretty))
-            elif args.format == "ndjson":
-                _write_ndjson(out_path, rows)
-            else:
-                _write_csv(out_path, rows, columns=(columns or None))
-            return 0
+                asset_list = getattr(ws, args.asset_list_name)
+                iter_dicts = getattr(asset_list, "iter_dicts", None)
+                if callable(iter_dicts) and (args.format != "csv" or columns):
+                    # The helper already holds every asset; convert them one row at a time while
+                    # writing instead of materializing a second full list of dicts. CSV without
+                    # explicit columns still needs all rows up front for the union header.
+                    rows = iter_dicts()
+                    if args.format == "json":
+                        _write_json_array_stream(out_path, rows, pretty=bool(args.pretty))
+                    elif args.format == "ndjson":
+                        _write_ndjson(out_path, rows)
+                    else:
+                        _write_csv_stream(out_path, rows, columns=columns)
+                    return 0
+                rows = asset_list.as_dicts() if hasattr(asset_list, "as_dicts") else []
+                if args.format == "json":
+                    _write_json(out_path, rows, pretty=bool(args.pretty))
+                elif args.format == "ndjson":
+                    _write_ndjson(out_path, rows)
+                else:
+                    _write_csv(out_path, rows, columns=(columns or None))
+                return 0
+            finally:
+                if progress_callback is not None:
+                    # Persist the newest debounced state, even when the export failed midway. A
+                    # checkpoint that can't be written is reported but never replaces the export's
+                    # own result (or masks its error).
+                    try:
+                        progress_callback.flush()
+                    except Exception as e:
+                        _emit_cli_error("assets export checkpoint", e, mdeasm_module=mdeasm)
 
         if args.assets_cmd == "schema":
             get_kwargs = dict(
@@ -4320,9 +4434,15 @@ def main(argv: list[str] | None = None) -> int:
                 return _emit_cli_error("assets schema", e, mdeasm_module=mdeasm)
 
             asset_list = getattr(ws, "assetList", None)
-            rows = asset_list.as_dicts() if asset_list and hasattr(asset_list, "as_dicts") else []
+            # Only the key union is needed: stream rows rather than building the full dict list.
+            if asset_list is not None and hasattr(asset_list, "iter_dicts"):
+                rows = asset_list.iter_dicts()
+            elif asset_list is not None and hasattr(asset_list, "as_dicts"):
+                rows = asset_list.as_dicts()
+            else:
+                rows = ()
 
-            cols = sorted({k for r in rows for k in r.keys()})
+            cols = _row_key_union(rows)
             out_path = _resolve_out_path(args.out)
             if args.schema_action == "diff":
                 if not args.baseline:
@@ -1,6 +1,8 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT / "API"))
@@ -22,6 +24,30 @@ def test_build_completion_index_includes_nested_subcommands():
     assert "--probe" in index["doctor"]["options"]
 
 
+def test_build_parser_for_single_command_matches_full_parser():
+    argv = ["tasks", "wait", "abc", "--poll-interval-s", "1", "--max-retry", "2", "-vv"]
+    full = mdeasm_cli.build_parser().parse_args(argv)
+    partial_parser = mdeasm_cli.build_parser("tasks")
+    assert vars(partial_parser.parse_args(argv)) == vars(full)
+
+    index = mdeasm_cli._build_completion_index(partial_parser)
+    assert index[""]["subcommands"] == ["tasks"]
+    assert set(mdeasm_cli._SUBCOMMAND_REGISTRARS) == set(
+        mdeasm_cli._build_completion_index(mdeasm_cli.build_parser())[""]["subcommands"]
+    )
+
+
+def test_shared_parent_defaults_do_not_leak_between_parses():
+    parser = mdeasm_cli.build_parser()
+    first = parser.parse_args(["tasks", "get", "abc", "--max-retry", "7", "--no-retry", "-vv"])
+    assert (first.max_retry, first.retry, first.verbose) == (7, False, 2)
+    second = mdeasm_cli.build_parser().parse_args(["saved-filters", "list"])
+    assert (second.max_retry, second.retry, second.verbose) == (None, True, 0)
+    assert second.dp_api_version is None
+    ws = parser.parse_args(["workspaces", "list"])
+    assert not hasattr(ws, "dp_api_version")
+
+
 def test_cli_completions_bash_stdout(capsys):
     rc = mdeasm_cli.main(["completions", "bash"])
     assert rc == 0
@@ -55,3 +81,50 @@ def test_cli_completions_writes_file(tmp_path, capsys):
     data = out_path.read_text(encoding="utf-8")
     assert "_MDEASM_SUBCOMMANDS" in data
     assert "complete -o default -F _mdeasm_complete mdeasm" in data
+
+
+def test_main_reuses_cached_parser_per_command(monkeypatch, capsys):
+    mdeasm_cli._cached_parser.cache_clear()
+    built = []
+    real_build = mdeasm_cli.build_parser
+
+    def counting_build(command=None, **kwargs):
+        built.append(command)
+        return real_build(command, **kwargs)
+
+    monkeypatch.setattr(mdeasm_cli, "build_parser", counting_build)
+    for _ in range(3):
+        assert mdeasm_cli.main(["completions", "bash"]) == 0
+    assert built == ["completions", None]
+    assert "complete" in capsys.readouterr().out
+    mdeasm_cli._cached_parser.cache_clear()
+
+
+def test_top_level_help_uses_summary_parser(monkeypatch, capsys):
+    full_help = mdeasm_cli.build_parser().format_help()
+    assert list(mdeasm_cli._SUBCOMMAND_HELP) == list(mdeasm_cli._SUBCOMMAND_REGISTRARS)
+
+    mdeasm_cli._cached_parser.cache_clear()
+
+    def boom(sub):
+        raise AssertionError("top-level help should not build command subtrees")
+
+    monkeypatch.setattr(
+        mdeasm_cli, "_SUBCOMMAND_REGISTRARS", dict.fromkeys(mdeasm_cli._SUBCOMMAND_REGISTRARS, boom)
+    )
+    for argv, code in ((["--help"], 0), ([], 2), (["nope"], 2)):
+        with pytest.raises(SystemExit) as excinfo:
+            mdeasm_cli.main(argv)
+        assert excinfo.value.code == code
+    captured = capsys.readouterr()
+    assert captured.out == full_help
+    assert "invalid choice: 'nope'" in captured.err
+    mdeasm_cli._cached_parser.cache_clear()
+
+
+def test_build_parser_restores_argparse_gettext():
+    import argparse
+
+    original = argparse._
+    mdeasm_cli.build_parser()
+    assert argparse._ is original
@@ -72,6 +72,47 @@ def test_cli_data_connections_list_content_fallback(monkeypatch, capsys):
     assert out == [{"name": "dc-content", "kind": "azureDataExplorer"}]
 
 
+def test_cli_data_connections_list_get_all_pages_in_cli(monkeypatch, capsys):
+    calls = []
+    pages = {
+        0: {"totalElements": 3, "value": [{"name": "dc1"}, {"name": "dc2"}]},
+        2: {"totalElements": 3, "value": [{"name": "dc3"}]},
+    }
+
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def list_data_connections(self, **kwargs):
+            calls.append((kwargs["skip"], kwargs["get_all"]))
+            return pages[kwargs["skip"]]
+
+    fake_mdeasm = types.SimpleNamespace(Workspaces=DummyWS)
+    monkeypatch.setitem(sys.modules, "mdeasm", fake_mdeasm)
+
+    rc = mdeasm_cli.main(
+        ["data-connections", "list", "--get-all", "--max-page-size", "2", "--out", "-"]
+    )
+    assert rc == 0
+    assert [x["name"] for x in json.loads(capsys.readouterr().out)] == ["dc1", "dc2", "dc3"]
+    assert calls == [(0, False), (2, False)]
+
+
+def test_cli_data_connections_list_empty_json_matches_json_dumps(monkeypatch, capsys):
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def list_data_connections(self, **kwargs):
+            return {"value": []}
+
+    fake_mdeasm = types.SimpleNamespace(Workspaces=DummyWS)
+    monkeypatch.setitem(sys.modules, "mdeasm", fake_mdeasm)
+
+    assert mdeasm_cli.main(["data-connections", "list", "--out", "-"]) == 0
+    assert capsys.readouterr().out == "[]\n"
+
+
 def test_cli_data_connections_get_surfaces_api_error_payload(monkeypatch, capsys):
     class ApiRequestError(Exception):
         pass
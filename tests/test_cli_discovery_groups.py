@@ -3,6 +3,8 @@ import sys
 import types
 from pathlib import Path
 
+import pytest
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT / "API"))
@@ -331,3 +333,28 @@ def test_cli_discovery_groups_list_surfaces_api_error_payload(monkeypatch, capsy
     assert "discovery-groups list failed" in err
     assert "status=403" in err
     assert "code=AuthorizationFailed" in err
+
+
+def test_cli_discovery_groups_backoff_jitter_is_forwarded_and_validated(monkeypatch, capsys):
+    captured = {}
+
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            captured["init"] = dict(kwargs)
+
+        def get_discovery_groups(self, **kwargs):
+            return {"value": []}
+
+    monkeypatch.setitem(sys.modules, "mdeasm", types.SimpleNamespace(Workspaces=DummyWS))
+
+    rc = mdeasm_cli.main(
+        ["discovery-groups", "list", "--backoff-jitter", "0.5", "--format", "json", "--out", "-"]
+    )
+    assert rc == 0
+    assert captured["init"]["backoff_jitter"] == 0.5
+    capsys.readouterr()
+
+    with pytest.raises(SystemExit) as exc:
+        mdeasm_cli.main(["discovery-groups", "list", "--backoff-jitter", "1.5"])
+    assert exc.value.code == 2
+    assert "--backoff-jitter: jitter must be between 0.0 and 1.0" in capsys.readouterr().err
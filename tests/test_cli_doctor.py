@@ -11,14 +11,16 @@ import mdeasm_cli  # noqa: E402
 
 
 def test_parse_doctor_probe_targets():
-    assert mdeasm_cli._parse_doctor_probe_targets("workspaces") == ["workspaces"]
-    assert mdeasm_cli._parse_doctor_probe_targets("assets,tasks") == ["assets", "tasks"]
-    assert mdeasm_cli._parse_doctor_probe_targets("all") == [
+    assert mdeasm_cli._parse_doctor_probe_targets("workspaces") == ("workspaces",)
+    assert mdeasm_cli._parse_doctor_probe_targets("") == ("workspaces",)
+    assert mdeasm_cli._parse_doctor_probe_targets("assets,tasks") == ("assets", "tasks")
+    assert mdeasm_cli._parse_doctor_probe_targets("Task,tasks,asset") == ("tasks", "assets")
+    assert mdeasm_cli._parse_doctor_probe_targets("all") == (
         "workspaces",
         "assets",
         "tasks",
         "data-connections",
-    ]
+    )
 
 
 def test_cli_doctor_missing_required_env(monkeypatch, capsys):
@@ -151,6 +153,8 @@ def test_cli_doctor_probe_matrix_all_targets(monkeypatch, capsys):
     assert captured["init_kwargs"].get("workspace_name", "") == ""
     assert "init_data_plane_token" not in captured["init_kwargs"]
     assert captured["assets_calls"][0]["workspace_name"] == "wsA"
+    assert captured["assets_calls"][0]["quiet"] is True
+    assert captured["assets_calls"][0]["status_to_stderr"] is True
     assert captured["tasks_kwargs"]["workspace_name"] == "wsA"
     assert captured["dc_kwargs"]["workspace_name"] == "wsA"
 
@@ -167,3 +171,62 @@ def test_cli_doctor_probe_invalid_target_returns_2(monkeypatch, capsys):
     assert rc == 2
     err = capsys.readouterr().err
     assert "invalid --probe-targets" in err
+
+
+def test_cli_doctor_probe_runs_data_plane_targets_concurrently(monkeypatch, capsys):
+    import threading
+
+    monkeypatch.setenv("TENANT_ID", "t")
+    monkeypatch.setenv("SUBSCRIPTION_ID", "s")
+    monkeypatch.setenv("CLIENT_ID", "c")
+    monkeypatch.setenv("CLIENT_SECRET", "secret")
+    monkeypatch.setenv("WORKSPACE_NAME", "wsA")
+
+    # Serial probes would each time out waiting here; concurrent ones release together.
+    barrier = threading.Barrier(3, timeout=5)
+
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            self._workspaces = {"wsA": ("dp", "cp")}
+            self._default_workspace_name = "wsA"
+
+        def get_workspace_assets(self, **kwargs):
+            barrier.wait()
+            setattr(self, kwargs["asset_list_name"], types.SimpleNamespace(assets=[{}]))
+
+        def list_tasks(self, **kwargs):
+            barrier.wait()
+            return {"value": []}
+
+        def list_data_connections(self, **kwargs):
+            barrier.wait()
+            raise RuntimeError("boom")
+
+    monkeypatch.setitem(sys.modules, "mdeasm", types.SimpleNamespace(Workspaces=DummyWS))
+
+    rc = mdeasm_cli.main(["doctor", "--probe", "--probe-targets", "all", "--format", "json"])
+    assert rc == 1
+
+    probe = json.loads(capsys.readouterr().out)["checks"]["probe"]
+    assert set(probe["results"]) == {"workspaces", "assets", "tasks", "data-connections"}
+    assert probe["results"]["assets"] == {
+        "ok": True,
+        "workspace": "wsA",
+        "count": 1,
+        "elapsedMs": probe["results"]["assets"]["elapsedMs"],
+    }
+    assert probe["results"]["data-connections"]["ok"] is False
+    assert probe["results"]["data-connections"]["error"] == "boom"
+    assert probe["summary"]["okCount"] == 3
+    assert probe["summary"]["wallElapsedMs"] >= 0
+
+
+def test_find_dotenv_path_walks_up_from_cwd_and_explicit_start(monkeypatch, tmp_path):
+    root = tmp_path.resolve()
+    (root / ".env").write_text("TENANT_ID=x\n", encoding="utf-8")
+    nested = root / "a" / "b"
+    nested.mkdir(parents=True)
+
+    monkeypatch.chdir(nested)
+    assert mdeasm_cli._find_dotenv_path() == root / ".env"
+    assert mdeasm_cli._find_dotenv_path(Path("..")) == root / ".env"
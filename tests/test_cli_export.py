@@ -2,6 +2,7 @@ import json
 import sys
 import types
 from pathlib import Path
+from datetime import datetime, timezone
 import io
 
 import pytest
@@ -97,6 +98,34 @@ def test_cli_assets_export_json_writes_file(tmp_path, monkeypatch):
     assert payload == [{"id": "domain$$example.com", "kind": "domain"}]
 
 
+def test_cli_assets_export_streams_rows_from_iter_dicts(tmp_path, monkeypatch):
+    rows = [{"id": "domain$$a.example", "kind": "domain"}, {"id": "host$$b", "kind": "host"}]
+
+    class DummyAssetList:
+        def iter_dicts(self):
+            yield from rows
+
+        def as_dicts(self):
+            raise AssertionError("facet-filter export should not materialize every row")
+
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            self.assetList = DummyAssetList()
+
+        def get_workspace_assets(self, **kwargs):
+            return None
+
+    monkeypatch.setitem(sys.modules, "mdeasm", types.SimpleNamespace(Workspaces=DummyWS))
+
+    out = tmp_path / "assets.json"
+    base = ["assets", "export", "--filter", 'kind = "domain"', "--out", str(out)]
+    assert mdeasm_cli.main([*base, "--format", "json", "--pretty"]) == 0
+    assert out.read_text(encoding="utf-8") == json.dumps(rows, indent=2, sort_keys=True) + "\n"
+
+    assert mdeasm_cli.main([*base, "--format", "csv", "--columns", "id"]) == 0
+    assert out.read_text(encoding="utf-8").splitlines() == ["id", "domain$$a.example", "host$$b"]
+
+
 def test_cli_assets_export_filter_at_file(tmp_path, monkeypatch):
     out = tmp_path / "assets.json"
     filter_path = tmp_path / "filter.txt"
@@ -359,6 +388,15 @@ def test_cli_assets_schema_diff_lines_fail_on_drift(monkeypatch, capsys, tmp_pat
     assert "- domain" in out
 
 
+def test_parse_columns_arg_splits_strips_and_dedups_in_order():
+    assert mdeasm_cli._parse_columns_arg(None) == []
+    assert mdeasm_cli._parse_columns_arg(["id, kind", "", "kind,,name", " id "]) == [
+        "id",
+        "kind",
+        "name",
+    ]
+
+
 def test_cli_assets_schema_diff_requires_baseline(monkeypatch, capsys):
     class DummyAssetList:
         def as_dicts(self):
@@ -379,6 +417,31 @@ def test_cli_assets_schema_diff_requires_baseline(monkeypatch, capsys):
     assert "requires --baseline" in capsys.readouterr().err
 
 
+def test_build_parser_does_not_resolve_version(monkeypatch):
+    def boom():
+        raise AssertionError("version should only be resolved for --version")
+
+    monkeypatch.setattr(mdeasm_cli, "_cli_version", boom)
+    args = mdeasm_cli.build_parser().parse_args(["completions", "bash"])
+    assert args.shell == "bash"
+
+
+def test_importing_cli_does_not_import_requests():
+    import subprocess
+
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); import mdeasm_cli; "
+        "mdeasm_cli.build_parser(); print('requests' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code, str(REPO_ROOT / "API")],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    assert out.stdout.strip() == "False"
+
+
 def test_cli_version_flag_exits_cleanly(capsys):
     ver = mdeasm_cli._cli_version()
     with pytest.raises(SystemExit) as e:
@@ -787,6 +850,49 @@ def test_cli_assets_export_csv_columns_from_file_preserves_order(tmp_path, monke
     assert header == "kind,id,ports"
 
 
+def test_cli_assets_export_merges_columns_file_and_flags(tmp_path, monkeypatch):
+    out = tmp_path / "assets.csv"
+    cols = tmp_path / "cols.txt"
+    cols.write_text("kind, id\n# comment\nports\n", encoding="utf-8")
+
+    class DummyAssetList:
+        def as_dicts(self):
+            return [{"id": "domain$$example.com", "kind": "domain", "extra": 1}]
+
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            self.assetList = DummyAssetList()
+
+        def get_workspace_assets(self, **kwargs):
+            return None
+
+    monkeypatch.setitem(sys.modules, "mdeasm", types.SimpleNamespace(Workspaces=DummyWS))
+
+    rc = mdeasm_cli.main(
+        [
+            "assets",
+            "export",
+            "--filter",
+            'kind = "domain"',
+            "--format",
+            "csv",
+            "--out",
+            str(out),
+            "--columns-from",
+            str(cols),
+            "--columns",
+            "id,extra",
+            "--columns",
+            "ports",
+            "--no-facet-filters",
+        ]
+    )
+    assert rc == 0
+
+    header = out.read_text(encoding="utf-8").replace("\r\n", "\n").splitlines()[0]
+    assert header == "kind,id,ports,extra"
+
+
 def test_cli_assets_export_wires_http_knobs(tmp_path, monkeypatch):
     out = tmp_path / "assets.json"
     captured = {}
@@ -1064,6 +1170,37 @@ def test_cli_assets_export_resume_checkpoint_and_orderby(tmp_path, monkeypatch):
     assert payload["next_mark"] == "mark-11"
 
 
+def test_checkpoint_writer_debounces_and_flushes_newest_state(tmp_path, monkeypatch):
+    checkpoint = tmp_path / "checkpoint.json"
+    writes = []
+    real_write = mdeasm_cli._atomic_write_text
+
+    def counting_write(path, text, **kwargs):
+        writes.append(json.loads(text)["next_page"])
+        real_write(path, text, **kwargs)
+
+    monkeypatch.setattr(mdeasm_cli, "_atomic_write_text", counting_write)
+    now = [100.0]
+    monkeypatch.setattr(mdeasm_cli.time, "monotonic", lambda: now[0])
+
+    writer = mdeasm_cli._CheckpointWriter(checkpoint, min_interval_s=2.0)
+    writer({"next_page": 1})
+    writer({"next_page": 2})
+    writer({"next_page": 3})
+    assert writes == [1]
+    now[0] += 2.5
+    writer({"next_page": 4})
+    writer({"next_page": 5})
+    assert writes == [1, 4]
+    writer.flush()
+    writer.flush()
+    assert writes == [1, 4, 5]
+    writer({"next_page": 6, "last": True})
+    writer({"next_page": 6, "last": True})
+    assert writes == [1, 4, 5, 6]
+    assert json.loads(checkpoint.read_text(encoding="utf-8"))["last"] is True
+
+
 def test_cli_assets_export_stream_resume_from_checkpoint_file(tmp_path, monkeypatch):
     out = tmp_path / "assets.ndjson"
     checkpoint = tmp_path / "checkpoint.json"
@@ -1165,6 +1302,203 @@ def test_write_json_is_atomic_on_replace_error(tmp_path, monkeypatch):
     assert list(tmp_path.glob(f".{out.name}.*.tmp")) == []
 
 
+def test_write_json_array_stream_pretty_matches_json_dumps(tmp_path):
+    rows = [{"id": "a", "tags": ["x", "line1\nline2"], "nested": {"b": 1}}, {"id": "b"}]
+    out = tmp_path / "assets.json"
+
+    mdeasm_cli._write_json_array_stream(out, iter(rows), pretty=True)
+    assert out.read_text(encoding="utf-8") == json.dumps(rows, indent=2, sort_keys=True) + "\n"
+
+    mdeasm_cli._write_json_array_stream(out, iter(rows), pretty=False)
+    assert out.read_text(encoding="utf-8") == (
+        json.dumps(rows, sort_keys=True, separators=(",", ":")) + "\n"
+    )
+
+
+def test_write_ndjson_batches_rows_across_flushes(tmp_path):
+    rows = [{"id": f"asset-{i}", "n": i} for i in range(mdeasm_cli._NDJSON_WRITE_BATCH_ROWS * 2 + 3)]
+    out = tmp_path / "assets.ndjson"
+
+    mdeasm_cli._write_ndjson(out, iter(rows))
+    lines = out.read_text(encoding="utf-8").split("\n")
+    assert lines[-1] == ""
+    assert [json.loads(line) for line in lines[:-1]] == rows
+
+
+def test_write_ndjson_stdout_emits_rows_before_a_later_failure(monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr(mdeasm_cli.sys, "stdout", out)
+
+    def rows():
+        yield {"id": "a"}
+        yield {"id": "b"}
+        raise RuntimeError("page 2 failed")
+
+    with pytest.raises(RuntimeError):
+        mdeasm_cli._write_ndjson(None, rows())
+    assert out.getvalue() == '{"id":"a"}\n{"id":"b"}\n'
+
+
+def test_write_csv_matches_dictwriter_output(tmp_path):
+    import csv
+
+    rows = [
+        {"id": "a", "tags": ["x", "y"], "meta": {"b": 1, "a": 2}, "extra": "dropped"},
+        {"id": 'quote "me", please', "tags": None},
+        {"id": "line\nbreak", "meta": {}},
+    ]
+    fieldnames = ["id", "meta", "tags"]
+    expected = io.StringIO(newline="")
+    writer = csv.DictWriter(expected, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(
+            {
+                k: json.dumps(v, sort_keys=True) if isinstance(v, (dict, list)) else v
+                for k, v in row.items()
+                if k in fieldnames
+            }
+        )
+
+    out = tmp_path / "rows.csv"
+    mdeasm_cli._write_csv(out, rows, columns=fieldnames)
+    assert out.read_bytes() == expected.getvalue().encode("utf-8")
+
+    streamed = tmp_path / "stream.csv"
+    mdeasm_cli._write_csv_stream(streamed, iter(rows), columns=fieldnames)
+    assert streamed.read_bytes() == out.read_bytes()
+
+
+def test_write_csv_stream_writes_blank_row_for_non_dict_rows(tmp_path):
+    out = tmp_path / "rows.csv"
+    rows = [{"id": "a", "n": [1]}, None, {"n": {"k": "v"}}]
+    mdeasm_cli._write_csv_stream(out, iter(rows), columns=["id", "n"])
+    assert out.read_bytes() == b'id,n\r\na,[1]\r\n,\r\n,"{""k"": ""v""}"\r\n'
+
+
+def test_csv_row_extractor_handles_single_column_and_dict_subclasses():
+    from collections import defaultdict
+
+    one = mdeasm_cli._csv_row_extractor(["id"])
+    assert one({"id": "a", "x": 1}) == ["a"]
+    assert one({"x": 1}) == [None]
+    assert one({"id": ["y"]}) == ['["y"]']
+
+    extract = mdeasm_cli._csv_row_extractor(["a", "b"])
+    row = defaultdict(lambda: "filled", {"a": 1})
+    assert extract(row) == [1, None]
+    assert "b" not in row
+    assert mdeasm_cli._csv_row_extractor([])({"a": 1}) == []
+
+
+def test_write_csv_opens_temp_file_with_large_buffer(tmp_path, monkeypatch):
+    seen = []
+    real_open = mdeasm_cli._atomic_open_text
+
+    def spy_open(path, **kwargs):
+        seen.append(kwargs.get("buffering"))
+        return real_open(path, **kwargs)
+
+    monkeypatch.setattr(mdeasm_cli, "_atomic_open_text", spy_open)
+    mdeasm_cli._write_csv(tmp_path / "a.csv", [{"id": "x"}])
+    mdeasm_cli._write_csv_stream(tmp_path / "b.csv", iter([{"id": "y"}]), columns=["id"])
+    assert seen == [mdeasm_cli._ATOMIC_WRITE_BUFFER_BYTES] * 2
+    assert (tmp_path / "b.csv").read_bytes() == b"id\r\ny\r\n"
+
+
+def test_atomic_writers_skip_fsync_unless_durable(tmp_path, monkeypatch):
+    fsync_calls = []
+    monkeypatch.setattr(mdeasm_cli.os, "fsync", lambda fd: fsync_calls.append("fsync"))
+    monkeypatch.setattr(
+        mdeasm_cli.os, "fdatasync", lambda fd: fsync_calls.append("fdatasync"), raising=False
+    )
+    monkeypatch.delenv("MDEASM_ATOMIC_FSYNC", raising=False)
+
+    mdeasm_cli._write_ndjson(tmp_path / "a.ndjson", [{"id": "x"}])
+    mdeasm_cli._write_json_array_stream(tmp_path / "a.json", [{"id": "x"}], pretty=False)
+    mdeasm_cli._write_csv(tmp_path / "a.csv", [{"id": "x"}])
+    assert fsync_calls == []
+
+    # Durable writes sync the temp file data, then the parent directory after the rename.
+    mdeasm_cli._write_json(tmp_path / "b.json", {"id": "x"}, pretty=False, durable=True)
+    assert fsync_calls == ["fdatasync", "fsync"]
+
+    monkeypatch.setenv("MDEASM_ATOMIC_FSYNC", "1")
+    mdeasm_cli._atomic_write_text(tmp_path / "c.txt", "x\n")
+    assert fsync_calls == ["fdatasync", "fsync"] * 2
+    assert (tmp_path / "c.txt").read_text(encoding="utf-8") == "x\n"
+
+
+def test_atomic_writers_batch_mode_syncs_once_at_exit(tmp_path, monkeypatch):
+    synced = []
+    registered = []
+    monkeypatch.setattr(mdeasm_cli.os, "fsync", lambda fd: synced.append(("fsync", fd)))
+    monkeypatch.setattr(
+        mdeasm_cli.os, "fdatasync", lambda fd: synced.append(("fdatasync", fd)), raising=False
+    )
+    monkeypatch.setattr(mdeasm_cli.atexit, "register", lambda fn: registered.append(fn))
+    monkeypatch.setattr(mdeasm_cli, "_BATCHED_FSYNC_PATHS", [])
+    monkeypatch.setenv("MDEASM_ATOMIC_FSYNC", "batch")
+
+    mdeasm_cli._write_csv(tmp_path / "a.csv", [{"id": "x"}])
+    mdeasm_cli._write_ndjson(tmp_path / "b.ndjson", [{"id": "y"}])
+    assert synced == []
+    assert (tmp_path / "a.csv").exists() and (tmp_path / "b.ndjson").exists()
+    assert registered == [mdeasm_cli._commit_batched_fsync]
+
+    mdeasm_cli._commit_batched_fsync()
+    # Two file data syncs, then a single barrier for the shared parent directory.
+    assert len(synced) == 3
+    assert synced[-1][0] == "fsync"
+    assert mdeasm_cli._BATCHED_FSYNC_PATHS == []
+
+
+def test_json_default_dispatches_by_type_without_losing_fallbacks():
+    class Model:
+        def as_dict(self):
+            return {"kind": "model"}
+
+    class Broken:
+        def __init__(self):
+            self.name = "broken"
+
+        def as_dict(self):
+            raise RuntimeError("boom")
+
+    assert mdeasm_cli._json_default(Model()) == {"kind": "model"}
+    assert mdeasm_cli._json_default(Broken()) == {"name": "broken"}
+    assert mdeasm_cli._json_default(types.SimpleNamespace(as_dict=lambda: {"a": 1})) == {"a": 1}
+    assert mdeasm_cli._json_default(types.SimpleNamespace(b=2)) == {"b": 2}
+    assert mdeasm_cli._json_default(datetime(2024, 1, 2, tzinfo=timezone.utc)) == (
+        "2024-01-02 00:00:00+00:00"
+    )
+    assert mdeasm_cli._JSON_DEFAULT_KINDS[Model] == "as_dict"
+    assert mdeasm_cli._JSON_DEFAULT_KINDS[datetime] == "str"
+
+
+def test_write_json_streams_same_bytes_and_cleans_up_on_error(tmp_path):
+    payload = {"b": [1, {"z": "é", "a": None}], "a": "x"}
+    out = tmp_path / "p.json"
+    mdeasm_cli._write_json(out, payload, pretty=True)
+    expected = json.dumps(payload, indent=2, sort_keys=True) + "\n"
+    assert out.read_text(encoding="utf-8") == expected
+
+    compact = tmp_path / "c.json"
+    mdeasm_cli._write_json(compact, payload, pretty=False)
+    expected = json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n"
+    assert compact.read_text(encoding="utf-8") == expected
+
+    bad = tmp_path / "bad.json"
+    try:
+        mdeasm_cli._write_json(bad, {"x": {(1, 2): "tuple keys are not JSON"}}, pretty=False)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("expected TypeError for unserializable payload")
+    assert not bad.exists()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["c.json", "p.json"]
+
+
 def test_cli_workspaces_list_json_to_stdout(monkeypatch, capsys):
     captured = {}
 
@@ -1276,3 +1610,114 @@ def test_cli_workspaces_delete_aborts_when_confirmation_mismatch(monkeypatch, ca
     rc = mdeasm_cli.main(["workspaces", "delete", "ws1"])
     assert rc == 1
     assert "aborted: confirmation did not match workspace name" in capsys.readouterr().err
+
+
+def test_cli_assets_schema_streams_iter_dicts(monkeypatch, capsys):
+    class DummyAssetList:
+        def iter_dicts(self):
+            yield {"id": "a", "kind": "domain"}
+            yield {"id": "b", "ipAddress": "1.2.3.4"}
+
+        def as_dicts(self):
+            raise AssertionError("schema should not materialize the asset list")
+
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            self.assetList = DummyAssetList()
+
+        def get_workspace_assets(self, **kwargs):
+            return None
+
+    monkeypatch.setitem(sys.modules, "mdeasm", types.SimpleNamespace(Workspaces=DummyWS))
+
+    rc = mdeasm_cli.main(["assets", "schema", "--filter", 'kind = "domain"', "--out", "-"])
+    assert rc == 0
+    assert capsys.readouterr().out.splitlines() == ["id", "ipAddress", "kind"]
+
+
+def test_cli_assets_export_reused_client_starts_fresh_asset_list(tmp_path, monkeypatch):
+    inits = []
+
+    class DummyAssetList:
+        def __init__(self):
+            self.rows = []
+
+        def as_dicts(self):
+            return list(self.rows)
+
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            inits.append(kwargs)
+
+        def get_workspace_assets(self, asset_list_name="assetList", **kwargs):
+            # Mirrors Workspaces: an existing list is appended to, not replaced.
+            if not hasattr(self, asset_list_name):
+                setattr(self, asset_list_name, DummyAssetList())
+            getattr(self, asset_list_name).rows.append({"id": "domain$$example.com"})
+
+    monkeypatch.setitem(
+        sys.modules, "mdeasm", types.SimpleNamespace(Workspaces=DummyWS, AssetList=DummyAssetList)
+    )
+    monkeypatch.setattr(mdeasm_cli, "_WS_CACHE", {})
+    monkeypatch.setenv("MDEASM_CLI_REUSE_WS", "1")
+
+    out = tmp_path / "assets.json"
+    argv = ["assets", "export", "--filter", 'kind = "domain"', "--format", "json"]
+    for _ in range(3):
+        assert mdeasm_cli.main(argv + ["--out", str(out), "--no-facet-filters"]) == 0
+        assert json.loads(out.read_text(encoding="utf-8")) == [{"id": "domain$$example.com"}]
+    assert len(inits) == 1
+
+    monkeypatch.setenv("EASM_HTTP_POOL_MAXSIZE", "16")
+    assert mdeasm_cli.main(argv + ["--out", str(out), "--no-facet-filters"]) == 0
+    assert len(inits) == 2
+
+
+def test_cli_assets_export_checkpoint_flush_failure_keeps_result(tmp_path, monkeypatch, capsys):
+    out = tmp_path / "assets.json"
+    writes = []
+
+    class DummyAssetList:
+        def as_dicts(self):
+            return [{"id": "domain$$example.com"}]
+
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            self.assetList = DummyAssetList()
+
+        def get_workspace_assets(self, progress_callback=None, **kwargs):
+            # The second state lands inside the debounce window and is left for flush().
+            for page in (1, 2):
+                progress_callback({"next_page": page, "last": False})
+
+    def flaky_write(path, text, **kwargs):
+        if path.name == "checkpoint.json" and writes:
+            raise OSError("checkpoint dir is read-only")
+        writes.append(path)
+        path.write_text(text, encoding="utf-8")
+
+    monkeypatch.setitem(sys.modules, "mdeasm", types.SimpleNamespace(Workspaces=DummyWS))
+    monkeypatch.setattr(mdeasm_cli, "_atomic_write_text", flaky_write)
+
+    rc = mdeasm_cli.main(
+        [
+            "assets",
+            "export",
+            "--filter",
+            'kind = "domain"',
+            "--format",
+            "ndjson",
+            "--out",
+            str(out),
+            "--no-facet-filters",
+            "--checkpoint-out",
+            str(tmp_path / "checkpoint.json"),
+            "--checkpoint-min-interval-s",
+            "60",
+        ]
+    )
+    assert rc == 0
+    assert json.loads(out.read_text(encoding="utf-8")) == {"id": "domain$$example.com"}
+    err = capsys.readouterr().err
+    assert "assets export checkpoint failed" in err
+    assert "read-only" in err
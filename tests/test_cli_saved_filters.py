@@ -39,6 +39,53 @@ def test_cli_saved_filters_list_json(monkeypatch, capsys):
     assert captured["calls"] == 1
 
 
+def test_cli_saved_filters_list_ndjson_get_all(monkeypatch, capsys):
+    skips = []
+
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def get_saved_filters(self, **kwargs):
+            skips.append(kwargs["skip"])
+            if kwargs["skip"] == 0:
+                return {"totalElements": 3, "value": [{"name": "sfA"}, {"name": "sfB"}]}
+            return {"totalElements": 3, "value": [{"name": "sfC"}]}
+
+    fake_mdeasm = types.SimpleNamespace(Workspaces=DummyWS)
+    monkeypatch.setitem(sys.modules, "mdeasm", fake_mdeasm)
+
+    rc = mdeasm_cli.main(
+        ["saved-filters", "list", "--format", "ndjson", "--get-all", "--max-page-size", "2"]
+    )
+    assert rc == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["sfA", "sfB", "sfC"]
+    assert skips == [0, 2]
+
+
+def test_cli_saved_filters_list_json_stdout_is_all_or_nothing(monkeypatch, capsys):
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def get_saved_filters(self, **kwargs):
+            if kwargs["skip"] == 0:
+                return {"totalElements": 3, "value": [{"name": "sfA"}, {"name": "sfB"}]}
+            raise RuntimeError("page 2 failed")
+
+    monkeypatch.setitem(sys.modules, "mdeasm", types.SimpleNamespace(Workspaces=DummyWS))
+
+    rc = mdeasm_cli.main(
+        ["saved-filters", "list", "--format", "json", "--get-all", "--max-page-size", "2"]
+    )
+    assert rc == 1
+    captured = capsys.readouterr()
+    # A failed later page must not leave a truncated JSON array on stdout.
+    assert captured.out == ""
+    assert "page 2 failed" in captured.err
+
+
 def test_cli_saved_filters_list_lines(monkeypatch, capsys):
     class DummyWS:
         def __init__(self, *args, **kwargs):
@@ -1,10 +1,14 @@
+import io
 import json
+import os
 import hashlib
 import sys
 import types
 from datetime import datetime, timezone
 from pathlib import Path
 
+import pytest
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(REPO_ROOT / "API"))
@@ -31,6 +35,15 @@ def test_rows_to_tab_lines_normalizes_control_whitespace():
     assert lines == ["a b\tline1 line2\tc d"]
 
 
+def test_rows_to_tab_lines_fills_missing_and_none_cells():
+    lines = mdeasm_cli._rows_to_tab_lines(
+        [{"name": "ws", "state": None}, {"state": 3}],
+        ["name", "state"],
+    )
+    assert lines == ["ws\t", "\t3"]
+    assert mdeasm_cli._rows_to_tab_lines([], ["name"]) == []
+
+
 def test_parse_retry_after_seconds_supports_delay_and_http_date():
     now = datetime(2026, 2, 11, 0, 0, 0, tzinfo=timezone.utc)
 
@@ -46,6 +59,63 @@ def test_parse_retry_after_seconds_handles_invalid_and_past_values():
     assert mdeasm_cli._parse_retry_after_seconds("Tue, 10 Feb 2026 23:59:59 GMT", now=now) == 0
 
 
+def test_extract_download_url_prefers_priority_keys_over_document_order():
+    payload = {
+        "links": [{"href": "https://example.test/href"}],
+        "result": {"url": "https://example.test/url", "sasUrl": "https://example.test/sas"},
+        "nested": [[{"downloadUrl": " https://example.test/download "}]],
+    }
+    assert mdeasm_cli._extract_download_url(payload) == "https://example.test/download"
+
+    del payload["nested"]
+    assert mdeasm_cli._extract_download_url(payload) == "https://example.test/sas"
+    assert mdeasm_cli._extract_download_url({"a": ["ftp://x", "http://first", "http://second"]}) == (
+        "http://first"
+    )
+    assert mdeasm_cli._extract_download_url({"a": "not a url"}) == ""
+
+
+def test_extract_task_terminal_error_prefers_shallowest_error():
+    payload = {
+        "state": "failed",
+        "details": [{"inner": {"error": {"code": "Deep", "message": "deep"}}}],
+        "result": {"error": {"code": "Shallow", "message": "shallow"}},
+    }
+    assert mdeasm_cli._extract_task_terminal_error(payload) == ("Shallow", "shallow")
+
+    deep: dict = {"code": "TooDeep"}
+    for _ in range(mdeasm_cli._TASK_ERROR_MAX_DEPTH + 5):
+        deep = {"next": deep}
+    assert mdeasm_cli._extract_task_terminal_error(deep) == ("", "")
+
+
+def test_extract_api_error_details_json_body_and_wrapped_text():
+    assert mdeasm_cli._extract_api_error_details(
+        '{"status": 404, "error": {"code": "NotFound", "message": "missing task"}}'
+    ) == (404, "NotFound", "missing task")
+    assert mdeasm_cli._extract_api_error_details(
+        'called by: get_task -- last_status: 503 -- last_text: {"code": "Busy", "message": "later"}'
+    ) == (503, "Busy", "later")
+    assert mdeasm_cli._extract_api_error_details("{not json") == (None, "", "")
+    assert mdeasm_cli._extract_api_error_details(
+        "prefix_last_status: 500 -- LAST_STATUS:\n 429 -- Last_Text:  not json"
+    ) == (429, "", "")
+    assert mdeasm_cli._extract_api_error_details("last_status: 4041") == (None, "", "")
+
+
+def test_normalize_sha256_hex_rejects_non_hex_and_whitespace():
+    digest = hashlib.sha256(b"x").hexdigest()
+    assert mdeasm_cli._normalize_sha256_hex("SHA256:" + digest.upper()) == digest
+    assert mdeasm_cli._normalize_sha256_hex("") == ""
+    for bad in (digest[:-1], digest[:-1] + "g", digest[:30] + "  " + digest[32:], digest + "00"):
+        try:
+            mdeasm_cli._normalize_sha256_hex(bad)
+        except ValueError as e:
+            assert "64-character hex" in str(e)
+        else:
+            raise AssertionError(f"accepted {bad!r}")
+
+
 def test_cli_tasks_list_json(monkeypatch, capsys):
     captured = {}
 
@@ -180,6 +250,171 @@ def test_cli_tasks_wait_returns_terminal_payload(monkeypatch, capsys):
     assert out["state"] == "complete"
 
 
+def test_cli_reuses_workspaces_client_when_opted_in(monkeypatch, capsys):
+    inits = []
+
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            inits.append(dict(kwargs))
+
+        def get_task(self, task_id, **kwargs):
+            return {"id": task_id}
+
+    monkeypatch.setitem(sys.modules, "mdeasm", types.SimpleNamespace(Workspaces=DummyWS))
+    monkeypatch.setattr(mdeasm_cli, "_WS_CACHE", {})
+
+    assert mdeasm_cli.main(["tasks", "get", "a"]) == 0
+    assert mdeasm_cli.main(["tasks", "get", "b"]) == 0
+    assert len(inits) == 2
+
+    monkeypatch.setenv("MDEASM_CLI_REUSE_WS", "1")
+    assert mdeasm_cli.main(["tasks", "get", "a"]) == 0
+    assert mdeasm_cli.main(["tasks", "get", "b"]) == 0
+    assert len(inits) == 3
+    assert mdeasm_cli.main(["tasks", "get", "c", "--max-retry", "2"]) == 0
+    assert len(inits) == 4
+    capsys.readouterr()
+
+
+def test_cli_tasks_get_batch_fetches_ids_in_order(monkeypatch, capsys, tmp_path):
+    init_kwargs = []
+
+    class DummyWS:
+        def __init__(self, *args, **kwargs):
+            init_kwargs.append(kwargs)
+
+        def get_task(self, task_id, **kwargs):
+            if task_id == "bad":
+                raise RuntimeError("not found")
+            return {"id": task_id, "state": "running"}
+
+    monkeypatch.setitem(sys.modules, "mdeasm", types.SimpleNamespace(Workspaces=DummyWS))
+    ids_file = tmp_path / "ids.txt"
+    ids_file.write_text("# queued\nt3\nt1\n\n", encoding="utf-8")
+
+    rc = mdeasm_cli.main(
+        ["tasks", "get", "t1", "--task-ids", "t2, t1", "--task-ids-from", str(ids_file)]
+    )
+    assert rc == 0
+    assert [t["id"] for t in json.loads(capsys.readouterr().out)] == ["t1", "t2", "t3"]
+    # The HTTP pool is sized to the worker count so concurrent gets reuse connections.
+    assert init_kwargs[-1]["http_pool_maxsize"] == 4
+    monkeypatch.setenv("EASM_HTTP_POOL_MAXSIZE", "64")
+    assert mdeasm_cli.main(["tasks", "get", "--task-ids", "t1,t2"]) == 0
+    assert init_kwargs[-1]["http_pool_maxsize"] == 64
+    capsys.readouterr()
+    # A single id is not a batch: the client reads EASM_HTTP_POOL_MAXSIZE itself.
+    assert mdeasm_cli.main(["tasks", "get", "t1"]) == 0
+    assert "http_pool_maxsize" not in init_kwargs[-1]
+    capsys.readouterr()
+    monkeypatch.delenv("EASM_HTTP_POOL_MAXSIZE")
+
+    rc = mdeasm_cli.main(["tasks", "get", "--task-ids", "a,bad,b", "--concurrency", "1"])
+    assert rc == 1
+    captured = capsys.readouterr()
+    assert [t["id"] for t in json.loads(captured.out)] == ["a", "b"]
+    assert "tasks get bad" in captured.err
+
+    clients_before = len(init_kwargs)
+    assert mdeasm_cli.main(["tasks", "get"]) == 2
+    assert "requires a task id" in capsys.readouterr().err
+    assert mdeasm_cli.main(["tasks", "get", "--task-ids", " , "]) == 2
+    assert "no task ids given" in capsys.readouterr().err
+    # Missing ids are rejected before the client (and its token fetches) is built.
+    assert len(init_kwargs) == clients_before
+
+
+def test_wait_for_task_state_backs_off_geometrically(monkeypatch):
+    sleeps = []
+    states = ["queued"] * 6 + ["complete"]
+
+    class DummyWS:
+        def get_task(self, task_id, **kwargs):
+            return {"id": task_id, "state": states.pop(0)}
+
+    monkeypatch.setattr(mdeasm_cli.time, "sleep", lambda s: sleeps.append(s))
+    monkeypatch.setattr(mdeasm_cli.random, "uniform", lambda a, b: 1.0)
+    payload = mdeasm_cli._wait_for_task_state(
+        DummyWS(),
+        task_id="abc",
+        workspace_name="",
+        poll_interval_s=2.0,
+        timeout_s=0,
+        max_interval_s=8.0,
+    )
+    assert payload["state"] == "complete"
+    assert sleeps == [2.0, 3.0, 4.5, 6.75, 8.0, 8.0]
+
+
+def test_wait_for_task_state_resets_backoff_on_progress_and_jitters(monkeypatch):
+    sleeps = []
+    bounds = []
+    states = ["queued", "queued", "queued", "running", "running", "complete"]
+
+    class DummyWS:
+        def get_task(self, task_id, **kwargs):
+            return {"id": task_id, "state": states.pop(0)}
+
+    def fake_uniform(a, b):
+        bounds.append((a, b))
+        return b
+
+    monkeypatch.setattr(mdeasm_cli.time, "sleep", lambda s: sleeps.append(s))
+    monkeypatch.setattr(mdeasm_cli.random, "uniform", fake_uniform)
+    mdeasm_cli._wait_for_task_state(
+        DummyWS(),
+        task_id="abc",
+        workspace_name="",
+        poll_interval_s=1.0,
+        timeout_s=0,
+        backoff_factor=2.0,
+        jitter=0.2,
+    )
+    assert bounds == [(0.8, 1.2)] * 5
+    assert sleeps == pytest.approx([1.2, 2.4, 4.8, 1.2, 2.4])
+
+
+def test_wait_for_task_state_jitter_never_exceeds_cap(monkeypatch):
+    sleeps = []
+    states = ["queued"] * 4 + ["complete"]
+
+    class DummyWS:
+        def get_task(self, task_id, **kwargs):
+            return {"id": task_id, "state": states.pop(0)}
+
+    monkeypatch.setattr(mdeasm_cli.time, "sleep", lambda s: sleeps.append(s))
+    monkeypatch.setattr(mdeasm_cli.random, "uniform", lambda a, b: b)
+    mdeasm_cli._wait_for_task_state(
+        DummyWS(),
+        task_id="abc",
+        workspace_name="",
+        poll_interval_s=2.0,
+        timeout_s=0,
+        backoff_factor=float("nan"),
+        max_interval_s=2.2,
+    )
+    # NaN factor falls back to a fixed interval; +20% jitter is clipped at the 2.2s cap.
+    assert sleeps == pytest.approx([2.2] * 4)
+
+
+@pytest.mark.parametrize(
+    "flag,value,reason",
+    [
+        ("--poll-backoff-factor", "nan", "finite number >= 1.0"),
+        ("--poll-backoff-factor", "0.5", "finite number >= 1.0"),
+        ("--poll-backoff-factor", "fast", "finite number >= 1.0"),
+        ("--poll-max-interval-s", "inf", "finite number > 0"),
+        ("--poll-max-interval-s", "0", "finite number > 0"),
+    ],
+)
+def test_cli_tasks_wait_rejects_invalid_poll_knobs(flag, value, reason, capsys):
+    with pytest.raises(SystemExit):
+        mdeasm_cli.main(["tasks", "wait", "abc", flag, value])
+    err = capsys.readouterr().err
+    assert f"argument {flag}: " in err
+    assert reason in err
+
+
 def test_cli_tasks_wait_times_out(monkeypatch, capsys):
     class DummyWS:
         def __init__(self, *args, **kwargs):
@@ -285,7 +520,7 @@ def test_cli_tasks_fetch_downloads_artifact(monkeypatch, capsys, tmp_path):
         text = ""
 
         def iter_content(self, chunk_size=65536):
-            assert chunk_size == 65536
+            assert chunk_size == mdeasm_cli._DOWNLOAD_CHUNK_SIZE_DEFAULT
             yield b"col1,col2\n"
             yield b"a,b\n"
 
@@ -303,7 +538,7 @@ def test_cli_tasks_fetch_downloads_artifact(monkeypatch, capsys, tmp_path):
         redact_sensitive_text=lambda s: str(s).replace("sig=secret", "sig=[REDACTED]"),
     )
     monkeypatch.setitem(sys.modules, "mdeasm", fake_mdeasm)
-    monkeypatch.setattr(mdeasm_cli.requests, "get", fake_get)
+    monkeypatch.setattr(mdeasm_cli, "_HTTP_SESSION", types.SimpleNamespace(get=fake_get))
 
     rc = mdeasm_cli.main(
         [
@@ -368,7 +603,7 @@ def test_cli_tasks_fetch_retries_with_bearer_for_protected_url(monkeypatch, caps
 
     fake_mdeasm = types.SimpleNamespace(Workspaces=DummyWS, redact_sensitive_text=lambda s: s)
     monkeypatch.setitem(sys.modules, "mdeasm", fake_mdeasm)
-    monkeypatch.setattr(mdeasm_cli.requests, "get", fake_get)
+    monkeypatch.setattr(mdeasm_cli, "_HTTP_SESSION", types.SimpleNamespace(get=fake_get))
 
     rc = mdeasm_cli.main(["tasks", "fetch", "abc", "--artifact-out", str(artifact), "--out", "-"])
     assert rc == 0
@@ -378,6 +613,76 @@ def test_cli_tasks_fetch_retries_with_bearer_for_protected_url(monkeypatch, caps
     assert payload["used_bearer_auth"] is True
 
 
+def test_cli_tasks_fetch_many_downloads_into_artifact_dir(monkeypatch, capsys, tmp_path):
+    class DummyWS:
+        _dp_token = ""
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def download_task(self, task_id, **kwargs):
+            if task_id == "nourl":
+                return {"id": task_id}
+            return {"id": task_id, "downloadUrl": f"https://blob.test/{task_id}/export.csv?sig=x"}
+
+    class OkResp:
+        status_code = 200
+        text = ""
+
+        def __init__(self, body):
+            self._body = body
+
+        def iter_content(self, chunk_size=65536):
+            yield self._body
+
+        def close(self):
+            return None
+
+    def fake_get(url, **kwargs):
+        return OkResp(url.split("/")[3].encode())
+
+    fake_mdeasm = types.SimpleNamespace(Workspaces=DummyWS, redact_sensitive_text=lambda s: s)
+    monkeypatch.setitem(sys.modules, "mdeasm", fake_mdeasm)
+    monkeypatch.setattr(mdeasm_cli, "_HTTP_SESSION", types.SimpleNamespace(get=fake_get))
+
+    out_dir = tmp_path / "artifacts"
+    rc = mdeasm_cli.main(
+        [
+            "tasks",
+            "fetch-many",
+            "--task-ids",
+            "t1,nourl,t/2",
+            "--artifact-dir",
+            str(out_dir),
+            "--out",
+            "-",
+        ]
+    )
+    assert rc == 1
+    captured = capsys.readouterr()
+    summaries = json.loads(captured.out)
+    assert [s["task_id"] for s in summaries] == ["t1", "t/2"]
+    assert (out_dir / "t1.csv").read_bytes() == b"t1"
+    assert (out_dir / "t_2.csv").read_bytes() == b"t"
+    assert summaries[1]["artifact_out"] == str(out_dir / "t_2.csv")
+    assert "tasks fetch-many nourl" in captured.err
+
+
+def test_artifact_stems_never_share_a_target():
+    stems = mdeasm_cli._artifact_stems(["a b", "a_b", "A_B", "t1", "t/2", ".", ".."])
+    assert stems["t1"] == "t1"
+    assert stems["t/2"] == "t_2"
+    colliding = [stems["a b"], stems["a_b"], stems["A_B"]]
+    assert len({s.casefold() for s in colliding}) == 3
+    assert all(s.casefold().startswith("a_b-") for s in colliding)
+    assert stems["."].startswith("task-") and stems[".."].startswith("task-")
+    assert stems["."] != stems[".."]
+    assert mdeasm_cli._artifact_stems(["a b", "a_b"]) == {
+        "a b": stems["a b"],
+        "a_b": stems["a_b"],
+    }
+
+
 def test_cli_tasks_fetch_verifies_sha256(monkeypatch, capsys, tmp_path):
     artifact = tmp_path / "artifact.csv"
     expected_sha = hashlib.sha256(b"col1,col2\na,b\n").hexdigest()
@@ -408,7 +713,7 @@ def test_cli_tasks_fetch_verifies_sha256(monkeypatch, capsys, tmp_path):
 
     fake_mdeasm = types.SimpleNamespace(Workspaces=DummyWS, redact_sensitive_text=lambda s: s)
     monkeypatch.setitem(sys.modules, "mdeasm", fake_mdeasm)
-    monkeypatch.setattr(mdeasm_cli.requests, "get", fake_get)
+    monkeypatch.setattr(mdeasm_cli, "_HTTP_SESSION", types.SimpleNamespace(get=fake_get))
 
     rc = mdeasm_cli.main(
         [
@@ -429,6 +734,206 @@ def test_cli_tasks_fetch_verifies_sha256(monkeypatch, capsys, tmp_path):
     assert payload["sha256_verified"] is True
 
 
+def test_download_url_to_file_buffers_small_chunks_for_hashing(tmp_path):
+    out_path = tmp_path / "artifact.bin"
+    chunks = [bytes([i % 251]) * 4096 for i in range(600)]
+    body = b"".join(chunks)
+
+    class FakeResp:
+        status_code = 200
+        text = ""
+
+        def iter_content(self, chunk_size=65536):
+            yield from chunks
+
+        def close(self):
+            return None
+
+    class FakeSession:
+        def get(self, url, **kwargs):
+            return FakeResp()
+
+    result = mdeasm_cli._download_url_to_file(
+        url="https://files.example.test/export.bin",
+        out_path=out_path,
+        timeout=(1.0, 5.0),
+        retry=False,
+        max_retry=1,
+        backoff_max_s=0.0,
+        retry_on_statuses=None,
+        chunk_size=4096,
+        overwrite=False,
+        session=FakeSession(),
+        expected_sha256=hashlib.sha256(body).hexdigest(),
+    )
+    assert result["bytes_written"] == len(body)
+    assert result["sha256_verified"] is True
+    assert out_path.read_bytes() == body
+
+
+def test_download_url_to_file_copies_raw_stream_without_sha256(tmp_path):
+    out_path = tmp_path / "artifact.bin"
+    body = bytes(range(256)) * 9000
+
+    class FakeRaw(io.BytesIO):
+        decode_content = False
+
+    raw = FakeRaw(body)
+
+    class FakeResp:
+        status_code = 200
+        text = ""
+
+        def __init__(self):
+            self.raw = raw
+
+        def iter_content(self, chunk_size=65536):
+            raise AssertionError("iter_content should not be used without sha256")
+
+        def close(self):
+            return None
+
+    class FakeSession:
+        def get(self, url, **kwargs):
+            return FakeResp()
+
+    result = mdeasm_cli._download_url_to_file(
+        url="https://files.example.test/export.bin",
+        out_path=out_path,
+        timeout=(1.0, 5.0),
+        retry=False,
+        max_retry=1,
+        backoff_max_s=0.0,
+        retry_on_statuses=None,
+        chunk_size=4096,
+        overwrite=False,
+        session=FakeSession(),
+    )
+    assert raw.decode_content is True
+    assert result["bytes_written"] == len(body)
+    assert result["sha256_verified"] is False
+    assert out_path.read_bytes() == body
+
+
+def test_download_url_to_file_preallocates_from_content_length(tmp_path, monkeypatch):
+    out_path = tmp_path / "artifact.bin"
+    body = b"x" * 4096
+    calls = []
+
+    def fake_fallocate(fd, offset, length):
+        calls.append((offset, length))
+        os.ftruncate(fd, length)
+
+    monkeypatch.setattr(mdeasm_cli.os, "posix_fallocate", fake_fallocate, raising=False)
+    monkeypatch.setattr(mdeasm_cli, "_PREALLOCATE_MIN_BYTES", 1024)
+
+    class FakeResp:
+        status_code = 200
+        text = ""
+
+        def __init__(self, headers):
+            self.headers = headers
+            self.raw = io.BytesIO(body)
+
+        def close(self):
+            return None
+
+    class FakeSession:
+        def __init__(self, headers):
+            self.headers = headers
+
+        def get(self, url, **kwargs):
+            return FakeResp(self.headers)
+
+    def download(headers, target):
+        return mdeasm_cli._download_url_to_file(
+            url="https://files.example.test/export.bin",
+            out_path=target,
+            timeout=(1.0, 5.0),
+            retry=False,
+            max_retry=1,
+            backoff_max_s=0.0,
+            retry_on_statuses=None,
+            chunk_size=4096,
+            overwrite=False,
+            session=FakeSession(headers),
+        )
+
+    # Over-advertised length: the reserved tail must be truncated away before the rename.
+    result = download({"Content-Length": "10000"}, out_path)
+    assert calls == [(0, 10000)]
+    assert result["bytes_written"] == len(body)
+    assert out_path.read_bytes() == body
+
+    calls.clear()
+    gz_path = tmp_path / "gz.bin"
+    download({"Content-Length": "10000", "Content-Encoding": "gzip"}, gz_path)
+    assert calls == []
+    assert gz_path.read_bytes() == body
+
+
+def test_download_url_to_file_hashes_raw_stream_via_copyfileobj(tmp_path):
+    out_path = tmp_path / "artifact.bin"
+    body = bytes(range(256)) * 9000
+
+    class FakeResp:
+        status_code = 200
+        text = ""
+
+        def __init__(self):
+            self.raw = io.BytesIO(body)
+
+        def iter_content(self, chunk_size=65536):
+            raise AssertionError("iter_content should not be used when raw is readable")
+
+        def close(self):
+            return None
+
+    class FakeSession:
+        def get(self, url, **kwargs):
+            return FakeResp()
+
+    def download(expected):
+        return mdeasm_cli._download_url_to_file(
+            url="https://files.example.test/export.bin",
+            out_path=out_path,
+            timeout=(1.0, 5.0),
+            retry=False,
+            max_retry=1,
+            backoff_max_s=0.0,
+            retry_on_statuses=None,
+            chunk_size=4096,
+            overwrite=True,
+            session=FakeSession(),
+            expected_sha256=expected,
+        )
+
+    result = download(hashlib.sha256(body).hexdigest())
+    assert result["sha256_verified"] is True
+    assert result["bytes_written"] == len(body)
+    assert out_path.read_bytes() == body
+
+    out_path.unlink()
+    try:
+        download("0" * 64)
+    except RuntimeError as e:
+        assert "sha256 mismatch" in str(e)
+    else:
+        raise AssertionError("expected a sha256 mismatch")
+    assert not out_path.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_response_body_snippet_reads_bounded_prefix_from_raw():
+    raw = io.BytesIO(b"<html>" + b"x" * 100_000)
+    resp = types.SimpleNamespace(raw=raw, text="should not be used")
+    snippet = mdeasm_cli._response_body_snippet(resp)
+    assert snippet.startswith("<html>")
+    assert len(snippet) == 500
+    assert raw.tell() == 500
+    assert mdeasm_cli._response_body_snippet(types.SimpleNamespace(text="busy")) == "busy"
+
+
 def test_cli_tasks_fetch_fails_when_sha256_mismatch(monkeypatch, capsys, tmp_path):
     artifact = tmp_path / "artifact.csv"
 
@@ -458,7 +963,7 @@ def test_cli_tasks_fetch_fails_when_sha256_mismatch(monkeypatch, capsys, tmp_pat
 
     fake_mdeasm = types.SimpleNamespace(Workspaces=DummyWS, redact_sensitive_text=lambda s: s)
     monkeypatch.setitem(sys.modules, "mdeasm", fake_mdeasm)
-    monkeypatch.setattr(mdeasm_cli.requests, "get", fake_get)
+    monkeypatch.setattr(mdeasm_cli, "_HTTP_SESSION", types.SimpleNamespace(get=fake_get))
 
     rc = mdeasm_cli.main(
         [
@@ -582,7 +1087,7 @@ def test_cli_tasks_fetch_retries_on_transient_status(monkeypatch, capsys, tmp_pa
 
     fake_mdeasm = types.SimpleNamespace(Workspaces=DummyWS, redact_sensitive_text=lambda s: s)
     monkeypatch.setitem(sys.modules, "mdeasm", fake_mdeasm)
-    monkeypatch.setattr(mdeasm_cli.requests, "get", fake_get)
+    monkeypatch.setattr(mdeasm_cli, "_HTTP_SESSION", types.SimpleNamespace(get=fake_get))
 
     rc = mdeasm_cli.main(["tasks", "fetch", "abc", "--artifact-out", str(artifact), "--out", "-"])
     assert rc == 0
@@ -622,7 +1127,7 @@ def test_cli_tasks_fetch_does_not_retry_non_retryable_status(monkeypatch, capsys
 
     fake_mdeasm = types.SimpleNamespace(Workspaces=DummyWS, redact_sensitive_text=lambda s: s)
     monkeypatch.setitem(sys.modules, "mdeasm", fake_mdeasm)
-    monkeypatch.setattr(mdeasm_cli.requests, "get", fake_get)
+    monkeypatch.setattr(mdeasm_cli, "_HTTP_SESSION", types.SimpleNamespace(get=fake_get))
 
     rc = mdeasm_cli.main(["tasks", "fetch", "abc", "--artifact-out", str(artifact), "--out", "-"])
     assert rc == 1
@@ -676,7 +1181,7 @@ def test_cli_tasks_fetch_respects_retry_after_header(monkeypatch, capsys, tmp_pa
 
     fake_mdeasm = types.SimpleNamespace(Workspaces=DummyWS, redact_sensitive_text=lambda s: s)
     monkeypatch.setitem(sys.modules, "mdeasm", fake_mdeasm)
-    monkeypatch.setattr(mdeasm_cli.requests, "get", fake_get)
+    monkeypatch.setattr(mdeasm_cli, "_HTTP_SESSION", types.SimpleNamespace(get=fake_get))
 
     sleep_calls = []
 
@@ -694,6 +1199,60 @@ def test_cli_tasks_fetch_respects_retry_after_header(monkeypatch, capsys, tmp_pa
     assert payload["status_code"] == 200
 
 
+def test_shared_http_session_is_reused_with_larger_pool(monkeypatch):
+    monkeypatch.setattr(mdeasm_cli, "_HTTP_SESSION", None)
+    session = mdeasm_cli._shared_http_session()
+    assert mdeasm_cli._shared_http_session() is session
+    adapter = session.get_adapter("https://files.example.test/export.csv")
+    assert adapter._pool_maxsize == mdeasm_cli._HTTP_POOL_SIZE
+
+
+def test_download_url_to_file_uses_decorrelated_jitter(monkeypatch, tmp_path):
+    statuses = [503, 503, 503, 200]
+
+    class FakeResp:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.text = "busy"
+            self.headers = {}
+
+        def iter_content(self, chunk_size=65536):
+            yield b"ok\n"
+
+        def close(self):
+            return None
+
+    class FakeSession:
+        def get(self, url, **kwargs):
+            return FakeResp(statuses.pop(0))
+
+    sleep_calls = []
+    uniform_calls = []
+
+    def fake_uniform(low, high):
+        uniform_calls.append((low, high))
+        return high
+
+    monkeypatch.setattr(mdeasm_cli.time, "sleep", lambda s: sleep_calls.append(s))
+    monkeypatch.setattr(mdeasm_cli.random, "uniform", fake_uniform)
+
+    result = mdeasm_cli._download_url_to_file(
+        url="https://files.example.test/export.csv",
+        out_path=tmp_path / "artifact.csv",
+        timeout=(1.0, 5.0),
+        retry=True,
+        max_retry=4,
+        backoff_max_s=4.0,
+        retry_on_statuses=None,
+        chunk_size=0,
+        overwrite=False,
+        session=FakeSession(),
+    )
+    assert result["status_code"] == 200
+    assert uniform_calls == [(0.5, 1.5), (0.5, 4.5), (0.5, 12.0)]
+    assert sleep_calls == [1.5, 4.0, 4.0]
+
+
 def test_cli_assets_export_server_mode_wait_download(monkeypatch, capsys):
     class DummyWS:
         def __init__(self, *args, **kwargs):
@@ -764,3 +1323,74 @@ def test_cli_assets_export_server_mode_requires_columns(monkeypatch, capsys):
     )
     assert rc == 2
     assert "requires --columns or --columns-from" in capsys.readouterr().err
+
+
+def test_task_state_normalizes_payload_shapes():
+    assert mdeasm_cli._task_state({"state": " Completed "}) == "completed"
+    assert mdeasm_cli._task_state({"state": None}) == "none"
+    assert mdeasm_cli._task_state({}) == ""
+    assert mdeasm_cli._task_state(None) == ""
+
+
+def test_tasks_fetch_parses_retry_on_statuses_at_parse_time(capsys):
+    parser = mdeasm_cli.build_parser("tasks")
+    base = ["tasks", "fetch", "abc", "--artifact-out", "out.bin"]
+    args = parser.parse_args(base)
+    assert args.retry_on_statuses is mdeasm_cli._DEFAULT_RETRY_ON_STATUSES
+    args = parser.parse_args(base + ["--retry-on-statuses", "429, 503"])
+    assert args.retry_on_statuses == frozenset({429, 503})
+    with pytest.raises(SystemExit) as excinfo:
+        parser.parse_args(base + ["--retry-on-statuses", "700"])
+    assert excinfo.value.code == 2
+    assert "--retry-on-statuses: invalid HTTP status code: 700" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        parser.parse_args(base + ["--retry-on-statuses", "429,abc"])
+    assert "invalid HTTP status code: 'abc'" in capsys.readouterr().err
+
+
+def test_format_cli_error_collapses_whitespace_in_raw_errors():
+    err = RuntimeError("boom\n  Traceback:\t\tline 1\r\n  line 2  ")
+    assert mdeasm_cli._format_cli_error("tasks wait", err) == (
+        "tasks wait failed; error=boom Traceback: line 1 line 2"
+    )
+
+
+def test_download_task_cached_reuses_fresh_response_per_client(monkeypatch):
+    calls = []
+
+    class DummyWS:
+        def download_task(self, task_id, **kwargs):
+            calls.append(task_id)
+            return {"id": task_id, "downloadUrl": f"https://files.example.test/{len(calls)}.csv"}
+
+    now = [100.0]
+    monkeypatch.setattr(mdeasm_cli.time, "monotonic", lambda: now[0])
+    ws, other_ws = DummyWS(), DummyWS()
+
+    # Per-command clients are never asked twice, so nothing is recorded on them.
+    mdeasm_cli._remember_download_task(ws, "t1", "w", {"id": "t1"})
+    assert not hasattr(ws, mdeasm_cli._DL_TASK_CACHE_ATTR)
+
+    monkeypatch.setenv("MDEASM_CLI_REUSE_WS", "1")
+
+    # `tasks download` (or export --download-on-complete) primes the cache for a later fetch.
+    mdeasm_cli._remember_download_task(ws, "t1", "w", {"id": "t1", "downloadUrl": "primed"})
+    assert mdeasm_cli._download_task_cached(ws, "t1", "w", ttl_s=30.0)["downloadUrl"] == "primed"
+    assert calls == []
+
+    # Other clients, workspaces, and ttl_s=0 call through.
+    mdeasm_cli._download_task_cached(other_ws, "t1", "w", ttl_s=30.0)
+    mdeasm_cli._download_task_cached(ws, "t1", "other", ttl_s=30.0)
+    mdeasm_cli._download_task_cached(ws, "t1", "w", ttl_s=0.0)
+    assert calls == ["t1", "t1", "t1"]
+
+    now[0] += 31.0
+    assert mdeasm_cli._download_task_cached(ws, "t1", "w", ttl_s=30.0)["downloadUrl"].endswith(
+        "/4.csv"
+    )
+
+    # Without an explicit ttl_s the window comes from MDEASM_CLI_DL_CACHE_TTL_S (default 30s).
+    assert mdeasm_cli._download_task_cached(ws, "t1", "w")["downloadUrl"].endswith("/4.csv")
+    monkeypatch.setenv("MDEASM_CLI_DL_CACHE_TTL_S", "0")
+    assert mdeasm_cli._download_task_cached(ws, "t1", "w")["downloadUrl"].endswith("/5.csv")
+    assert list(getattr(ws, mdeasm_cli._DL_TASK_CACHE_ATTR)) == [("w", "t1")]
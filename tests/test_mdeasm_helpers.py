@@ -152,6 +152,37 @@ def test_workspace_query_helper_retries_and_refreshes_token_on_401():
     sleep_mock.assert_called_once_with(1)
 
 
+def test_workspace_query_helper_uses_full_jitter_without_retry_after():
+    ws = _new_ws()
+    ws._backoff_max_s = 3
+
+    class Resp:
+        def __init__(self, ok, status_code, text):
+            self.ok = ok
+            self.status_code = status_code
+            self.text = text
+            self.headers = {}
+
+    responses = [Resp(False, 429, "slow down"), Resp(False, 503, "busy"), Resp(True, 200, "ok")]
+
+    with mock.patch.object(mdeasm.requests, "request", side_effect=lambda **_kw: responses.pop(0)):
+        with mock.patch.object(ws, "__token_expiry__", return_value=False):
+            with mock.patch.object(mdeasm.random, "random", return_value=0.5):
+                with mock.patch.object(mdeasm.time, "sleep") as sleep_mock:
+                    r = ws.__workspace_query_helper__(
+                        "t",
+                        method="get",
+                        endpoint="assets",
+                        url="https://example.test",
+                        data_plane=True,
+                        retry=True,
+                        max_retry=3,
+                    )
+
+    assert r.ok is True
+    assert sleep_mock.call_args_list == [mock.call(0.5), mock.call(1.0)]
+
+
 def test_workspace_query_helper_redacts_failure_exception_text():
     ws = _new_ws()
 
@@ -1110,6 +1141,68 @@ def test_discovery_group_runs_retry_retries_transient_statuses():
     assert sleep_mock.call_args_list == [mock.call(1), mock.call(2)]
 
 
+def test_discovery_group_runs_retry_applies_backoff_jitter():
+    ws = _new_ws()
+    ws._backoff_jitter = 0.5
+    calls = {"count": 0}
+
+    def fake_get_runs(disco_name="", workspace_name=""):
+        calls["count"] += 1
+        if calls["count"] < 3:
+            raise mdeasm.ApiRequestError(
+                "called by: __get_discovery_group_runs__ -- last_status: 429 -- last_text: slow down"
+            )
+        return {disco_name: []}
+
+    ws.__get_discovery_group_runs__ = fake_get_runs  # type: ignore[attr-defined]
+
+    with mock.patch.object(mdeasm.random, "random", return_value=0.5):
+        with mock.patch.object(mdeasm.time, "sleep") as sleep_mock:
+            ws.__get_discovery_group_runs_with_retry__("contoso", max_attempts=3, backoff_max_s=5)
+
+    assert sleep_mock.call_args_list == [mock.call(0.75), mock.call(1.5)]
+
+
+def test_parse_backoff_jitter_clamps_and_defaults():
+    assert mdeasm._parse_backoff_jitter(None) == 0.0
+    assert mdeasm._parse_backoff_jitter("0.25") == 0.25
+    assert mdeasm._parse_backoff_jitter("2") == 1.0
+    assert mdeasm._parse_backoff_jitter("-1") == 0.0
+    assert mdeasm._parse_backoff_jitter("nan") == 0.0
+    assert mdeasm._parse_backoff_jitter("nope") == 0.0
+
+
+def test_workspaces_http_pool_maxsize_mounts_larger_adapter():
+    assert mdeasm._parse_http_pool_maxsize(None) == 0
+    assert mdeasm._parse_http_pool_maxsize("16") == 16
+    assert mdeasm._parse_http_pool_maxsize("-3") == 0
+    assert mdeasm._parse_http_pool_maxsize("nope") == 0
+
+    with (
+        mock.patch.object(mdeasm.Workspaces, "__bearer_token__", return_value="tok"),
+        mock.patch.object(mdeasm.Workspaces, "get_workspaces", return_value=None),
+    ):
+        ws = mdeasm.Workspaces(
+            tenant_id="t",
+            subscription_id="s",
+            client_id="c",
+            client_secret="x",
+            workspace_name="w",
+            http_pool_maxsize=32,
+        )
+        default_ws = mdeasm.Workspaces(
+            tenant_id="t",
+            subscription_id="s",
+            client_id="c",
+            client_secret="x",
+            workspace_name="w",
+            http_pool_maxsize=4,
+        )
+
+    assert ws._session.get_adapter("https://example.com")._pool_maxsize == 32
+    assert default_ws._session.get_adapter("https://example.com")._pool_maxsize == 10
+
+
 def test_discovery_group_runs_retry_stops_on_non_retryable_status():
     ws = _new_ws()
     calls = {"count": 0}